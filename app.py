@@ -6,20 +6,28 @@ Flask 메인 애플리케이션
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, Response
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from markupsafe import Markup
 from models import db, init_db, User, SavedLocation, WeatherData
 from weather_service import (
     update_weather_for_region,
-    get_morning_weather,
-    get_current_weather,
-    get_today_weather,
-    get_weather_summary,
+    store_crawl_result,
     get_sunrise_sunset,
-    get_weekly_weather
+    get_weekly_weather,
+    get_dashboard_weather
 )
+from crawl_engine import crawl_regions, plan_region_crawls
 from realtime_region_code import RealtimeRegionCodeFinder
-from runitem.weather_interface import WeatherInterface
+from region_code_cache import resolve_region_code, get_region_code_cache_stats
+from crawl_executor import CrawlExecutor, CrawlQueueFull
+from event_bus import weather_events, sse_stream, stream_slots, STREAM_RETRY_AFTER
+from weather_feed import WeatherChangeFeed
+from refresh_planner import refresh_planner, collect_region_demand
+from crawl_jobs import crawl_state, queue_stats
+from fragment_cache import fragment_cache, region_data_versions
+from solar import coord_key
+from runitem import get_outfit_index
 from datetime import datetime, timedelta
 import os
 
@@ -41,6 +49,12 @@ login_manager.login_message = '로그인이 필요합니다.'
 # 지역 코드 검색기 초기화
 region_finder = RealtimeRegionCodeFinder()
 
+# 백그라운드 크롤링 실행기 (워커 수/큐 길이 제한)
+crawl_executor = CrawlExecutor(app)
+
+# DB에 저장된 날씨 변경(다른 프로세스/워커 포함)을 SSE 구독자에게 전달
+weather_feed = WeatherChangeFeed(app, weather_events)
+
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -142,73 +156,59 @@ def dashboard():
     saved_locations = SavedLocation.query.filter_by(user_id=current_user.id).all()
 
     # 오늘과 내일 날짜
-    today = datetime.now().date()
+    now = datetime.now()
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+
+    # 지역별 카드 본문 (캐시에 없는 지역만 한 번의 범위 쿼리로 조회 후 렌더링)
+    weather_info = render_location_cards(saved_locations, now)
+
+    return render_template('dashboard.html', weather_info=weather_info, today=today, tomorrow=tomorrow)
+
+
+def render_location_cards(saved_locations, now):
+    """
+    대시보드 카드 목록 (지역 데이터로 정해지는 본문은 지역별 조각 캐시 사용)
+
+    Args:
+        saved_locations: SavedLocation 리스트
+        now: 기준 시각
+
+    Returns:
+        list: [{'location', 'body': 카드 본문 HTML}] (_location_card.html 구조)
+    """
+    today = now.date()
     tomorrow = today + timedelta(days=1)
 
-    # 각 지역의 날씨 정보
-    weather_info = []
+    # 버전을 먼저 읽어야 렌더링 도중 저장된 새 데이터가 옛 버전 키로 남지 않음
+    # (지문과 요약은 save_weather_to_db가 한 트랜잭션으로 커밋 → 새 버전 키에 옛 요약이 들어가지 않음)
+    versions = region_data_versions({location.region_code for location in saved_locations}, [today, tomorrow])
+    outfit_version = get_outfit_index().version
 
+    def fragment_key(location):
+        # 현재 날씨는 시각마다, 일출/박명은 좌표마다 달라짐
+        return ('dashboard', location.region_code, today, now.hour,
+                versions.get(location.region_code), coord_key(location.lat, location.lng), outfit_version)
+
+    bodies = {}
+    missing = []
     for location in saved_locations:
-        # 현재 날씨
-        current_weather = get_current_weather(location.region_code)
-        
-        # 오늘 날씨 (하루 전체)
-        today_weather = get_today_weather(location.region_code, today)
-        today_summary = get_weather_summary(today_weather)
-
-        # 내일 새벽 날씨
-        tomorrow_weather = get_morning_weather(location.region_code, tomorrow)
-        tomorrow_summary = get_weather_summary(tomorrow_weather)
-
-        # 내일 새벽 런닝 복장 추천 (runitem 모듈 사용)
-        outfit_recommendation = None
-        if tomorrow_weather:
-            # 새벽 날씨 데이터에서 평균값 계산
-            temps = [w.temperature for w in tomorrow_weather if w.temperature is not None]
-            humidities = [w.humidity for w in tomorrow_weather if w.humidity is not None]
-            wind_speeds = [w.wind_speed for w in tomorrow_weather if w.wind_speed is not None]
-
-            if temps:
-                avg_temp = sum(temps) / len(temps)
-                avg_humidity = sum(humidities) / len(humidities) if humidities else None
-                avg_wind_speed = sum(wind_speeds) / len(wind_speeds) if wind_speeds else None
-
-                # WeatherInterface로 복장 추천 받기 (요청마다 새 인스턴스 생성)
-                outfit_interface = WeatherInterface()
-                weather_data = {
-                    'temperature': avg_temp,
-                    'humidity': avg_humidity,
-                    'wind_speed': avg_wind_speed,
-                    'location': location.region_name,
-                    'datetime': tomorrow.strftime('%Y-%m-%d')
-                }
-                outfit_recommendation = outfit_interface.get_outfit_recommendation(weather_data)
-
-        # 일출/일몰 시간 계산
-        today_sun = get_sunrise_sunset(location.lat, location.lng, today)
-        tomorrow_sun = get_sunrise_sunset(location.lat, location.lng, tomorrow)
-
-        weather_info.append({
-            'location': location,
-            'current': current_weather,
-            'today': {
-                'date': today,
-                'weather_list': today_weather,
-                'summary': today_summary,
-                'sunrise': today_sun['sunrise'] if today_sun else None,
-                'sunset': today_sun['sunset'] if today_sun else None
-            },
-            'tomorrow': {
-                'date': tomorrow,
-                'weather_list': tomorrow_weather,
-                'summary': tomorrow_summary,
-                'sunrise': tomorrow_sun['sunrise'] if tomorrow_sun else None,
-                'sunset': tomorrow_sun['sunset'] if tomorrow_sun else None,
-                'outfit_recommendation': outfit_recommendation  # 복장 추천 추가
-            }
-        })
+        body = fragment_cache.get(fragment_key(location))
+        if body is None:
+            missing.append(location)
+        else:
+            bodies[location.id] = body
 
-    return render_template('dashboard.html', weather_info=weather_info, today=today, tomorrow=tomorrow)
+    if missing:
+        for info in get_dashboard_weather(missing, now):
+            body = render_template('_location_card_body.html', info=info, today=today, tomorrow=tomorrow)
+            fragment_cache.put(fragment_key(info['location']), body)
+            bodies[info['location'].id] = body
+
+    return [
+        {'location': location, 'body': Markup(bodies[location.id])}
+        for location in saved_locations
+    ]
 
 
 @app.route('/settings')
@@ -225,31 +225,75 @@ def weekly():
     """2일간 새벽날씨 예보 페이지 (내일, 모레)"""
     saved_locations = SavedLocation.query.filter_by(user_id=current_user.id).all()
 
-    # 각 지역의 2일간 날씨 정보
-    weekly_info = []
     today = datetime.now().date()
     tomorrow = today + timedelta(days=1)
     day_after_tomorrow = today + timedelta(days=2)
 
+    # 각 지역의 2일간 날씨 표 (지역별 조각 캐시 사용)
+    weekly_info = render_weekly_tables(saved_locations, tomorrow, day_after_tomorrow)
+
+    return render_template('weekly.html', weekly_info=weekly_info)
+
+
+def render_weekly_tables(saved_locations, start_date, end_date):
+    """
+    기간별 새벽 날씨 표 목록 (지역 데이터로 정해지는 표는 지역별 조각 캐시 사용)
+
+    Args:
+        saved_locations: SavedLocation 리스트
+        start_date: 시작 날짜
+        end_date: 종료 날짜 (포함)
+
+    Returns:
+        list: [{'location', 'body': 표 HTML}] (weekly.html 구조)
+    """
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    # 데이터보다 버전을 먼저 읽음 (render_location_cards와 같은 이유)
+    versions = region_data_versions({location.region_code for location in saved_locations}, dates)
+
+    def fragment_key(location):
+        return ('weekly', location.region_code, start_date, end_date,
+                versions.get(location.region_code), coord_key(location.lat, location.lng))
+
+    bodies = {}
+    missing = []
     for location in saved_locations:
-        weekly_data = get_weekly_weather(location.region_code)
+        body = fragment_cache.get(fragment_key(location))
+        if body is None:
+            missing.append(location)
+        else:
+            bodies[location.id] = body
+
+    if missing:
+        # 캐시에 없는 지역의 새벽 날씨를 한 번에 조회
+        weekly_by_region = get_weekly_weather(
+            [location.region_code for location in missing],
+            start_date,
+            end_date
+        )
 
-        # 내일과 모레만 필터링 (2일간)
-        filtered_data = {k: v for k, v in weekly_data.items() if k in [tomorrow, day_after_tomorrow]}
+        for location in missing:
+            # 같은 지역 코드를 여러 곳이 공유할 수 있으므로 복사 후 일출시간 추가
+            weekly_data = {
+                target_date: dict(data)
+                for target_date, data in weekly_by_region[location.region_code].items()
+            }
 
-        # 각 날짜별 일출시간 추가
-        for target_date, data in filtered_data.items():
-            sun_info = get_sunrise_sunset(location.lat, location.lng, target_date)
-            if sun_info:
+            # 각 날짜별 일출/박명 시간 추가
+            for target_date, data in weekly_data.items():
+                sun_info = get_sunrise_sunset(location.lat, location.lng, target_date)
                 data['sunrise'] = sun_info['sunrise']
                 data['sunset'] = sun_info['sunset']
+                data['civil_dawn'] = sun_info['civil_dawn']
 
-        weekly_info.append({
-            'location': location,
-            'weekly_data': filtered_data
-        })
+            body = render_template('_weekly_table.html', weekly_data=weekly_data)
+            fragment_cache.put(fragment_key(location), body)
+            bodies[location.id] = body
 
-    return render_template('weekly.html', weekly_info=weekly_info)
+    return [
+        {'location': location, 'body': Markup(bodies[location.id])}
+        for location in saved_locations
+    ]
 
 
 # ===== API 엔드포인트 =====
@@ -264,16 +308,13 @@ def api_search_region():
         return jsonify({'error': '검색어를 입력해주세요.'}), 400
 
     try:
-        # 엑셀에서 지역 검색
-        addresses = region_finder.search_address(keyword)
-
-        # 최대 20개까지만
-        results = addresses[:20]
+        # 엑셀에서 지역 검색 (최대 20개까지만)
+        results, total = region_finder.search(keyword, limit=20)
 
         return jsonify({
             'success': True,
             'results': results,
-            'total': len(addresses)
+            'total': total
         })
 
     except Exception as e:
@@ -310,8 +351,11 @@ def api_add_location():
 
         # 지역 코드 조회
         print(f"[지역 추가] 지역명: {region_name}, 위도: {lat}, 경도: {lng}")
-        # API 대신 Playwright로 지역명 검색하여 코드 획득
-        region_code = region_finder.get_region_code(region_name, lat, lng, delay=0.5)
+        # 캐시에 없을 때만 Playwright로 지역명 검색하여 코드 획득
+        region_code = resolve_region_code(
+            region_name,
+            lambda: region_finder.get_region_code(region_name, lat, lng, delay=0.5)
+        )
         print(f"[지역 추가] 조회된 지역 코드: {region_code}")
 
         if not region_code:
@@ -329,18 +373,26 @@ def api_add_location():
         db.session.add(location)
         db.session.commit()
 
-        # 날씨 데이터 크롤링 (비동기 처리)
+        # 날씨 데이터 크롤링 (백그라운드 작업)
         weather_url = f"https://weather.naver.com/today/{region_code}"
-        
-        # 스레드로 백그라운드 실행
-        import threading
-        thread = threading.Thread(target=update_weather_for_region, args=(region_code, weather_url))
-        thread.daemon = True  # 메인 스레드 종료 시 함께 종료
-        thread.start()
+
+        try:
+            job = crawl_executor.submit(
+                lambda job, code, url: update_weather_for_region(code, url),
+                region_code, weather_url,
+                name=f'지역 추가: {region_name}',
+                owner_id=current_user.id
+            )
+            job_id = job.id
+        except CrawlQueueFull as e:
+            # 지역은 저장됐으므로 날씨는 다음 정기 업데이트 때 채워짐
+            print(f"⚠ {e}")
+            job_id = None
 
         return jsonify({
             'success': True,
             'message': '지역이 추가되었습니다.',
+            'job_id': job_id,
             'location': {
                 'id': location.id,
                 'name': location.region_name,
@@ -353,6 +405,58 @@ def api_add_location():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/region_code_cache/stats')
+@login_required
+def api_region_code_cache_stats():
+    """지역코드 캐시 적중 통계 API"""
+    return jsonify({'success': True, 'stats': get_region_code_cache_stats()})
+
+
+@app.route('/api/fragment_cache/stats')
+@login_required
+def api_fragment_cache_stats():
+    """지역별 카드 조각 캐시 적중 통계 API"""
+    return jsonify({'success': True, 'stats': fragment_cache.stats()})
+
+
+@app.route('/api/jobs/<job_id>')
+@login_required
+def api_job_status(job_id):
+    """백그라운드 작업 상태 조회 API"""
+    job = crawl_executor.get(job_id)
+
+    if not job or job.owner_id != current_user.id:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+
+@app.route('/api/refresh_schedule')
+@login_required
+def api_refresh_schedule():
+    """수요 기반 갱신 계획 조회 API (점검용, 실제 크롤링은 하지 않음)"""
+    now = datetime.now()
+    schedule = refresh_planner.plan(collect_region_demand(), now, state=crawl_state())
+
+    for entry in schedule:
+        if entry['priority'] == float('inf'):
+            entry['priority'] = None
+        else:
+            entry['priority'] = round(entry['priority'], 3)
+        for key in ('last_crawled_at', 'next_due_at'):
+            if entry[key] is not None:
+                entry[key] = entry[key].isoformat(timespec='seconds')
+
+    return jsonify({
+        'success': True,
+        'now': now.isoformat(timespec='seconds'),
+        'budget_per_min': refresh_planner.budget_per_min,
+        'selected': sum(1 for entry in schedule if entry['selected']),
+        'queue': queue_stats(),
+        'schedule': schedule
+    })
+
+
 @app.route('/api/delete_location/<int:location_id>', methods=['DELETE'])
 @login_required
 def api_delete_location(location_id):
@@ -403,49 +507,141 @@ def api_update_weather(location_id):
         return jsonify({'error': str(e)}), 500
 
 
+def refresh_locations(job, location_ids):
+    """
+    저장된 지역 날씨 갱신 작업 (crawl_executor에서 실행)
+    지역 코드 단위로 크롤링하고, 코드 하나가 끝날 때마다 해당 지역들의 진행 상태 갱신
+
+    Args:
+        job: CrawlJob (진행 상황 기록용)
+        location_ids: 갱신할 SavedLocation ID 리스트
+
+    Returns:
+        dict: {'message', 'success_count', 'failed_count', 'duplicates_avoided'}
+    """
+    saved_locations = SavedLocation.query.filter(SavedLocation.id.in_(location_ids)).all()
+
+    # 같은 지역 코드는 한 번만 크롤링/저장하고 결과를 지역별로 공유
+    plan = plan_region_crawls(
+        (location.region_code, location.id) for location in saved_locations
+    )
+    statuses = {str(location.id): 'pending' for location in saved_locations}
+    job.update_progress(total=len(saved_locations), done=0, locations=dict(statuses))
+
+    print(f"\n[전체 업데이트] {len(saved_locations)}개 지역 업데이트 시작")
+
+    def on_complete(region_code, result, reason):
+        stored = False
+        if result is not None:
+            try:
+                stored = store_crawl_result(result)
+            except Exception as e:
+                db.session.rollback()
+                print(f"✗ {region_code} 저장 오류: {e}")
+
+        for location_id in plan['codes'][region_code]:
+            statuses[str(location_id)] = 'done' if stored else 'failed'
+
+        job.update_progress(
+            done=sum(1 for status in statuses.values() if status != 'pending'),
+            locations=dict(statuses)
+        )
+
+    crawl_regions(list(plan['codes']), on_complete=on_complete)
+
+    # 데드라인으로 끝나지 못한 지역은 실패 처리
+    for location_id, status in statuses.items():
+        if status == 'pending':
+            statuses[location_id] = 'failed'
+    job.update_progress(done=len(statuses), locations=dict(statuses))
+
+    success_count = sum(1 for status in statuses.values() if status == 'done')
+    failed_count = len(statuses) - success_count
+
+    print(f"[전체 업데이트] 완료 - 성공: {success_count}, 실패: {failed_count}\n")
+
+    return {
+        'message': f'전체 업데이트 완료 (성공: {success_count}, 실패: {failed_count})',
+        'success_count': success_count,
+        'failed_count': failed_count,
+        'duplicates_avoided': plan['duplicates_avoided']
+    }
+
+
 @app.route('/api/update_all_weather', methods=['POST'])
 @login_required
 def api_update_all_weather():
-    """전체 지역 날씨 수동 업데이트 API"""
+    """전체 지역 날씨 수동 업데이트 API (백그라운드 작업 등록 후 바로 응답)"""
     try:
         saved_locations = SavedLocation.query.filter_by(user_id=current_user.id).all()
 
         if not saved_locations:
             return jsonify({'error': '저장된 지역이 없습니다.'}), 400
 
-        success_count = 0
-        failed_count = 0
-
-        print(f"\n[전체 업데이트] {len(saved_locations)}개 지역 업데이트 시작")
-
-        for location in saved_locations:
-            try:
-                weather_url = f"https://weather.naver.com/today/{location.region_code}"
-                result = update_weather_for_region(location.region_code, weather_url)
-
-                if result:
-                    success_count += 1
-                    print(f"✓ {location.region_name} 업데이트 완료")
-                else:
-                    failed_count += 1
-                    print(f"✗ {location.region_name} 업데이트 실패")
-            except Exception as e:
-                failed_count += 1
-                print(f"✗ {location.region_name} 오류: {e}")
-
-        print(f"[전체 업데이트] 완료 - 성공: {success_count}, 실패: {failed_count}\n")
+        job = crawl_executor.submit(
+            refresh_locations,
+            [location.id for location in saved_locations],
+            name='전체 업데이트',
+            owner_id=current_user.id
+        )
 
         return jsonify({
             'success': True,
-            'message': f'전체 업데이트 완료 (성공: {success_count}, 실패: {failed_count})',
-            'success_count': success_count,
-            'failed_count': failed_count
-        })
+            'message': f'{len(saved_locations)}개 지역 업데이트를 시작했습니다.',
+            'job_id': job.id
+        }), 202
 
+    except CrawlQueueFull as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/location_card/<int:location_id>')
+@login_required
+def api_location_card(location_id):
+    """대시보드 지역 카드 HTML 조회 API (부분 갱신용)"""
+    location = SavedLocation.query.filter_by(id=location_id, user_id=current_user.id).first()
+
+    if not location:
+        return jsonify({'error': '지역을 찾을 수 없습니다.'}), 404
+
+    now = datetime.now()
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+
+    info = render_location_cards([location], now)[0]
+    html = render_template('_location_card.html', info=info, today=today, tomorrow=tomorrow)
+
+    return jsonify({'success': True, 'html': html})
+
+
+@app.route('/api/stream')
+@login_required
+def api_stream():
+    """저장된 지역의 날씨 갱신 알림 (Server-Sent Events)"""
+    region_codes = {
+        region_code for (region_code,) in
+        db.session.query(SavedLocation.region_code).filter_by(user_id=current_user.id)
+    }
+    weather_feed.start()
+
+    # 연결마다 스레드를 하나 점유하므로 자리가 없으면 바로 거절 (브라우저는 잠시 후 다시 연결)
+    if not stream_slots.acquire():
+        return jsonify({'error': '실시간 갱신 연결이 많아 잠시 후 다시 연결합니다.'}), 503, {
+            'Retry-After': str(STREAM_RETRY_AFTER)
+        }
+
+    response = Response(
+        sse_stream(weather_events, region_codes, 'weather'),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    # 스트림이 시작되기 전에 끊긴 연결도 서버가 응답을 닫을 때 자리 반환
+    response.call_on_close(stream_slots.release)
+    return response
+
+
 if __name__ == '__main__':
     # 스케줄러 초기화 (자동 날씨 업데이트)
     from scheduler import init_scheduler
@@ -0,0 +1,54 @@
+"""
+행정구역 데이터 시작 속도 벤치마크
+- 엑셀 직접 파싱 vs 바이너리 캐시 로드
+- 각 측정은 새 프로세스에서 실행 (import 비용 포함한 콜드 스타트)
+"""
+
+import statistics
+import subprocess
+import sys
+
+sys.stdout.reconfigure(encoding='utf-8')
+
+REPEAT = 3
+
+CASES = [
+    ('엑셀 파싱 (pandas + openpyxl)',
+     'from region_dataset import load_region_dataset; load_region_dataset(use_cache=False)'),
+    ('바이너리 캐시 로드',
+     'from region_dataset import load_region_dataset; load_region_dataset()'),
+    ('RealtimeRegionCodeFinder (엑셀)',
+     'from realtime_region_code import RealtimeRegionCodeFinder; RealtimeRegionCodeFinder(use_cache=False)'),
+    ('RealtimeRegionCodeFinder (캐시)',
+     'from realtime_region_code import RealtimeRegionCodeFinder; RealtimeRegionCodeFinder()'),
+]
+
+
+def measure(code):
+    """새 프로세스에서 code 실행 시간 측정 (초)"""
+    script = (
+        'import time; _t = time.perf_counter()\n'
+        f'{code}\n'
+        'print(f"@@{time.perf_counter() - _t:.6f}")'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, encoding='utf-8', check=True
+    ).stdout
+    return float(output.rsplit('@@', 1)[1])
+
+
+def main():
+    # 캐시가 없으면 먼저 생성
+    from region_dataset import load_region_dataset
+    load_region_dataset()
+
+    print(f"\n{'항목':<36} {'중앙값':>10} {'최소':>10}")
+    print('-' * 60)
+
+    for label, code in CASES:
+        times = [measure(code) for _ in range(REPEAT)]
+        print(f"{label:<36} {statistics.median(times):>9.3f}s {min(times):>9.3f}s")
+
+
+if __name__ == '__main__':
+    main()
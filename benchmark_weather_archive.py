@@ -0,0 +1,169 @@
+"""
+시간별 날씨 아카이브 벤치마크
+- 가상의 지역 × 일수 × 24시간 데이터를 SQLite weather_data 테이블과 컬럼 아카이브에 각각 저장
+- 저장 크기와 조회 시간 비교 (지역 1곳 한 달 / 전체 지역 한 달 평균 기온)
+- 보존 정리처럼 하루치를 추가로 아카이브하는 시간 (기존 날짜 파티션은 다시 쓰지 않음)
+
+사용 예:
+    python benchmark_weather_archive.py
+    python benchmark_weather_archive.py --regions 500 --days 90
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import glob
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from flask import Flask
+from sqlalchemy import func, insert
+
+from models import db, WeatherData
+from weather_archive import archive_weather_rows, read_archive, archive_size, month_key, MISSING_INT
+
+REPEAT = 5
+STATUSES = ['맑음', '구름많음', '흐림', '비', '눈', '소나기']
+DIRECTIONS = ['북풍', '북동풍', '동풍', '남동풍', '남풍', '남서풍', '서풍', '북서풍']
+
+
+def make_rows(regions, days, start):
+    """가상의 시간별 날씨 행 생성"""
+    rng = random.Random(42)
+    rows = []
+    for r in range(regions):
+        code = f'{1100000 + r:08d}'
+        base = rng.randint(-5, 20)
+        for d in range(days):
+            for hour in range(24):
+                rows.append({
+                    'region_code': code,
+                    'date': start + timedelta(days=d),
+                    'hour': hour,
+                    'temperature': base + rng.randint(-4, 4),
+                    'weather_status': rng.choice(STATUSES),
+                    'precipitation_prob': rng.choice([0, 10, 20, 30, 60, 80]),
+                    'precipitation_amount': rng.choice(['-', '~1mm', '1~4mm']),
+                    'humidity': rng.randint(30, 95),
+                    'wind_direction': rng.choice(DIRECTIONS),
+                    'wind_speed': round(rng.uniform(0, 8), 1),
+                })
+    return rows
+
+
+def timed(fn):
+    """fn 실행 시간 중앙값 (초)"""
+    times = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite weather_data vs 컬럼 아카이브 비교')
+    parser.add_argument('--regions', type=int, default=200, help='지역 수')
+    parser.add_argument('--days', type=int, default=60, help='일수')
+    args = parser.parse_args()
+
+    start = date(2025, 1, 1)
+    rows = make_rows(args.regions, args.days, start)
+    workdir = tempfile.mkdtemp(prefix='weather_archive_bench_')
+    db_path = os.path.join(workdir, 'weather.db')
+    archive_dir = os.path.join(workdir, 'archive')
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+
+    print(f"데이터: {args.regions}개 지역 × {args.days}일 × 24시간 = {len(rows):,}행")
+
+    with app.app_context():
+        WeatherData.__table__.create(db.engine)
+        started = time.perf_counter()
+        for i in range(0, len(rows), 5000):
+            db.session.execute(insert(WeatherData), rows[i:i + 5000])
+        db.session.commit()
+        sql_write = time.perf_counter() - started
+
+        started = time.perf_counter()
+        archive_weather_rows(rows, archive_dir)
+        archive_write = time.perf_counter() - started
+
+        db.session.execute(db.text('VACUUM'))
+        sql_size = os.path.getsize(db_path)
+        npy_size = archive_size(archive_dir)
+
+        code = rows[len(rows) // 2]['region_code']
+        month_start = start + timedelta(days=min(31, args.days - 1))
+        month_start = month_start.replace(day=1)
+        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+        def sql_region_month():
+            return db.session.execute(
+                db.select(WeatherData.date, WeatherData.hour, WeatherData.temperature,
+                          WeatherData.humidity, WeatherData.wind_speed, WeatherData.weather_status)
+                .where(WeatherData.region_code == code,
+                       WeatherData.date >= month_start, WeatherData.date <= month_end)
+                .order_by(WeatherData.date, WeatherData.hour)
+            ).all()
+
+        def npy_region_month():
+            return read_archive(code, month_start, month_end,
+                                columns=['temperature', 'humidity', 'wind_speed', 'weather_status'],
+                                archive_dir=archive_dir)
+
+        def sql_month_mean():
+            return db.session.execute(
+                db.select(func.avg(WeatherData.temperature))
+                .where(WeatherData.date >= month_start, WeatherData.date <= month_end)
+            ).scalar()
+
+        # 월 파티션(2025-01)과 아직 합치지 않은 날짜 파티션(2025-02-01 ...)
+        month_pattern = os.path.join(archive_dir, month_key(month_start) + '*', 'temperature.npy')
+
+        def npy_month_mean():
+            temps = np.concatenate([np.load(path, mmap_mode='r') for path in glob.glob(month_pattern)])
+            return temps[temps != MISSING_INT].mean(dtype=np.float64)
+
+        next_day = [dict(row, date=start + timedelta(days=args.days))
+                    for row in rows if row['date'] == start]
+
+        def npy_append_day():
+            archive_weather_rows(next_day, archive_dir)
+
+        assert len(sql_region_month()) == len(npy_region_month()['hour'])
+        assert abs(sql_month_mean() - npy_month_mean()) < 1e-6
+
+        print(f"\n{'항목':<28} {'SQLite':>12} {'아카이브':>12} {'비율':>8}")
+        print('-' * 64)
+        print(f"{'저장 크기':<28} {sql_size / 1024:>10.0f}KB {npy_size / 1024:>10.0f}KB {sql_size / npy_size:>7.1f}x")
+        print(f"{'쓰기':<28} {sql_write:>11.3f}s {archive_write:>11.3f}s {sql_write / archive_write:>7.1f}x")
+
+        for label, sql_fn, npy_fn in [
+            (f'지역 1곳 한 달 ({month_key(month_start)})', sql_region_month, npy_region_month),
+            ('전체 지역 한 달 평균 기온', sql_month_mean, npy_month_mean),
+        ]:
+            sql_time = timed(sql_fn)
+            npy_time = timed(npy_fn)
+            print(f"{label:<28} {sql_time * 1000:>10.2f}ms {npy_time * 1000:>10.2f}ms {sql_time / npy_time:>7.1f}x")
+
+        print(f"{'하루치 추가 아카이브':<28} {'':>12} {timed(npy_append_day) * 1000:>10.2f}ms")
+
+        db.session.remove()
+        db.engine.dispose()
+
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
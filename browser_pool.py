@@ -0,0 +1,268 @@
+"""
+공유 Chromium 브라우저 풀
+- 프로세스당 한 번만 브라우저를 띄우고 작업마다 격리된 BrowserContext 제공
+- N 페이지 처리 후 또는 메모리 상한 초과 시 브라우저 재시작
+- 크래시(연결 끊김)된 브라우저 자동 재시작
+- Playwright 시작에 실패한 슬롯은 중단 처리하고, 남은 슬롯이 없으면 대기 중인 작업을 바로 실패시킴
+  (JOB_TIMEOUT까지 기다리지 않도록, 다음 get_browser_pool() 호출 때 풀을 새로 만듦)
+
+Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+슬롯마다 전용 스레드가 브라우저를 소유하고, 호출자는 run()으로 작업을 넘긴다.
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+try:
+    import psutil
+except ImportError:  # 메모리 상한 검사는 psutil이 있을 때만 동작
+    psutil = None
+
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 풀 설정 (환경변수로 조정 가능)
+POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', '1'))
+MAX_PAGES_PER_BROWSER = int(os.environ.get('BROWSER_MAX_PAGES', '50'))
+MAX_BROWSER_MEMORY_MB = int(os.environ.get('BROWSER_MAX_MEMORY_MB', '500'))
+JOB_TIMEOUT = float(os.environ.get('BROWSER_JOB_TIMEOUT', '90'))
+
+
+class _BrowserSlot:
+    """전용 스레드에서 브라우저 하나를 소유하는 풀 슬롯"""
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+        self.playwright = None
+        self.browser = None
+        self.pids = set()
+        self.pages_served = 0
+        self.launch_count = 0
+        self.error = None  # Playwright 시작 실패 사유 (중단된 슬롯)
+        self.thread = threading.Thread(
+            target=self._run_loop, name=f'browser-pool-{index}', daemon=True
+        )
+
+    def _run_loop(self):
+        try:
+            from playwright.sync_api import sync_playwright
+
+            self.playwright = sync_playwright().start()
+        except Exception as e:
+            self.error = e
+            print(f"✗ [브라우저 풀 {self.index}] Playwright 시작 실패 - 슬롯 중단: {e}")
+            self.pool._slot_failed(self)
+            return
+
+        try:
+            while True:
+                job = self.pool._jobs.get()
+                if job is None:
+                    break
+
+                fn, context_options, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    self._ensure_browser()
+                    context = self.browser.new_context(**context_options)
+                    try:
+                        result = fn(context)
+                    finally:
+                        try:
+                            context.close()
+                        except Exception:
+                            pass
+                    self.pages_served += 1
+                    future.set_result(result)
+                except BaseException as e:
+                    future.set_exception(e)
+                    if self.browser is not None and not self.browser.is_connected():
+                        print(f"✗ [브라우저 풀 {self.index}] 브라우저 크래시 감지 - 재시작 예정")
+                        self._close_browser()
+        finally:
+            self._close_browser()
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+
+    def _ensure_browser(self):
+        """브라우저 상태 확인 후 필요하면 (재)시작"""
+        if self.browser is not None:
+            reason = None
+            if not self.browser.is_connected():
+                reason = '연결 끊김'
+            elif self.pages_served >= MAX_PAGES_PER_BROWSER:
+                reason = f'{self.pages_served}페이지 처리'
+            else:
+                memory_mb = self._memory_mb()
+                if memory_mb is not None and memory_mb > MAX_BROWSER_MEMORY_MB:
+                    reason = f'메모리 {memory_mb:.0f}MB'
+
+            if reason is None:
+                return
+
+            print(f"[브라우저 풀 {self.index}] 브라우저 재시작 ({reason})")
+            self._close_browser()
+
+        self._launch_browser()
+
+    def _launch_browser(self):
+        # 동시에 여러 슬롯이 띄우면 자식 프로세스 구분이 안 되므로 직렬화
+        with self.pool._launch_lock:
+            before = self.pool._child_pids()
+            self.browser = self.playwright.chromium.launch(headless=True)
+            self.pids = self.pool._child_pids() - before
+
+        self.pages_served = 0
+        self.launch_count += 1
+        print(f"✓ [브라우저 풀 {self.index}] Chromium 시작 (누적 {self.launch_count}회)")
+
+    def _close_browser(self):
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+        self.browser = None
+        self.pids = set()
+
+    def _memory_mb(self):
+        """이 슬롯 브라우저 프로세스들의 RSS 합계 (MB), 측정 불가 시 None"""
+        if psutil is None or not self.pids:
+            return None
+
+        total = 0
+        for pid in list(self.pids):
+            try:
+                total += psutil.Process(pid).memory_info().rss
+            except psutil.Error:
+                self.pids.discard(pid)
+        return total / (1024 * 1024)
+
+    def stats(self):
+        return {
+            'index': self.index,
+            'alive': self.error is None,
+            'running': self.browser is not None,
+            'pages_served': self.pages_served,
+            'launch_count': self.launch_count,
+            'memory_mb': self._memory_mb()
+        }
+
+
+class BrowserPool:
+    """브라우저 슬롯 풀 - 작업마다 격리된 BrowserContext를 빌려줌"""
+
+    def __init__(self, size=POOL_SIZE):
+        self.size = max(1, size)
+        self._jobs = queue.Queue()
+        self._launch_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._slots = [_BrowserSlot(self, i) for i in range(self.size)]
+        self._live_slots = self.size
+        self._closed = False
+        self.error = None  # 모든 슬롯이 시작에 실패했을 때의 사유
+
+        for slot in self._slots:
+            slot.thread.start()
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+    def _slot_failed(self, slot):
+        """슬롯 시작 실패 처리 (마지막 슬롯이면 대기 중인 작업을 모두 실패시킴)"""
+        with self._state_lock:
+            self._live_slots -= 1
+            if self._live_slots > 0:
+                return
+            self.error = slot.error
+
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    continue
+                _, _, future = job
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RuntimeError(f'브라우저를 시작할 수 없습니다: {self.error}'))
+
+    @staticmethod
+    def _child_pids():
+        if psutil is None:
+            return set()
+        try:
+            return {c.pid for c in psutil.Process().children(recursive=True)}
+        except psutil.Error:
+            return set()
+
+    def submit(self, fn, **context_options):
+        """
+        fn(context)를 풀 스레드에서 실행하도록 예약
+
+        Args:
+            fn: BrowserContext를 받아 결과를 반환하는 함수
+            context_options: browser.new_context()에 전달할 옵션
+
+        Returns:
+            Future: fn의 반환값
+        """
+        if self._closed:
+            raise RuntimeError('브라우저 풀이 종료되었습니다.')
+
+        context_options.setdefault('user_agent', DEFAULT_USER_AGENT)
+        future = Future()
+        # 슬롯 실패 처리와 겹치면 큐에 남는 작업이 생기므로 같은 락 안에서 확인 후 등록
+        with self._state_lock:
+            if self.error is not None:
+                raise RuntimeError(f'브라우저를 시작할 수 없습니다: {self.error}')
+            self._jobs.put((fn, context_options, future))
+        return future
+
+    def run(self, fn, timeout=JOB_TIMEOUT, **context_options):
+        """fn(context)를 실행하고 결과를 기다려 반환"""
+        return self.submit(fn, **context_options).result(timeout=timeout)
+
+    def stats(self):
+        return [slot.stats() for slot in self._slots]
+
+    def shutdown(self):
+        """모든 브라우저 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._slots:
+            self._jobs.put(None)
+        for slot in self._slots:
+            slot.thread.join(timeout=10)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """프로세스 공용 브라우저 풀 반환 (최초 호출 시, 또는 모든 슬롯이 시작에 실패했으면 새로 생성)"""
+    global _pool
+
+    if _pool is None or _pool.failed:
+        with _pool_lock:
+            if _pool is None or _pool.failed:
+                if _pool is not None:
+                    print(f"[브라우저 풀] 시작 실패한 풀을 새로 만듭니다 ({_pool.error})")
+                    _pool.shutdown()
+                _pool = BrowserPool()
+                atexit.register(_pool.shutdown)
+    return _pool
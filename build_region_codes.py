@@ -0,0 +1,274 @@
+"""
+지역코드 일괄 생성 도구
+- 행정구역 엑셀의 모든 지역(또는 일부)을 좌표 조회 API로 변환
+  (weather.naver.com/api/naverRgnCatForCoords?lat=&lng=)
+- 커넥션 풀 + 초당 요청 수 제한 + 동시 요청 수 제한
+- 체크포인트 파일로 중단 후 이어서 실행
+- 결과는 앱과 함께 배포하는 region_codes.csv (지역명 → 지역코드)
+
+사용 예:
+    python build_region_codes.py
+    python build_region_codes.py --filter 대전 --concurrency 4 --rate 2
+    python build_region_codes.py --base-url http://127.0.0.1:8000   # 로컬 대체 서버로 테스트
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from browser_pool import DEFAULT_USER_AGENT
+from region_dataset import default_excel_path, iter_regions, load_region_dataset
+
+
+DEFAULT_BASE_URL = 'https://weather.naver.com'
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'region_codes.csv')
+OUTPUT_FIELDS = ['region_name', 'region_code', 'lat', 'lng']
+
+MAX_ATTEMPTS = 3
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (요청 간 최소 간격 보장, 스레드 안전)"""
+
+    def __init__(self, rate_per_second):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def create_session(pool_size):
+    """커넥션 풀을 공유하는 HTTP 세션"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Referer': 'https://weather.naver.com/'
+    })
+    return session
+
+
+def fetch_region_code(session, base_url, lat, lng, limiter=None, timeout=5):
+    """
+    좌표로 네이버 지역코드 조회
+
+    Returns:
+        str: 지역코드 또는 None (응답에 코드 없음)
+
+    Raises:
+        requests.RequestException: 재시도 후에도 요청 실패
+    """
+    url = f"{base_url.rstrip('/')}/api/naverRgnCatForCoords"
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            response = session.get(url, params={'lat': lat, 'lng': lng}, timeout=timeout)
+            # 요청 과다/서버 오류는 잠시 후 재시도
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+            response.raise_for_status()
+            return response.json().get('regionCode')
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code < 500 and e.response.status_code != 429:
+                raise
+            if attempt == MAX_ATTEMPTS:
+                raise
+        except requests.RequestException:
+            if attempt == MAX_ATTEMPTS:
+                raise
+        time.sleep(0.5 * 2 ** (attempt - 1))
+
+    return None
+
+
+def collect_regions(excel_path=None, name_filter=None, limit=None):
+    """
+    조회 대상 지역 목록 (같은 지역명은 첫 행의 좌표 사용)
+
+    Returns:
+        list: [(지역명, 위도, 경도), ...]
+    """
+    dataset = load_region_dataset(excel_path)
+
+    regions = {}
+    for _, sido, sigungu, eupmyeondong, lat, lng in iter_regions(dataset):
+        name = ' '.join(p for p in [sido, sigungu, eupmyeondong] if p)
+        if not name or name in regions:
+            continue
+        if name_filter and name_filter not in name:
+            continue
+        regions[name] = (round(lat, 6), round(lng, 6))
+
+    items = [(name, lat, lng) for name, (lat, lng) in regions.items()]
+    return items[:limit] if limit else items
+
+
+def read_checkpoint(checkpoint_path):
+    """체크포인트에서 완료된 지역 읽기 → {지역명: 레코드}"""
+    done = {}
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 중단 시 마지막 줄이 잘렸을 수 있음
+                    continue
+                done[record['region_name']] = record
+    return done
+
+
+def terminate_checkpoint(checkpoint_path):
+    """중단 시 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈으로 끝맺음"""
+    if not os.path.exists(checkpoint_path) or os.path.getsize(checkpoint_path) == 0:
+        return
+    with open(checkpoint_path, 'rb+') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            f.write(b'\n')
+
+
+def read_region_table(path):
+    """region_codes.csv 읽기 → {지역명: 레코드}"""
+    table = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8', newline='') as f:
+            for record in csv.DictReader(f):
+                table[record['region_name']] = record
+    return table
+
+
+def write_region_table(path, records):
+    """region_codes.csv 저장 (지역명 순, 임시 파일 후 교체)"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        for name in sorted(records):
+            writer.writerow({field: records[name][field] for field in OUTPUT_FIELDS})
+    os.replace(tmp_path, path)
+
+
+def build_region_codes(regions, output_path=DEFAULT_OUTPUT, checkpoint_path=None,
+                       base_url=DEFAULT_BASE_URL, concurrency=8, rate=5.0, timeout=5):
+    """
+    지역 목록을 좌표 조회 API로 변환해 region_codes.csv 생성
+
+    Args:
+        regions: [(지역명, 위도, 경도), ...]
+        output_path: 결과 CSV 경로 (기존 내용은 유지하고 병합)
+        checkpoint_path: 체크포인트 경로 (None이면 output_path + '.checkpoint.jsonl')
+        base_url: 조회 API 서버 (로컬 대체 서버로 바꿔 테스트 가능)
+        concurrency: 동시 요청 수
+        rate: 초당 최대 요청 수 (0이면 제한 없음)
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        dict: {'total': 대상 수, 'skipped': 체크포인트로 건너뜀, 'resolved': 성공, 'failed': 실패}
+    """
+    if checkpoint_path is None:
+        checkpoint_path = f'{output_path}.checkpoint.jsonl'
+
+    done = read_checkpoint(checkpoint_path)
+    terminate_checkpoint(checkpoint_path)
+    pending = [region for region in regions if region[0] not in done]
+
+    print(f"대상 {len(regions)}개, 체크포인트 완료 {len(regions) - len(pending)}개, 남은 {len(pending)}개")
+
+    session = create_session(concurrency)
+    limiter = RateLimiter(rate)
+    write_lock = threading.Lock()
+    stats = {'total': len(regions), 'skipped': len(regions) - len(pending), 'resolved': 0, 'failed': 0}
+
+    def resolve(region):
+        name, lat, lng = region
+        return name, lat, lng, fetch_region_code(session, base_url, lat, lng, limiter, timeout)
+
+    with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint, \
+            ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [executor.submit(resolve, region) for region in pending]
+
+        for idx, future in enumerate(as_completed(futures), 1):
+            try:
+                name, lat, lng, code = future.result()
+            except Exception as e:
+                stats['failed'] += 1
+                print(f"✗ 조회 실패: {e}")
+                continue
+
+            if not code:
+                stats['failed'] += 1
+                print(f"✗ {name}: 지역코드 없음")
+                continue
+
+            record = {'region_name': name, 'region_code': code, 'lat': lat, 'lng': lng}
+            with write_lock:
+                checkpoint.write(json.dumps(record, ensure_ascii=False) + '\n')
+                checkpoint.flush()
+            done[name] = record
+            stats['resolved'] += 1
+
+            if idx % 100 == 0:
+                print(f"[{idx}/{len(pending)}] 진행 중 (성공 {stats['resolved']}, 실패 {stats['failed']})")
+
+    # 기존 CSV + 체크포인트 병합 후 저장
+    table = read_region_table(output_path)
+    table.update(done)
+    write_region_table(output_path, table)
+
+    print(f"✓ {output_path}: {len(table)}개 지역 (이번 실행 성공 {stats['resolved']}, 실패 {stats['failed']})")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='행정구역 엑셀 → 네이버 지역코드 테이블 생성')
+    parser.add_argument('--excel', default=default_excel_path(), help='행정구역 엑셀 경로')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 CSV 경로')
+    parser.add_argument('--checkpoint', default=None, help='체크포인트 경로 (기본: 결과 경로 + .checkpoint.jsonl)')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='좌표 조회 API 서버')
+    parser.add_argument('--filter', default=None, help='지역명에 이 문자열이 포함된 지역만 조회')
+    parser.add_argument('--limit', type=int, default=None, help='최대 조회 지역 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--rate', type=float, default=5.0, help='초당 최대 요청 수 (0: 제한 없음)')
+    parser.add_argument('--timeout', type=float, default=5.0, help='요청 타임아웃 (초)')
+    args = parser.parse_args()
+
+    regions = collect_regions(args.excel, args.filter, args.limit)
+    stats = build_region_codes(
+        regions,
+        output_path=args.output,
+        checkpoint_path=args.checkpoint,
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        timeout=args.timeout
+    )
+    sys.exit(0 if stats['failed'] == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+region_day_summary 일관성 검사
+- weather_data의 모든 지역/날짜/시간대를 get_weather_summary로 다시 계산해 저장된 요약과 비교
+- 요약 누락 / 값 불일치 / 시간별 데이터가 없는 요약(고아)을 보고
+- --fix: 문제가 있는 요약을 다시 계산해 저장 (배포 후 기존 데이터 요약 채우기에도 사용)
+
+사용 예:
+    python check_region_day_summary.py
+    python check_region_day_summary.py --fix
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+from itertools import groupby
+
+from models import WeatherData, RegionDaySummary
+from weather_service import SUMMARY_WINDOWS, get_weather_summary, rebuild_region_day_summaries
+
+
+def check_region_day_summaries():
+    """
+    저장된 요약과 시간별 데이터로 계산한 요약 비교 (앱 컨텍스트 필요)
+
+    Returns:
+        dict: {'checked', 'missing': [key], 'mismatched': [(key, 저장값, 계산값)], 'orphaned': [key]}
+    """
+    result = {'checked': 0, 'missing': [], 'mismatched': [], 'orphaned': []}
+
+    stored = {
+        (entry.region_code, entry.date, entry.window): entry.to_summary()
+        for entry in RegionDaySummary.query
+    }
+
+    expected_keys = set()
+    all_rows = WeatherData.query.order_by(
+        WeatherData.region_code, WeatherData.date, WeatherData.hour
+    ).yield_per(1000)
+
+    for (region_code, date), day_rows in groupby(all_rows, key=lambda w: (w.region_code, w.date)):
+        rows = list(day_rows)
+
+        for window, hours in SUMMARY_WINDOWS.items():
+            expected = get_weather_summary([w for w in rows if w.hour in hours])
+            if expected is None:
+                continue
+
+            key = (region_code, date, window)
+            expected_keys.add(key)
+            result['checked'] += 1
+
+            if key not in stored:
+                result['missing'].append(key)
+            elif stored[key] != expected:
+                result['mismatched'].append((key, stored[key], expected))
+
+    result['orphaned'] = sorted(set(stored) - expected_keys)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='region_day_summary 일관성 검사')
+    parser.add_argument('--fix', action='store_true', help='문제가 있는 요약을 다시 계산해 저장')
+    parser.add_argument('--show', type=int, default=10, help='출력할 불일치 예시 수')
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        result = check_region_day_summaries()
+
+        print(f"검사: {result['checked']}개 요약")
+        print(f"  누락 {len(result['missing'])}개, 불일치 {len(result['mismatched'])}개, "
+              f"고아 {len(result['orphaned'])}개")
+
+        for key, stored, expected in result['mismatched'][:args.show]:
+            print(f"  ✗ {key[0]} {key[1]} {key[2]}")
+            print(f"      저장: {stored}")
+            print(f"      계산: {expected}")
+
+        broken = result['missing'] + [key for key, _, _ in result['mismatched']] + result['orphaned']
+        if not broken:
+            print("✓ 모든 요약이 시간별 데이터와 일치합니다.")
+            return
+
+        if not args.fix:
+            print("⚠ --fix 옵션으로 다시 계산할 수 있습니다.")
+            sys.exit(1)
+
+        rebuilt = rebuild_region_day_summaries(broken)
+        print(f"✓ {len(broken)}개 요약 다시 계산 ({rebuilt}개 저장, 나머지 삭제)")
+
+
+if __name__ == '__main__':
+    main()
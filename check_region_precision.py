@@ -1,7 +1,8 @@
-import pandas as pd
 import requests
 import sys
 
+from realtime_region_code import RealtimeRegionCodeFinder
+
 sys.stdout.reconfigure(encoding='utf-8')
 
 def check_coordinates_and_api():
@@ -12,12 +13,8 @@ def check_coordinates_and_api():
     
     print(f"Loading Excel: {excel_path}")
     try:
-        xl_file = pd.ExcelFile(excel_path)
-        all_dfs = []
-        for sheet_name in xl_file.sheet_names:
-            df_sheet = pd.read_excel(xl_file, sheet_name=sheet_name)
-            all_dfs.append(df_sheet)
-        df = pd.concat(all_dfs, ignore_index=True)
+        # 바이너리 캐시가 있으면 엑셀 파싱 없이 로드
+        df = RealtimeRegionCodeFinder(excel_path).df.fillna('')
     except Exception as e:
         print(f"Failed to load Excel: {e}")
         return
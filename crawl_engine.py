@@ -0,0 +1,237 @@
+"""
+비동기 동시 크롤링 엔진
+- playwright.async_api 기반으로 여러 지역을 동시에 크롤링
+- 세마포어로 동시 페이지 수 제한
+- 지역별 타임아웃 + 전체 실행 데드라인
+- HTTP 파싱을 먼저 시도하고, 실패한 지역만 브라우저로 크롤링
+- 여러 지역명이 같은 지역 코드를 공유하면 코드당 한 번만 크롤링 (plan_region_crawls)
+- 다른 곳에서 진행 중이거나 최근 끝난 크롤링은 single_flight로 공유
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import asyncio
+import os
+import time
+
+from browser_pool import DEFAULT_USER_AGENT
+from weather_service import CURRENT_WEATHER_JS, HOURLY_WEATHER_JS, parse_hourly_entries
+from weather_http import fetch_weather_http
+from single_flight import crawl_flight
+
+
+CRAWL_CONCURRENCY = int(os.environ.get('CRAWL_CONCURRENCY', '4'))
+REGION_TIMEOUT = float(os.environ.get('CRAWL_REGION_TIMEOUT', '45'))
+RUN_DEADLINE = float(os.environ.get('CRAWL_RUN_DEADLINE', '480'))
+
+
+def weather_url_for(region_code):
+    """지역 코드의 네이버 날씨 URL"""
+    return f"https://weather.naver.com/today/{region_code}"
+
+
+def plan_region_crawls(locations):
+    """
+    지역 코드 단위 크롤링 계획
+    (예: 자곡동/논현동처럼 다른 지역명이 같은 코드 07200580을 쓰면 한 번만 크롤링)
+
+    Args:
+        locations: [(region_code, 지역명), ...]
+
+    Returns:
+        dict: {
+            'codes': {region_code: [지역명, ...]} (처음 등장한 순서),
+            'locations': 지역 수,
+            'duplicates_avoided': 생략된 중복 크롤링 수
+        }
+    """
+    codes = {}
+    count = 0
+    for region_code, region_name in locations:
+        codes.setdefault(region_code, []).append(region_name)
+        count += 1
+
+    return {
+        'codes': codes,
+        'locations': count,
+        'duplicates_avoided': count - len(codes)
+    }
+
+
+async def _scrape_region(browser, region_code):
+    """새 컨텍스트에서 한 지역 페이지를 크롤링"""
+    context = await browser.new_context(user_agent=DEFAULT_USER_AGENT)
+    try:
+        page = await context.new_page()
+        await page.goto(weather_url_for(region_code), wait_until='networkidle', timeout=30000)
+        await page.wait_for_selector('div#hourly .weather_table_wrap table', timeout=20000)
+
+        current_weather = await page.evaluate(CURRENT_WEATHER_JS)
+        hourly_data = await page.evaluate(HOURLY_WEATHER_JS)
+    finally:
+        await context.close()
+
+    return {
+        'hourly': parse_hourly_entries(hourly_data, region_code),
+        'current': current_weather
+    }
+
+
+async def _crawl_regions_async(region_codes, concurrency, region_timeout, run_deadline, on_complete=None):
+    from playwright.async_api import async_playwright
+
+    results = {}
+    failures = {}
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    deadline_at = time.monotonic() + run_deadline
+
+    # 브라우저는 HTTP 파싱이 실패한 지역이 생길 때만 띄움
+    browser_state = {'playwright': None, 'browser': None}
+    browser_lock = asyncio.Lock()
+
+    async def get_browser():
+        async with browser_lock:
+            if browser_state['browser'] is None:
+                browser_state['playwright'] = await async_playwright().start()
+                browser_state['browser'] = await browser_state['playwright'].chromium.launch(headless=True)
+        return browser_state['browser']
+
+    async def fetch_region(region_code):
+        result = await asyncio.to_thread(fetch_weather_http, region_code)
+        if result:
+            return result, 'http'
+        return await _scrape_region(await get_browser(), region_code), 'browser'
+
+    async def crawl_one(region_code):
+        # 최근 크롤링 결과가 있으면 재사용
+        cached = crawl_flight.fresh(region_code)
+        if cached is not None:
+            results[region_code] = cached
+            print(f"✓ {region_code}: 시간별 {len(cached['hourly'])}개 (최근 결과 재사용)")
+            return
+
+        call, leader = crawl_flight.acquire(region_code)
+
+        if not leader:
+            # 웹 요청 등 다른 곳에서 크롤링 중이면 그 결과를 기다림 (세마포어 미사용)
+            remaining = deadline_at - time.monotonic()
+            try:
+                result = await asyncio.to_thread(call.wait, max(0, min(region_timeout, remaining)))
+            except Exception as e:
+                failures[region_code] = f'진행 중인 크롤링 실패: {e}'
+                return
+
+            if result and result['hourly']:
+                results[region_code] = result
+                print(f"✓ {region_code}: 시간별 {len(result['hourly'])}개 (진행 중인 크롤링 합류)")
+            else:
+                failures[region_code] = '시간별 데이터 없음'
+            return
+
+        result = None
+        error = None
+        try:
+            async with semaphore:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    failures[region_code] = '전체 실행 데드라인 초과'
+                    error = TimeoutError(failures[region_code])
+                    return
+
+                started = time.monotonic()
+                try:
+                    result, source = await asyncio.wait_for(
+                        fetch_region(region_code),
+                        timeout=min(region_timeout, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    failures[region_code] = f'타임아웃 ({time.monotonic() - started:.1f}s)'
+                    error = TimeoutError(failures[region_code])
+                    return
+                except Exception as e:
+                    failures[region_code] = str(e)
+                    error = e
+                    return
+
+                if result['hourly']:
+                    results[region_code] = result
+                    print(f"✓ {region_code}: 시간별 {len(result['hourly'])}개 ({source}, {time.monotonic() - started:.1f}s)")
+                else:
+                    failures[region_code] = '시간별 데이터 없음'
+        except BaseException:
+            # 데드라인으로 취소된 경우에도 대기 중인 호출이 풀려나도록
+            error = error or RuntimeError('크롤링 취소됨')
+            raise
+        finally:
+            crawl_flight.complete(region_code, call, result=result, error=error)
+
+    async def crawl_and_report(region_code):
+        try:
+            await crawl_one(region_code)
+        finally:
+            if on_complete is not None and (region_code in results or region_code in failures):
+                try:
+                    on_complete(region_code, results.get(region_code), failures.get(region_code))
+                except Exception as e:
+                    print(f"✗ {region_code}: 완료 콜백 오류: {e}")
+
+    try:
+        tasks = [asyncio.ensure_future(crawl_and_report(code)) for code in region_codes]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=max(0, deadline_at - time.monotonic()))
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        if browser_state['browser'] is not None:
+            await browser_state['browser'].close()
+        if browser_state['playwright'] is not None:
+            await browser_state['playwright'].stop()
+
+    # 데드라인으로 취소된 지역
+    for code in region_codes:
+        if code not in results and code not in failures:
+            failures[code] = '전체 실행 데드라인 초과'
+
+    return results, failures
+
+
+def crawl_regions(region_codes, concurrency=CRAWL_CONCURRENCY,
+                  region_timeout=REGION_TIMEOUT, run_deadline=RUN_DEADLINE, on_complete=None):
+    """
+    여러 지역을 동시에 크롤링
+
+    Args:
+        region_codes: 지역 코드 리스트 (중복은 한 번만 크롤링)
+        concurrency: 동시에 여는 최대 페이지 수
+        region_timeout: 지역별 타임아웃 (초)
+        run_deadline: 전체 실행 데드라인 (초)
+        on_complete: 지역 하나가 끝날 때마다 호출할 함수 on_complete(region_code, result, 실패 사유)
+                     (성공이면 실패 사유 None, 실패면 result None, 데드라인으로 취소된 지역은 호출 안 됨)
+
+    Returns:
+        dict: {
+            'results': {region_code: {'hourly': [...], 'current': {...}}},
+            'failures': {region_code: 실패 사유},
+            'elapsed': 소요 시간 (초)
+        }
+    """
+    codes = list(dict.fromkeys(region_codes))
+    started = time.monotonic()
+
+    print(f"[크롤링 엔진] {len(codes)}개 지역, 동시 {concurrency}개")
+
+    try:
+        results, failures = asyncio.run(
+            _crawl_regions_async(codes, concurrency, region_timeout, run_deadline, on_complete)
+        )
+    except Exception as e:
+        print(f"✗ [크롤링 엔진] 실행 실패: {e}")
+        results, failures = {}, {code: str(e) for code in codes}
+
+    elapsed = time.monotonic() - started
+    print(f"[크롤링 엔진] 완료 - 성공 {len(results)}개, 실패 {len(failures)}개 ({elapsed:.1f}s)")
+
+    return {'results': results, 'failures': failures, 'elapsed': elapsed}
@@ -0,0 +1,190 @@
+"""
+백그라운드 크롤링 실행기
+- 고정 개수의 워커 스레드 + 최대 길이가 정해진 작업 큐
+- 작업마다 Flask 앱 컨텍스트 안에서 실행 (DB 세션 사용 가능)
+- 큐가 가득 차면 즉시 거절 (브라우저 프로세스가 무한히 늘어나지 않도록)
+- 작업 ID로 진행 상태 조회 (/api/jobs/<id>)
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import os
+import queue
+import threading
+import time
+import traceback
+import uuid
+from datetime import datetime
+
+
+CRAWL_WORKERS = int(os.environ.get('CRAWL_WORKERS', '2'))
+CRAWL_QUEUE_MAX = int(os.environ.get('CRAWL_QUEUE_MAX', '20'))
+# 끝난 작업 상태를 보관하는 시간 (초)
+JOB_RETENTION = float(os.environ.get('CRAWL_JOB_RETENTION', '600'))
+
+
+class CrawlQueueFull(Exception):
+    """작업 큐가 가득 차서 거절됨"""
+
+
+class CrawlJob:
+    """작업 1건의 상태"""
+
+    def __init__(self, fn, args, name, owner_id):
+        self.id = uuid.uuid4().hex
+        self.fn = fn
+        self.args = args
+        self.name = name
+        self.owner_id = owner_id
+        self.status = 'queued'
+        self.progress = {}
+        self.result = None
+        self.error = None
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self._finished_monotonic = None
+        self._lock = threading.Lock()
+
+    def update_progress(self, **values):
+        """진행 상황 갱신 (작업 함수에서 호출)"""
+        with self._lock:
+            self.progress.update(values)
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed')
+
+    def to_dict(self):
+        with self._lock:
+            progress = dict(self.progress)
+
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'progress': progress,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class CrawlExecutor:
+    """앱 컨텍스트를 갖는 제한된 크기의 작업 실행기"""
+
+    def __init__(self, app, workers=CRAWL_WORKERS, max_queue=CRAWL_QUEUE_MAX):
+        """
+        Args:
+            app: Flask 애플리케이션 (작업마다 앱 컨텍스트 생성)
+            workers: 워커 스레드 수 (동시에 실행되는 크롤링 작업 수)
+            max_queue: 대기 가능한 최대 작업 수
+        """
+        self.app = app
+        self.workers = max(1, workers)
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._threads = []
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        """첫 작업이 들어올 때 워커 스레드 시작"""
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f'crawl-worker-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            self._started = True
+
+    def _prune(self):
+        """보관 시간이 지난 완료 작업 정리"""
+        now = time.monotonic()
+        with self._jobs_lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job._finished_monotonic is not None and now - job._finished_monotonic > JOB_RETENTION
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def submit(self, fn, *args, name=None, owner_id=None):
+        """
+        작업 등록
+
+        Args:
+            fn: fn(job, *args) 형태로 호출할 함수 (반환값이 작업 결과)
+            name: 작업 이름 (표시용)
+            owner_id: 작업을 조회할 수 있는 사용자 ID
+
+        Returns:
+            CrawlJob
+
+        Raises:
+            CrawlQueueFull: 큐가 가득 참
+        """
+        self._ensure_started()
+        self._prune()
+
+        job = CrawlJob(fn, args, name or getattr(fn, '__name__', 'job'), owner_id)
+
+        with self._jobs_lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._jobs_lock:
+                del self._jobs[job.id]
+            raise CrawlQueueFull(f'크롤링 작업이 밀려 있습니다 (대기 {self._queue.qsize()}건). 잠시 후 다시 시도해주세요.')
+
+        return job
+
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        """큐/작업 상태 요약"""
+        with self._jobs_lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {
+            'workers': self.workers,
+            'queue_depth': self._queue.qsize(),
+            'queue_max': self._queue.maxsize,
+            'running': statuses.count('running'),
+            'queued': statuses.count('queued')
+        }
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            try:
+                self._run(job)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job):
+        job.status = 'running'
+        job.started_at = datetime.now()
+
+        try:
+            with self.app.app_context():
+                job.result = job.fn(job, *job.args)
+            job.status = 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+            print(f"✗ 크롤링 작업 실패 ({job.name}): {e}")
+            traceback.print_exc()
+        finally:
+            job.finished_at = datetime.now()
+            job._finished_monotonic = time.monotonic()
@@ -0,0 +1,221 @@
+"""
+DB 기반 크롤링 작업 큐 (crawl_jobs 테이블)
+- 리더 스케줄러가 갱신할 지역 코드를 등록(enqueue)
+- 여러 워커 프로세스/서버가 작업을 묶음 단위로 원자적으로 가져감(claim)
+  PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED / SQLite: 단일 UPDATE ... RETURNING
+- 결과(성공 시각, 변동성, 실패 재시도 시각)는 같은 행에 기록해 갱신 계획에 사용
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from models import db, RegionCrawlJob
+from refresh_planner import update_volatility
+
+
+# 가져간 작업을 끝내야 하는 시간 (초, 지나면 다른 워커가 다시 가져감)
+CRAWL_JOB_LEASE = float(os.environ.get('CRAWL_JOB_LEASE', '600'))
+# 실패 시 재시도 대기 (초, 연속 실패마다 2배, 최대 30분)
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 1800
+
+
+def enqueue_crawls(region_codes, due_at=None):
+    """
+    크롤링 작업 등록 (이미 대기 중이면 더 이른 due_at으로만 당김)
+    워커가 가져가 크롤링 중인 작업은 requeue_at에 기록해 두고, 성공 기록 시 다음 due_at으로 남김
+    (진행 중인 크롤링은 요청 전에 시작했을 수 있으므로 요청을 흡수하지 않음)
+
+    Args:
+        region_codes: 지역 코드 목록
+        due_at: 실행 가능 시각 (None이면 지금)
+
+    Returns:
+        int: 새로 대기열에 들어간 지역 수
+    """
+    codes = list(dict.fromkeys(region_codes))
+    if not codes:
+        return 0
+
+    now = datetime.utcnow()
+    due_at = due_at or now
+    existing = {
+        job.region_code: job
+        for job in RegionCrawlJob.query.filter(RegionCrawlJob.region_code.in_(codes))
+    }
+
+    queued = 0
+    for code in codes:
+        job = existing.get(code)
+        if job is None:
+            db.session.add(RegionCrawlJob(region_code=code, due_at=due_at, attempts=0, volatility=0.0))
+            queued += 1
+        elif job.lease_owner is not None and job.lease_expiry is not None and job.lease_expiry > now:
+            if job.requeue_at is None:
+                job.requeue_at = due_at
+                queued += 1
+            elif job.requeue_at > due_at:
+                job.requeue_at = due_at
+        elif job.due_at is None:
+            job.due_at = due_at
+            queued += 1
+        elif job.due_at > due_at:
+            job.due_at = due_at
+
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # 다른 프로세스가 같은 지역을 먼저 등록함 (그쪽 작업으로 충분)
+        db.session.rollback()
+
+    return queued
+
+
+def claim_crawls(owner, limit, lease_seconds=CRAWL_JOB_LEASE):
+    """
+    실행할 작업을 최대 limit개 가져감 (다른 워커와 겹치지 않음)
+    가져가는 시점 이전의 재요청(requeue_at)은 이번 크롤링으로 처리되므로 지움
+
+    Args:
+        owner: 워커 식별자
+        limit: 최대 작업 수
+        lease_seconds: 작업 임대 시간 (초)
+
+    Returns:
+        list: 가져간 지역 코드
+    """
+    now = datetime.utcnow()
+    lease_expiry = now + timedelta(seconds=lease_seconds)
+
+    candidates = select(RegionCrawlJob.id).where(
+        RegionCrawlJob.due_at <= now,
+        db.or_(RegionCrawlJob.lease_expiry.is_(None), RegionCrawlJob.lease_expiry < now)
+    ).order_by(RegionCrawlJob.due_at).limit(limit)
+
+    dialect = db.session.get_bind().dialect
+
+    if dialect.name == 'postgresql':
+        # 다른 워커가 잠근 행은 기다리지 않고 건너뜀
+        candidates = candidates.with_for_update(skip_locked=True)
+
+    if dialect.update_returning:
+        # SQLite는 UPDATE 한 문장이 쓰기 락을 잡으므로 후보 선택과 임대가 원자적
+        stmt = update(RegionCrawlJob).where(
+            RegionCrawlJob.id.in_(candidates.scalar_subquery())
+        ).values(
+            lease_owner=owner, lease_expiry=lease_expiry, requeue_at=None
+        ).returning(RegionCrawlJob.region_code)
+
+        codes = [code for (code,) in db.session.execute(stmt)]
+        db.session.commit()
+        return codes
+
+    # RETURNING 미지원 DB: 후보마다 조건부 UPDATE로 선점
+    codes = []
+    for job_id in db.session.execute(candidates).scalars().all():
+        updated = RegionCrawlJob.query.filter(
+            RegionCrawlJob.id == job_id,
+            db.or_(RegionCrawlJob.lease_expiry.is_(None), RegionCrawlJob.lease_expiry < now)
+        ).update({
+            RegionCrawlJob.lease_owner: owner,
+            RegionCrawlJob.lease_expiry: lease_expiry,
+            RegionCrawlJob.requeue_at: None
+        }, synchronize_session=False)
+        if updated:
+            codes.append(db.session.get(RegionCrawlJob, job_id).region_code)
+    db.session.commit()
+    return codes
+
+
+def record_crawl_outcomes(results, failures, when=None, owner=None):
+    """
+    크롤링 결과 기록
+
+    Args:
+        results: {region_code: (바뀐 시간 수, 크롤링된 시간 수)} 성공한 지역
+        failures: {region_code: 실패 사유}
+        when: 크롤링 시각 (UTC, None이면 지금)
+        owner: claim_crawls로 가져간 워커 (None이면 큐를 거치지 않은 직접 크롤링)
+               임대가 이미 다른 워커로 넘어간 작업은 기록하지 않음
+
+    성공하면 임대 중에 들어온 재요청(requeue_at)을 다음 due_at으로 남김
+    (실패하면 재시도가 재요청을 대신함, 재시도 대기는 그대로)
+    """
+    when = when or datetime.utcnow()
+    codes = list(results) + [code for code in failures if code not in results]
+    if not codes:
+        return
+
+    jobs = {
+        job.region_code: job
+        for job in RegionCrawlJob.query.filter(RegionCrawlJob.region_code.in_(codes))
+    }
+
+    for code in codes:
+        job = jobs.get(code)
+        if job is None:
+            if owner is not None:
+                continue
+            job = RegionCrawlJob(region_code=code, attempts=0, volatility=0.0)
+            db.session.add(job)
+        elif owner is not None and job.lease_owner != owner:
+            continue
+
+        requeue_at = job.requeue_at
+        job.lease_owner = None
+        job.lease_expiry = None
+        job.requeue_at = None
+
+        if code in results:
+            changed_hours, total_hours = results[code]
+            job.due_at = requeue_at
+            job.attempts = 0
+            job.last_crawled_at = when
+            job.volatility = update_volatility(job.volatility or 0.0, changed_hours, total_hours)
+            job.last_error = None
+        else:
+            job.attempts = (job.attempts or 0) + 1
+            delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+            job.due_at = when + timedelta(seconds=delay)
+            job.last_error = str(failures[code])[:255]
+
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+
+
+def crawl_state():
+    """
+    갱신 계획용 지역별 상태 (시각은 로컬 시간으로 변환)
+
+    Returns:
+        dict: {region_code: {'last_crawled_at', 'volatility', 'queued'}}
+    """
+    offset = datetime.now() - datetime.utcnow()
+    state = {}
+    for job in RegionCrawlJob.query.all():
+        state[job.region_code] = {
+            'last_crawled_at': job.last_crawled_at + offset if job.last_crawled_at else None,
+            'volatility': job.volatility or 0.0,
+            'queued': job.due_at is not None
+        }
+    return state
+
+
+def queue_stats():
+    """작업 큐 요약"""
+    now = datetime.utcnow()
+    pending = RegionCrawlJob.query.filter(RegionCrawlJob.due_at.isnot(None))
+    return {
+        'pending': pending.count(),
+        'due': pending.filter(RegionCrawlJob.due_at <= now).count(),
+        'leased': pending.filter(RegionCrawlJob.lease_expiry > now).count(),
+        'retrying': pending.filter(RegionCrawlJob.attempts > 0).count()
+    }
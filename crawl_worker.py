@@ -0,0 +1,107 @@
+"""
+크롤링 워커
+- crawl_jobs 테이블에서 작업을 묶음으로 가져와 크롤링 후 저장
+- 웹 프로세스마다 스케줄러가 주기적으로 한 번씩 실행(run_worker_tick)하고,
+  별도 프로세스/서버로도 실행 가능 (워커를 늘리면 처리량이 늘어남)
+
+사용 예:
+    python -m crawl_worker
+    python -m crawl_worker --batch 8 --interval 5
+    python -m crawl_worker --once
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import os
+import time
+from datetime import datetime
+
+from models import db
+from crawl_engine import crawl_regions, RUN_DEADLINE
+from crawl_jobs import claim_crawls, record_crawl_outcomes, CRAWL_JOB_LEASE
+from leader_lease import make_holder_id
+from weather_service import save_weather_to_db
+
+
+# 한 번에 가져갈 작업 수 / 작업이 없을 때 대기 시간 (초)
+CRAWL_WORKER_BATCH = int(os.environ.get('CRAWL_WORKER_BATCH', '4'))
+CRAWL_WORKER_INTERVAL = float(os.environ.get('CRAWL_WORKER_INTERVAL', '10'))
+
+
+def run_worker_tick(owner, batch_size=CRAWL_WORKER_BATCH):
+    """
+    작업 한 묶음 처리 (앱 컨텍스트 필요)
+
+    Args:
+        owner: 워커 식별자
+        batch_size: 최대 작업 수
+
+    Returns:
+        int: 처리한 지역 수
+    """
+    codes = claim_crawls(owner, batch_size)
+    if not codes:
+        return 0
+
+    print(f"[워커 {owner}] {len(codes)}개 지역 크롤링: {', '.join(codes)}")
+
+    # 임대가 끝나기 전에 마치도록 실행 데드라인 제한
+    run = crawl_regions(codes, run_deadline=min(RUN_DEADLINE, CRAWL_JOB_LEASE * 0.8))
+    crawled_at = datetime.utcnow()
+
+    try:
+        counts = save_weather_to_db([
+            row for result in run['results'].values() for row in result['hourly']
+        ])
+        results = {
+            code: (
+                sum(len(hours) for hours in counts['changed'].get(code, {}).values()),
+                len(result['hourly'])
+            )
+            for code, result in run['results'].items()
+        }
+        failures = run['failures']
+    except Exception as e:
+        db.session.rollback()
+        print(f"✗ [워커 {owner}] DB 저장 실패: {e}")
+        results = {}
+        failures = {code: f'DB 저장 실패: {e}' for code in codes}
+
+    record_crawl_outcomes(results, failures, crawled_at, owner=owner)
+    return len(codes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='crawl_jobs 테이블 기반 크롤링 워커')
+    parser.add_argument('--batch', type=int, default=CRAWL_WORKER_BATCH, help='한 번에 가져갈 작업 수')
+    parser.add_argument('--interval', type=float, default=CRAWL_WORKER_INTERVAL, help='작업이 없을 때 대기 시간 (초)')
+    parser.add_argument('--once', action='store_true', help='한 묶음만 처리하고 종료')
+    args = parser.parse_args()
+
+    from app import app
+
+    owner = make_holder_id()
+    print(f"✓ 크롤링 워커 시작: {owner} (묶음 {args.batch}개)")
+
+    try:
+        while True:
+            with app.app_context():
+                try:
+                    processed = run_worker_tick(owner, args.batch)
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"✗ [워커 {owner}] 오류: {e}")
+                    processed = 0
+
+            if args.once:
+                break
+            if processed == 0:
+                time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print('\n워커가 종료되었습니다.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+프로세스 내 이벤트 발행/구독
+- 지역 코드 단위로 구독 (사용자는 자신이 저장한 지역의 이벤트만 받음)
+- 구독자마다 크기가 정해진 큐를 두고, 가득 차면 오래된 이벤트부터 버림
+  (느린 클라이언트가 발행 쪽을 막지 않도록)
+- /api/stream (Server-Sent Events)에서 사용
+- SSE 연결은 서버(gunicorn gthread, waitress) 스레드를 하나씩 점유하므로 프로세스당 동시 연결 수를
+  서버 스레드 수에서 일반 요청용 몫을 뺀 만큼으로 제한 (configure_stream_slots)
+- 다른 프로세스에서 저장된 변경은 weather_feed가 DB에서 읽어 이 버스로 발행
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import json
+import os
+import queue
+import threading
+import time
+
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# SSE 연결 유지 시간 (초, 지나면 끊고 브라우저가 자동 재연결 → 구독 지역 목록 갱신)
+STREAM_MAX_DURATION = float(os.environ.get('STREAM_MAX_DURATION', '300'))
+# 프록시가 유휴 연결을 끊지 않도록 보내는 keepalive 간격 (초)
+STREAM_KEEPALIVE = float(os.environ.get('STREAM_KEEPALIVE', '20'))
+# 프로세스당 최대 SSE 연결 수 (설정하면 서버 스레드 수로 정한 상한보다 작을 때만 적용)
+STREAM_MAX_CONNECTIONS = int(os.environ.get('STREAM_MAX_CONNECTIONS', '0')) or None
+# 서버 스레드 수를 알 수 없을 때(개발 서버 등)의 상한
+DEFAULT_STREAM_CONNECTIONS = 80
+# SSE가 쓰지 않고 일반 요청용으로 남길 서버 스레드 (비율, 최소 개수)
+STREAM_RESERVED_THREAD_RATIO = 0.2
+STREAM_RESERVED_THREADS_MIN = 2
+# 연결 수가 가득 찼을 때 브라우저가 다시 시도하기까지 기다릴 시간 (초)
+STREAM_RETRY_AFTER = 60
+
+
+class Subscription:
+    """구독 1건 (SSE 연결 하나)"""
+
+    def __init__(self, bus, keys):
+        self.bus = bus
+        self.keys = frozenset(keys)
+        self.queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def put(self, event):
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout=None):
+        """다음 이벤트 (timeout 안에 없으면 None)"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """키(지역 코드)별 구독자에게 이벤트 전달"""
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, keys):
+        """
+        구독 등록
+
+        Args:
+            keys: 받을 지역 코드 목록
+
+        Returns:
+            Subscription (사용 후 close() 호출)
+        """
+        subscription = Subscription(self, keys)
+        with self._lock:
+            for key in subscription.keys:
+                self._subscribers.setdefault(key, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for key in subscription.keys:
+                subscribers = self._subscribers.get(key)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[key]
+
+    def publish(self, key, event):
+        """
+        이벤트 발행
+
+        Returns:
+            int: 전달된 구독자 수
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(key, ()))
+        for subscription in subscribers:
+            subscription.put(event)
+        return len(subscribers)
+
+    def keys(self):
+        """구독자가 있는 키 목록"""
+        with self._lock:
+            return list(self._subscribers)
+
+    def stats(self):
+        with self._lock:
+            connections = set()
+            for subscribers in self._subscribers.values():
+                connections.update(subscribers)
+            return {'connections': len(connections), 'keys': len(self._subscribers)}
+
+
+class ConnectionLimit:
+    """동시 연결 수 제한 (가득 차면 기다리지 않고 바로 거절)"""
+
+    def __init__(self, limit=STREAM_MAX_CONNECTIONS or DEFAULT_STREAM_CONNECTIONS):
+        self.limit = limit
+        self._active = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        연결 자리 확보
+
+        Returns:
+            bool: 확보했으면 True (사용 후 release() 호출), 가득 찼으면 False
+        """
+        with self._lock:
+            if self._active >= self.limit:
+                self._rejected += 1
+                return False
+            self._active += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._active = max(0, self._active - 1)
+
+    def stats(self):
+        with self._lock:
+            return {'active': self._active, 'limit': self.limit, 'rejected': self._rejected}
+
+
+def stream_limit_for_threads(threads):
+    """서버 스레드 수 → SSE 연결 상한 (일반 요청용 스레드를 남김, STREAM_MAX_CONNECTIONS가 더 작으면 그 값)"""
+    reserved = max(STREAM_RESERVED_THREADS_MIN, int(threads * STREAM_RESERVED_THREAD_RATIO))
+    limit = max(0, threads - reserved)
+    if STREAM_MAX_CONNECTIONS is not None:
+        limit = min(limit, STREAM_MAX_CONNECTIONS)
+    return limit
+
+
+def configure_stream_slots(threads):
+    """
+    서버의 실제 스레드 수에 맞춰 이 프로세스의 SSE 연결 상한 설정
+    (gunicorn.conf.py의 post_worker_init, run_waitress.py에서 호출)
+    """
+    stream_slots.limit = stream_limit_for_threads(threads)
+    print(f"✓ 실시간 갱신(SSE) 연결 상한 {stream_slots.limit}개 (서버 스레드 {threads}개)")
+    return stream_slots.limit
+
+
+def sse_stream(bus, keys, event_name, max_duration=STREAM_MAX_DURATION, keepalive=STREAM_KEEPALIVE):
+    """
+    키 목록을 구독해 Server-Sent Events 스트림으로 전달 (연결이 끊기면 구독 해제)
+
+    Yields:
+        str: SSE 메시지
+    """
+    # 스트림이 실제로 시작될 때 구독 (시작 전에 끊긴 연결이 구독을 남기지 않도록)
+    subscription = bus.subscribe(keys)
+    deadline = time.monotonic() + max_duration
+    try:
+        yield 'retry: 5000\n\n'
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            event = subscription.get(timeout=min(keepalive, remaining))
+            if event is None:
+                yield ': keepalive\n\n'
+                continue
+            yield f"event: {event_name}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    finally:
+        subscription.close()
+
+
+# 날씨 갱신 이벤트 (키: 지역 코드)
+weather_events = EventBus()
+# 이 프로세스의 SSE 연결 자리
+stream_slots = ConnectionLimit()
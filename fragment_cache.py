@@ -0,0 +1,137 @@
+"""
+지역별 렌더링 조각(HTML) 캐시
+- 대시보드 카드/주간 표에서 지역 데이터만으로 정해지는 부분을 한 번 렌더링해 여러 사용자가 공유
+  (지역명/별칭 등 사용자별 부분은 요청마다 렌더링)
+- 키: (조각 종류, 지역 코드, 날짜, 데이터 버전, ...) — 데이터 버전은 날짜별 예보 지문(weather_day_fingerprint)
+  → 다른 프로세스의 워커가 저장해도 지문이 바뀌므로 옛 조각을 쓰지 않음
+- 같은 프로세스에서 저장되면 해당 지역 조각을 바로 삭제 (invalidate_region)
+- 전체 크기(바이트) 기준 LRU
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import os
+import threading
+from collections import OrderedDict
+
+from models import db, WeatherDayFingerprint
+
+
+# 조각 캐시 최대 크기 (바이트)
+FRAGMENT_CACHE_MAX_BYTES = int(os.environ.get('FRAGMENT_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))
+# 키/항목 관리에 드는 대략적인 추가 바이트 (항목 수가 많을 때 실제 메모리와 차이를 줄임)
+ENTRY_OVERHEAD_BYTES = 200
+
+
+class FragmentCache:
+    """바이트 크기 기준 LRU HTML 조각 캐시 (키의 두 번째 값이 지역 코드)"""
+
+    def __init__(self, max_bytes=FRAGMENT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key → (html, 크기)
+        self._by_region = {}  # region_code → key set
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get(self, key):
+        """조각 조회 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, key, html):
+        """조각 저장 (최대 크기를 넘으면 오래 안 쓴 조각부터 삭제)"""
+        size = len(html.encode('utf-8')) + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (html, size)
+            self._by_region.setdefault(key[1], set()).add(key)
+            self._bytes += size
+            self._stats['stores'] += 1
+
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def _remove(self, key):
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+        keys = self._by_region.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_region[key[1]]
+
+    def invalidate_region(self, region_code):
+        """지역의 모든 조각 삭제 (새 날씨 저장 시)"""
+        with self._lock:
+            keys = list(self._by_region.get(region_code, ()))
+            for key in keys:
+                self._remove(key)
+            self._stats['invalidations'] += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_region.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """적중률/크기 통계"""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                regions=len(self._by_region),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_ratio=round(self._stats['hits'] / lookups, 4) if lookups else 0.0
+            )
+
+
+def region_data_versions(region_codes, dates):
+    """
+    지역별 데이터 버전 (날짜별 예보 지문 묶음, 한 번의 쿼리)
+
+    Args:
+        region_codes: 지역 코드 목록
+        dates: 조각에 쓰이는 날짜 목록
+
+    Returns:
+        dict: {region_code: (날짜별 지문, ...)} (지문이 없는 날짜는 None)
+    """
+    region_codes = set(region_codes)
+    dates = list(dates)
+    if not region_codes or not dates:
+        return {}
+
+    stored = {}
+    for region_code, date, fingerprint in db.session.query(
+        WeatherDayFingerprint.region_code, WeatherDayFingerprint.date, WeatherDayFingerprint.fingerprint
+    ).filter(
+        WeatherDayFingerprint.region_code.in_(region_codes),
+        WeatherDayFingerprint.date.in_(dates)
+    ):
+        stored[(region_code, date)] = fingerprint
+
+    return {
+        region_code: tuple(stored.get((region_code, date)) for date in dates)
+        for region_code in region_codes
+    }
+
+
+# 앱 전역 조각 캐시
+fragment_cache = FragmentCache()
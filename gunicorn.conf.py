@@ -0,0 +1,16 @@
+"""
+gunicorn 설정 (gunicorn app:app 실행 시 자동으로 읽음)
+- 실시간 갱신(SSE) 연결이 스레드를 하나씩 점유하므로 스레드 워커 사용
+- 워커가 뜰 때 실제 스레드 수로 SSE 연결 상한을 정함 (나머지 스레드는 일반 요청용)
+"""
+
+import os
+
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', '100'))
+
+
+def post_worker_init(worker):
+    from event_bus import configure_stream_slots
+
+    configure_stream_slots(worker.cfg.threads)
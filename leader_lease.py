@@ -0,0 +1,144 @@
+"""
+DB 임대(lease) 기반 리더 선출
+- scheduler_lease 테이블의 행 하나를 여러 프로세스가 두고 경쟁
+- 임대를 가진 프로세스만 크롤링 일정을 실행하고, 주기적으로(heartbeat) 만료 시각을 연장
+- 리더가 죽으면 임대 만료 후 다른 프로세스가 인수
+- 만료 판단은 각 서버 시계(UTC) 기준이므로 서버 간 시계 동기화(NTP) 필요
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from models import db, SchedulerLease
+
+
+# 임대 유지 시간 (초), heartbeat는 이 시간의 1/3마다
+LEASE_TTL = float(os.environ.get('SCHEDULER_LEASE_TTL', '60'))
+
+
+def make_holder_id():
+    """프로세스 식별자 (호스트:PID:임의값)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """이름이 같은 임대를 두고 경쟁하는 프로세스 하나"""
+
+    def __init__(self, name='crawl_scheduler', ttl=LEASE_TTL, holder_id=None):
+        self.name = name
+        self.ttl = ttl
+        self.holder_id = holder_id or make_holder_id()
+        self._valid_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def heartbeat_interval(self):
+        return max(1.0, self.ttl / 3)
+
+    @property
+    def is_leader(self):
+        """
+        현재 리더인지 (마지막 갱신 성공 후 ttl 안인 경우만)
+        DB에 연결할 수 없어 갱신하지 못하면 스스로 리더 자격을 내려놓음
+        """
+        with self._lock:
+            return time.monotonic() < self._valid_until
+
+    def _try_acquire(self):
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl)
+
+        # 내 임대를 연장하거나, 만료된 임대를 가져옴 (조건부 UPDATE 한 번으로 원자적 처리)
+        updated = SchedulerLease.query.filter(
+            SchedulerLease.name == self.name,
+            db.or_(SchedulerLease.holder_id == self.holder_id, SchedulerLease.expires_at < now)
+        ).update({
+            SchedulerLease.holder_id: self.holder_id,
+            SchedulerLease.expires_at: expires_at,
+            SchedulerLease.renewed_at: now
+        }, synchronize_session=False)
+
+        if updated:
+            db.session.commit()
+            return True
+
+        db.session.rollback()
+        if db.session.get(SchedulerLease, self.name) is not None:
+            # 다른 프로세스가 유효한 임대를 가짐
+            return False
+
+        # 임대 행이 아직 없으면 생성 (동시에 만들면 하나만 성공)
+        try:
+            db.session.add(SchedulerLease(
+                name=self.name, holder_id=self.holder_id,
+                expires_at=expires_at, acquired_at=now, renewed_at=now
+            ))
+            db.session.commit()
+            return True
+        except IntegrityError:
+            db.session.rollback()
+            return False
+
+    def heartbeat(self):
+        """
+        임대 획득/연장 시도 (앱 컨텍스트 필요)
+
+        Returns:
+            bool: 리더 여부
+        """
+        started = time.monotonic()
+        was_leader = self.is_leader
+
+        try:
+            acquired = self._try_acquire()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            print(f"✗ 스케줄러 임대 갱신 실패: {e}")
+            acquired = False
+
+        with self._lock:
+            if acquired:
+                # DB에 기록한 만료 시각보다 조금 일찍 스스로 만료 처리
+                self._valid_until = started + self.ttl * 0.9
+            elif not was_leader:
+                self._valid_until = 0.0
+
+        is_leader = self.is_leader
+        if is_leader and not was_leader:
+            print(f"✓ 스케줄러 리더 획득: {self.holder_id}")
+        elif was_leader and not acquired:
+            print(f"⚠ 스케줄러 리더 임대 연장 실패: {self.holder_id}")
+
+        return is_leader
+
+    def release(self):
+        """종료 시 임대 반납 (다른 프로세스가 만료를 기다리지 않고 바로 인수)"""
+        with self._lock:
+            self._valid_until = 0.0
+        try:
+            SchedulerLease.query.filter_by(name=self.name, holder_id=self.holder_id).update({
+                SchedulerLease.expires_at: datetime.utcnow()
+            }, synchronize_session=False)
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+
+    def status(self):
+        """현재 임대 상태"""
+        lease = db.session.get(SchedulerLease, self.name)
+        return {
+            'name': self.name,
+            'holder_id': self.holder_id,
+            'is_leader': self.is_leader,
+            'current_holder': lease.holder_id if lease else None,
+            'expires_at': lease.expires_at.isoformat() if lease else None
+        }
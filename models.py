@@ -3,12 +3,19 @@
 - User: 사용자 정보
 - SavedLocation: 사용자가 저장한 지역
 - WeatherData: 크롤링된 날씨 데이터
+- WeatherDayFingerprint: 지역/날짜별 예보 내용 지문
+- WeatherDailyRollup: 보존 기간이 지난 시간별 날씨의 일별 요약
+- RegionDaySummary: 지역/날짜/시간대별 날씨 요약 (저장 시 갱신, 화면에서 바로 사용)
+- RegionCodeCache: 지역명 → 지역코드 캐시
+- RegionCrawlJob: 지역별 크롤링 작업 큐 (crawl_jobs)
+- SchedulerLease: 스케줄러 리더 임대
 """
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+import json
 
 db = SQLAlchemy()
 
@@ -86,6 +93,151 @@ class WeatherData(db.Model):
         return f'<WeatherData {self.region_code} {self.date} {self.hour}:00>'
 
 
+class WeatherDayFingerprint(db.Model):
+    """지역/날짜별 시간별 예보 내용 지문 (크롤링 결과가 그대로면 저장 생략)"""
+    __tablename__ = 'weather_day_fingerprint'
+
+    id = db.Column(db.Integer, primary_key=True)
+    region_code = db.Column(db.String(20), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    fingerprint = db.Column(db.String(40), nullable=False)  # 시간별 값의 SHA-1
+    hour_count = db.Column(db.Integer, nullable=False)  # 지문에 포함된 시간 수
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('region_code', 'date', name='_fingerprint_region_date_uc'),
+    )
+
+    def __repr__(self):
+        return f'<WeatherDayFingerprint {self.region_code} {self.date}>'
+
+
+class RegionDaySummary(db.Model):
+    """지역/날짜/시간대별 날씨 요약 (날씨 저장 시 바뀐 날짜만 다시 계산)"""
+    __tablename__ = 'region_day_summary'
+
+    id = db.Column(db.Integer, primary_key=True)
+    region_code = db.Column(db.String(20), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    window = db.Column(db.String(10), nullable=False)  # 시간대 (dawn: 04~07시, day: 06~23시)
+    hour_count = db.Column(db.Integer, nullable=False)  # 요약에 포함된 시간 수
+
+    min_temp = db.Column(db.Integer)
+    max_temp = db.Column(db.Integer)
+    max_precip = db.Column(db.Integer)
+    modal_status = db.Column(db.String(50))  # 가장 많이 나타난 날씨 상태
+    outfit = db.Column(db.String(200))
+    warnings = db.Column(db.Text)  # 경고 메시지 JSON 배열
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('region_code', 'date', 'window', name='_summary_region_date_window_uc'),
+    )
+
+    def to_summary(self):
+        """get_weather_summary와 같은 형태의 dict"""
+        return {
+            'min_temp': self.min_temp,
+            'max_temp': self.max_temp,
+            'max_precip': self.max_precip,
+            'avg_weather': self.modal_status,
+            'outfit': self.outfit,
+            'warnings': json.loads(self.warnings) if self.warnings else []
+        }
+
+    def __repr__(self):
+        return f'<RegionDaySummary {self.region_code} {self.date} {self.window}>'
+
+
+class WeatherDailyRollup(db.Model):
+    """보존 기간이 지난 시간별 날씨를 지역/날짜별로 요약한 기록 (retention.py가 생성)"""
+    __tablename__ = 'weather_daily_rollup'
+
+    id = db.Column(db.Integer, primary_key=True)
+    region_code = db.Column(db.String(20), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    hour_count = db.Column(db.Integer, nullable=False)  # 요약에 포함된 시간 수
+
+    # 하루 전체
+    temp_min = db.Column(db.Integer)
+    temp_max = db.Column(db.Integer)
+    temp_mean = db.Column(db.Float)
+    precip_prob_max = db.Column(db.Integer)
+    dominant_status = db.Column(db.String(50))  # 가장 많이 나타난 날씨 상태
+
+    # 새벽 시간대 (04~07시)
+    dawn_hour_count = db.Column(db.Integer, nullable=False, default=0)
+    dawn_temp_min = db.Column(db.Integer)
+    dawn_temp_max = db.Column(db.Integer)
+    dawn_temp_mean = db.Column(db.Float)
+    dawn_precip_prob_max = db.Column(db.Integer)
+    dawn_humidity_mean = db.Column(db.Float)
+    dawn_wind_speed_max = db.Column(db.Float)
+    dawn_status = db.Column(db.String(50))
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('region_code', 'date', name='_rollup_region_date_uc'),
+    )
+
+    def __repr__(self):
+        return f'<WeatherDailyRollup {self.region_code} {self.date}>'
+
+
+class RegionCrawlJob(db.Model):
+    """지역 코드별 크롤링 작업 큐 + 최근 크롤링 상태 (여러 워커 프로세스가 나눠서 처리)"""
+    __tablename__ = 'crawl_jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    region_code = db.Column(db.String(20), unique=True, nullable=False)
+    due_at = db.Column(db.DateTime, nullable=True, index=True)  # None이면 대기 중인 작업 없음
+    lease_owner = db.Column(db.String(120), nullable=True)  # 작업을 가져간 워커
+    lease_expiry = db.Column(db.DateTime, nullable=True)  # 이 시각까지 끝내지 못하면 다른 워커가 가져감
+    requeue_at = db.Column(db.DateTime, nullable=True)  # 임대 중에 다시 요청된 실행 시각 (성공 후 due_at으로)
+    attempts = db.Column(db.Integer, default=0, nullable=False)  # 연속 실패 횟수
+    last_crawled_at = db.Column(db.DateTime, nullable=True)  # 마지막 성공 시각
+    volatility = db.Column(db.Float, default=0.0, nullable=False)  # 바뀐 시간 비율 이동평균
+    last_error = db.Column(db.String(255), nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<RegionCrawlJob {self.region_code} due={self.due_at}>'
+
+
+class SchedulerLease(db.Model):
+    """스케줄러 리더 임대 (만료 전까지 holder_id 프로세스만 크롤링 일정 실행)"""
+    __tablename__ = 'scheduler_lease'
+
+    name = db.Column(db.String(50), primary_key=True)  # 임대 이름 (예: "crawl_scheduler")
+    holder_id = db.Column(db.String(120), nullable=False)  # 호스트:PID:임의값
+    expires_at = db.Column(db.DateTime, nullable=False)  # 갱신이 없으면 이 시각 이후 다른 프로세스가 인수
+    acquired_at = db.Column(db.DateTime, default=datetime.utcnow)
+    renewed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<SchedulerLease {self.name} → {self.holder_id}>'
+
+
+class RegionCodeCache(db.Model):
+    """지역명 → 네이버 지역코드 캐시 (브라우저 조회 결과 재사용)"""
+    __tablename__ = 'region_code_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    region_name = db.Column(db.String(200), unique=True, nullable=False)  # 예: "대전광역시 유성구 송강동"
+    region_code = db.Column(db.String(20), nullable=True)  # None이면 조회 실패 (negative 캐시)
+    source = db.Column(db.String(20))  # 조회 경로 (playwright, saved_location 등)
+    hit_count = db.Column(db.Integer, default=0, nullable=False)  # 캐시 적중 횟수
+    expires_at = db.Column(db.DateTime, nullable=True)  # negative 캐시 만료 시각
+    last_hit_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<RegionCodeCache {self.region_name} → {self.region_code}>'
+
+
 class OutfitRecommendation(db.Model):
     """복장 추천 데이터베이스 (사용자 커스터마이징 가능)"""
     __tablename__ = 'outfit_recommendations'
@@ -4,51 +4,102 @@
 - API 키 없이 네이버 지역코드 조회
 """
 
-import pandas as pd
+import heapq
 import requests
 import sys
 
+from region_dataset import NAME_COLUMNS, default_excel_path, iter_regions, load_region_dataset
+
 sys.stdout.reconfigure(encoding='utf-8')
 
 
 class RealtimeRegionCodeFinder:
     """엑셀 기반 실시간 지역코드 검색기"""
 
-    def __init__(self, excel_path=None):
+    def __init__(self, excel_path=None, use_cache=True):
         """
         Args:
             excel_path: 행정구역별 위경도 엑셀 파일 경로
+            use_cache: 엑셀 대신 바이너리 캐시 사용 여부 (region_dataset 참조)
         """
         if excel_path is None:
-            import os
             # 현재 스크립트 디렉토리에서 엑셀 파일 찾기
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            excel_path = os.path.join(script_dir, '행정구역별_위경도_좌표.xlsx')
+            excel_path = default_excel_path()
 
         self.excel_path = excel_path
-        self.df = None
+        self.use_cache = use_cache
+        self.dataset = None
+        self._df = None
         self.load_excel()
 
     def load_excel(self):
-        """엑셀 파일 로드 - 모든 시트를 통합"""
+        """행정구역 데이터 로드 - 모든 시트를 통합 (유효한 캐시가 있으면 캐시 사용)"""
         try:
-            xl_file = pd.ExcelFile(self.excel_path)
-            all_dfs = []
-
-            for sheet_name in xl_file.sheet_names:
-                df_sheet = pd.read_excel(xl_file, sheet_name=sheet_name)
-                all_dfs.append(df_sheet)
-
-            # 모든 시트를 하나의 DataFrame으로 통합
-            self.df = pd.concat(all_dfs, ignore_index=True)
-            print(f"✓ 엑셀 파일 로드 완료: {len(xl_file.sheet_names)}개 시트, {len(self.df)}개 행정구역")
+            self.dataset = load_region_dataset(self.excel_path, use_cache=self.use_cache)
+            print(f"✓ 엑셀 파일 로드 완료: {self.dataset['sheets']}개 시트, {len(self.dataset['lat'])}개 행정구역")
 
         except FileNotFoundError:
             print(f"✗ 엑셀 파일을 찾을 수 없습니다: {self.excel_path}")
-            self.df = pd.DataFrame()
+            self.dataset = None
         except Exception as e:
             print(f"✗ 엑셀 파일 로드 실패: {e}")
-            self.df = pd.DataFrame()
+            self.dataset = None
+
+        self._df = None
+        self._build_search_index()
+
+    @property
+    def df(self):
+        """행정구역 DataFrame (필요할 때만 생성)"""
+        import pandas as pd
+
+        if self._df is None:
+            if self.dataset is None:
+                self._df = pd.DataFrame()
+            else:
+                columns = {column: self.dataset['names'][column] for column in NAME_COLUMNS}
+                columns['위도'] = self.dataset['lat'].astype(float)
+                columns['경도'] = self.dataset['lng'].astype(float)
+                self._df = pd.DataFrame(columns).replace('', None)
+        return self._df
+
+    def _build_search_index(self):
+        """
+        검색 인덱스 생성 (로드 시 1회)
+        - 정규화된 전체 주소 배열 (공백 제거, 소문자)
+        - 문자 1-gram / 2-gram → 행 번호 역색인
+        """
+        self._entries = []
+        self._names_norm = []
+        self._levels = []
+        self._postings = {}
+
+        if self.dataset is None:
+            return
+
+        for idx, sido, sigungu, eupmyeondong, lat, lng in iter_regions(self.dataset):
+            parts = [p for p in [sido, sigungu, eupmyeondong] if p]
+            full_name = ' '.join(parts)
+            name_norm = full_name.replace(' ', '').lower()
+
+            self._entries.append({
+                'full_name': full_name,
+                'lat': round(lat, 6),
+                'lng': round(lng, 6),
+                'sido': sido,
+                'sigungu': sigungu,
+                'eupmyeondong': eupmyeondong
+            })
+            self._names_norm.append(name_norm)
+            self._levels.append(len(parts))
+
+            grams = set(name_norm)
+            grams.update(name_norm[i:i + 2] for i in range(len(name_norm) - 1))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(idx)
+
+        # 교집합 계산용 집합으로 변환
+        self._postings = {gram: frozenset(ids) for gram, ids in self._postings.items()}
 
     def normalize_keyword(self, keyword):
         """
@@ -76,48 +127,67 @@ class RealtimeRegionCodeFinder:
 
         return keyword
 
-    def search_address(self, keyword):
+    def search(self, keyword, limit=None):
         """
-        키워드로 행정구역 검색
+        키워드로 행정구역 검색 (역색인 사용)
 
         Args:
             keyword: 검색 키워드 (예: "대전 유성구", "송강동")
+            limit: 최대 결과 수 (None이면 전체)
 
         Returns:
-            list: 검색 결과 리스트 [{'full_name': str, 'lat': float, 'lng': float}, ...]
+            tuple: (결과 리스트, 전체 매칭 수)
+                   결과는 매칭 위치가 앞설수록, 상위 행정구역일수록 먼저
         """
-        if self.df is None or self.df.empty:
-            return []
+        if not self._entries:
+            return [], 0
 
-        # 키워드 정규화
-        normalized_keyword = self.normalize_keyword(keyword)
+        # 키워드 정규화 (대소문자 무시, 공백 무시)
+        keyword_norm = self.normalize_keyword(keyword).replace(' ', '').lower()
 
-        results = []
-
-        for idx, row in self.df.iterrows():
-            # NaN 값 처리
-            sido = str(row['시도']) if pd.notna(row['시도']) else ''
-            sigungu = str(row['시군구']) if pd.notna(row['시군구']) else ''
-            eupmyeondong = str(row['읍면동/구']) if pd.notna(row['읍면동/구']) else ''
+        if keyword_norm:
+            if len(keyword_norm) == 1:
+                grams = {keyword_norm}
+            else:
+                grams = {keyword_norm[i:i + 2] for i in range(len(keyword_norm) - 1)}
+
+            # 짧은 posting list부터 교집합
+            postings = sorted((self._postings.get(gram, frozenset()) for gram in grams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= posting
+        else:
+            candidates = range(len(self._entries))
+
+        # n-gram 교집합은 후보일 뿐이므로 실제 부분 문자열 여부 확인
+        ranked = []
+        for idx in candidates:
+            pos = self._names_norm[idx].find(keyword_norm)
+            if pos >= 0:
+                ranked.append((pos, self._levels[idx], idx))
+
+        total = len(ranked)
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
 
-            # 전체 주소 생성
-            parts = [p for p in [sido, sigungu, eupmyeondong] if p]
-            full_name = ' '.join(parts)
+        return [dict(self._entries[idx]) for _, _, idx in ranked], total
 
-            # 키워드 매칭 (대소문자 무시, 공백 무시)
-            keyword_norm = normalized_keyword.replace(' ', '').lower()
-            fullname_norm = full_name.replace(' ', '').lower()
+    def search_address(self, keyword, limit=None):
+        """
+        키워드로 행정구역 검색
 
-            if keyword_norm in fullname_norm:
-                results.append({
-                    'full_name': full_name,
-                    'lat': row['위도'],
-                    'lng': row['경도'],
-                    'sido': sido,
-                    'sigungu': sigungu,
-                    'eupmyeondong': eupmyeondong
-                })
+        Args:
+            keyword: 검색 키워드 (예: "대전 유성구", "송강동")
+            limit: 최대 결과 수 (None이면 전체)
 
+        Returns:
+            list: 검색 결과 리스트 [{'full_name': str, 'lat': float, 'lng': float}, ...]
+        """
+        results, _ = self.search(keyword, limit)
         return results
 
     def get_region_code(self, keyword, lat=None, lng=None, delay=0.1):
@@ -132,58 +202,58 @@ class RealtimeRegionCodeFinder:
         Returns:
             str: 네이버 지역코드 (예: "07230112") 또는 None
         """
-        from playwright.sync_api import sync_playwright
-        import time
+        from browser_pool import get_browser_pool
 
         print(f"지역 코드 검색 (Playwright): {keyword}")
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                
+        def search_code(context):
+            page = context.new_page()
+
+            try:
+                # 네이버 날씨 홈 이동
+                page.goto("https://weather.naver.com/", wait_until='domcontentloaded', timeout=15000)
+
+                # 검색창 찾기 (버튼 뒤에 숨겨져 있을 수 있음)
                 try:
-                    # 네이버 날씨 홈 이동
-                    page.goto("https://weather.naver.com/", wait_until='domcontentloaded', timeout=15000)
-                    
-                    # 검색창 찾기 (버튼 뒤에 숨겨져 있을 수 있음)
-                    try:
-                        page.wait_for_selector("input.interest_form_input", state="attached", timeout=3000)
-                        if not page.is_visible("input.interest_form_input"):
-                            search_btn = page.query_selector("button[class*='search'], .btn_search, .button_search")
-                            if search_btn:
-                                search_btn.click()
-                                page.wait_for_selector("input.interest_form_input", state="visible", timeout=3000)
-                    except:
-                        pass
-
-                    # 검색어 입력
-                    page.fill("input.interest_form_input", keyword)
-                    
-                    # 자동완성 결과 대기
-                    page.wait_for_selector("a.interest_item_link", timeout=5000)
-                    
-                    # 첫 번째 결과 클릭
-                    page.click("a.interest_item_link >> nth=0")
-                    
-                    # URL 변경 대기 (지역 코드가 포함된 URL로 이동)
-                    page.wait_for_url("**/today/*", timeout=10000)
-                    
-                    current_url = page.url
-                    if "/today/" in current_url:
-                        code = current_url.split("/today/")[1].split("?")[0]
-                        print(f"✓ 코드 발견: {code}")
-                        return code
-                        
-                except Exception as e:
-                    print(f"✗ Playwright 검색 실패: {e}")
-                finally:
-                    browser.close()
+                    page.wait_for_selector("input.interest_form_input", state="attached", timeout=3000)
+                    if not page.is_visible("input.interest_form_input"):
+                        search_btn = page.query_selector("button[class*='search'], .btn_search, .button_search")
+                        if search_btn:
+                            search_btn.click()
+                            page.wait_for_selector("input.interest_form_input", state="visible", timeout=3000)
+                except:
+                    pass
+
+                # 검색어 입력
+                page.fill("input.interest_form_input", keyword)
+
+                # 자동완성 결과 대기
+                page.wait_for_selector("a.interest_item_link", timeout=5000)
+
+                # 첫 번째 결과 클릭
+                page.click("a.interest_item_link >> nth=0")
+
+                # URL 변경 대기 (지역 코드가 포함된 URL로 이동)
+                page.wait_for_url("**/today/*", timeout=10000)
+
+                current_url = page.url
+                if "/today/" in current_url:
+                    code = current_url.split("/today/")[1].split("?")[0]
+                    print(f"✓ 코드 발견: {code}")
+                    return code
+
+            except Exception as e:
+                print(f"✗ Playwright 검색 실패: {e}")
 
             return None
 
+        try:
+            # 공유 브라우저 풀에서 격리된 컨텍스트를 빌려 검색
+            return get_browser_pool().run(
+                search_code,
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            )
+
         except Exception as e:
             print(f"✗ 오류 발생: {e}")
             return None
@@ -0,0 +1,202 @@
+"""
+수요 기반 날씨 갱신 계획
+- 고정 주기(10분마다 전체) 대신 지역 코드마다 다음 크롤링 시점을 계산
+- 신호: 데이터 경과 시간, 저장한 사용자 수, 새벽 런닝 시간대(04~07시)까지 남은 시간,
+        사용자 알림 시간까지 남은 시간, 최근 크롤링의 변동성
+- 분당 크롤링 예산 안에서 우선순위가 높은 지역부터 선택
+- 지역별 크롤링 이력(마지막 크롤링 시각, 변동성)은 crawl_jobs 테이블에 있음 (crawl_jobs.crawl_state)
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import math
+import os
+from datetime import timedelta
+
+
+# 분당 최대 크롤링 수
+REFRESH_BUDGET_PER_MIN = int(os.environ.get('REFRESH_BUDGET_PER_MIN', '6'))
+# 지역별 갱신 간격 하한 / 상한 (분)
+REFRESH_MIN_INTERVAL = float(os.environ.get('REFRESH_MIN_INTERVAL', '10'))
+REFRESH_MAX_INTERVAL = float(os.environ.get('REFRESH_MAX_INTERVAL', '180'))
+
+# 새벽 런닝 시간대 (weather_service.MORNING_HOURS와 동일)
+DAWN_START_HOUR = 4
+DAWN_END_HOUR = 7
+# 새벽 시간대 몇 시간 전부터 갱신을 당길지
+DAWN_LEAD_HOURS = 6
+# 알림 몇 분 전부터 갱신을 당길지
+NOTIFY_LEAD_MINUTES = 60
+
+# 변동성 지수이동평균 가중치 (최근 크롤링 비중)
+VOLATILITY_ALPHA = 0.3
+
+
+def _parse_notification_time(value):
+    """'HH:MM' → 하루 중 분 (잘못된 값이면 None)"""
+    try:
+        hour, minute = value.split(':')
+        return int(hour) * 60 + int(minute)
+    except (AttributeError, ValueError):
+        return None
+
+
+def hours_until_dawn(now):
+    """다음 새벽 시간대 시작까지 남은 시간 (시간대 안이면 0)"""
+    if DAWN_START_HOUR <= now.hour < DAWN_END_HOUR:
+        return 0.0
+    dawn = now.replace(hour=DAWN_START_HOUR, minute=0, second=0, microsecond=0)
+    if dawn <= now:
+        dawn += timedelta(days=1)
+    return (dawn - now).total_seconds() / 3600
+
+
+def minutes_until_notification(now, notification_minutes):
+    """가장 가까운 알림 시간까지 남은 분 (알림이 없으면 None)"""
+    current = now.hour * 60 + now.minute
+    remaining = [(minutes - current) % 1440 for minutes in notification_minutes]
+    return min(remaining) if remaining else None
+
+
+def target_interval(users, now, notification_minutes=(), volatility=0.0):
+    """
+    지역의 목표 갱신 간격 (분)
+
+    Args:
+        users: 지역을 저장한 사용자 수
+        now: 현재 시각
+        notification_minutes: 알림 시간 목록 (하루 중 분)
+        volatility: 최근 크롤링 변동성 (0~1, 바뀐 시간 비율의 이동평균)
+    """
+    # 사용자가 많을수록 자주
+    demand_factor = 1 / (1 + math.log2(max(1, users)))
+
+    # 새벽 시간대가 가까울수록 자주 (시간대 안에서 가장 자주)
+    dawn_hours = hours_until_dawn(now)
+    dawn_factor = 1.0
+    if dawn_hours <= DAWN_LEAD_HOURS:
+        dawn_factor = 0.15 + 0.85 * dawn_hours / DAWN_LEAD_HOURS
+
+    # 알림 직전에 최신 데이터가 되도록
+    notify_factor = 1.0
+    notify_minutes = minutes_until_notification(now, notification_minutes)
+    if notify_minutes is not None and notify_minutes <= NOTIFY_LEAD_MINUTES:
+        notify_factor = 0.2 + 0.8 * notify_minutes / NOTIFY_LEAD_MINUTES
+
+    # 예보가 자주 바뀌는 지역은 자주
+    volatility_factor = 1 - 0.6 * min(1.0, max(0.0, volatility))
+
+    interval = REFRESH_MAX_INTERVAL * demand_factor * min(dawn_factor, notify_factor) * volatility_factor
+    return min(REFRESH_MAX_INTERVAL, max(REFRESH_MIN_INTERVAL, interval))
+
+
+def update_volatility(previous, changed_hours, total_hours):
+    """변동성 이동평균 갱신 (total_hours가 0이면 그대로)"""
+    if total_hours <= 0:
+        return previous
+    ratio = min(1.0, changed_hours / total_hours)
+    return (1 - VOLATILITY_ALPHA) * previous + VOLATILITY_ALPHA * ratio
+
+
+class RefreshPlanner:
+    """지역 코드별 크롤링 이력을 바탕으로 갱신 계획을 세움"""
+
+    def __init__(self, budget_per_min=REFRESH_BUDGET_PER_MIN):
+        self.budget_per_min = budget_per_min
+
+    def plan(self, demand, now, state, budget=None):
+        """
+        갱신 계획 계산
+
+        Args:
+            demand: {region_code: {'users': 사용자 수, 'notification_minutes': [하루 중 분, ...]}}
+            now: 현재 시각
+            state: 지역별 크롤링 상태 {region_code: {'last_crawled_at', 'volatility', 'queued'}}
+                   (crawl_jobs.crawl_state(), queued인 지역은 선택 안 함)
+            budget: 이번 계획에서 선택할 최대 지역 수 (None이면 분당 예산)
+
+        Returns:
+            list: 우선순위 내림차순 [{
+                'region_code', 'users', 'priority', 'interval_minutes', 'stale_minutes',
+                'volatility', 'last_crawled_at', 'next_due_at', 'queued', 'selected'
+            }, ...]
+        """
+        budget = self.budget_per_min if budget is None else budget
+
+        schedule = []
+        for region_code, info in demand.items():
+            region_state = state.get(region_code, {'last_crawled_at': None, 'volatility': 0.0})
+            interval = target_interval(
+                info['users'], now, info.get('notification_minutes', ()), region_state['volatility']
+            )
+
+            last = region_state['last_crawled_at']
+            if last is None:
+                # 크롤링 기록이 없는 지역은 가장 먼저
+                stale = None
+                priority = float('inf')
+                next_due_at = now
+            else:
+                stale = (now - last).total_seconds() / 60
+                priority = stale / interval
+                next_due_at = last + timedelta(minutes=interval)
+
+            schedule.append({
+                'region_code': region_code,
+                'users': info['users'],
+                'priority': priority,
+                'interval_minutes': round(interval, 1),
+                'stale_minutes': round(stale, 1) if stale is not None else None,
+                'volatility': round(region_state['volatility'], 3),
+                'last_crawled_at': last,
+                'next_due_at': next_due_at,
+                'queued': bool(region_state.get('queued')),
+                'selected': False
+            })
+
+        # 우선순위 → 사용자 수 순
+        schedule.sort(key=lambda entry: (-entry['priority'], -entry['users'], entry['region_code']))
+
+        selected = 0
+        for entry in schedule:
+            if selected >= budget:
+                break
+            if entry['priority'] >= 1 and not entry['queued']:
+                entry['selected'] = True
+                selected += 1
+
+        return schedule
+
+
+def collect_region_demand():
+    """
+    저장된 지역의 수요 신호 (DB 조회, 앱 컨텍스트 필요)
+
+    Returns:
+        dict: {region_code: {'users': 사용자 수, 'notification_minutes': [알림 시간(분), ...]}}
+    """
+    from models import db, SavedLocation, User
+
+    rows = db.session.query(
+        SavedLocation.region_code, User.id, User.email_notification, User.notification_time
+    ).join(User, SavedLocation.user_id == User.id).distinct().all()
+
+    demand = {}
+    for region_code, user_id, email_notification, notification_time in rows:
+        info = demand.setdefault(region_code, {'users': set(), 'notification_minutes': set()})
+        info['users'].add(user_id)
+        if email_notification:
+            minutes = _parse_notification_time(notification_time)
+            if minutes is not None:
+                info['notification_minutes'].add(minutes)
+
+    return {
+        code: {'users': len(info['users']), 'notification_minutes': sorted(info['notification_minutes'])}
+        for code, info in demand.items()
+    }
+
+
+# 프로세스 전체에서 공유하는 계획기
+refresh_planner = RefreshPlanner()
+
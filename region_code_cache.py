@@ -0,0 +1,179 @@
+"""
+지역코드 조회 캐시
+- 지역명 → 네이버 지역코드를 DB(region_code_cache)에 영구 저장
+- 브라우저 조회 전에 먼저 확인하고, 성공하면 채워 넣음
+- 조회 실패는 짧은 TTL의 negative 캐시로 저장 (선택)
+- 배포용 지역코드 테이블(region_codes.csv, build_region_codes.py로 생성)을 브라우저보다 먼저 사용
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import csv
+import os
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+from models import db, RegionCodeCache, SavedLocation
+
+
+# negative 캐시 TTL (초, 0이면 사용 안 함)
+NEGATIVE_TTL = int(os.environ.get('REGION_CODE_NEGATIVE_TTL', '300'))
+
+# 배포용 지역코드 테이블 경로
+REGION_CODE_TABLE = os.environ.get(
+    'REGION_CODE_TABLE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'region_codes.csv')
+)
+
+_stats = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'stores': 0, 'table_hits': 0}
+_stats_lock = threading.Lock()
+
+_region_table = None
+_region_table_lock = threading.Lock()
+
+
+def _count(key):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def get_region_code_table():
+    """배포용 지역코드 테이블 → {지역명: 지역코드} (최초 1회 로드, 파일이 없으면 빈 테이블)"""
+    global _region_table
+
+    if _region_table is None:
+        with _region_table_lock:
+            if _region_table is None:
+                table = {}
+                try:
+                    with open(REGION_CODE_TABLE, encoding='utf-8', newline='') as f:
+                        for record in csv.DictReader(f):
+                            if record.get('region_code'):
+                                table[record['region_name']] = record['region_code']
+                    print(f"✓ 지역코드 테이블 로드: {len(table)}개 지역")
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"✗ 지역코드 테이블 로드 실패: {e}")
+                _region_table = table
+
+    return _region_table
+
+
+def lookup_region_code(region_name):
+    """
+    캐시에서 지역코드 조회
+
+    Returns:
+        tuple: (캐시 적중 여부, 지역코드 또는 None)
+               negative 캐시 적중이면 (True, None)
+    """
+    entry = RegionCodeCache.query.filter_by(region_name=region_name).first()
+    if entry is None:
+        return False, None
+
+    now = datetime.utcnow()
+
+    if entry.region_code is None:
+        if entry.expires_at is None or entry.expires_at <= now:
+            return False, None
+        _count('negative_hits')
+    else:
+        _count('hits')
+
+    # 적중 통계는 호출자의 commit에 함께 반영
+    RegionCodeCache.query.filter_by(id=entry.id).update({
+        RegionCodeCache.hit_count: RegionCodeCache.hit_count + 1,
+        RegionCodeCache.last_hit_at: now
+    }, synchronize_session=False)
+
+    return True, entry.region_code
+
+
+def store_region_code(region_name, region_code, source, ttl=None):
+    """
+    캐시에 지역코드 저장 (region_code가 None이면 negative 캐시)
+
+    Args:
+        region_name: 지역명
+        region_code: 지역코드 또는 None
+        source: 조회 경로
+        ttl: negative 캐시 유지 시간 (초)
+
+    세션을 commit함 (조회 결과는 호출자의 이후 처리가 실패해도 남아야 하므로)
+    호출자의 대기 중인 변경(lookup_region_code의 적중 통계 등)도 함께 커밋됨
+    """
+    expires_at = None
+    if region_code is None:
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl if ttl is not None else NEGATIVE_TTL)
+
+    try:
+        entry = RegionCodeCache.query.filter_by(region_name=region_name).first()
+        if entry is None:
+            entry = RegionCodeCache(region_name=region_name, hit_count=0)
+            db.session.add(entry)
+        entry.region_code = region_code
+        entry.source = source
+        entry.expires_at = expires_at
+        db.session.commit()
+        _count('stores')
+    except IntegrityError:
+        # 다른 요청이 같은 지역을 먼저 저장함 (그쪽 값으로 충분)
+        db.session.rollback()
+
+
+def resolve_region_code(region_name, resolver):
+    """
+    지역코드 조회 (캐시 → 배포용 테이블 → 저장된 지역 → resolver 순서)
+
+    Args:
+        region_name: 지역명
+        resolver: 캐시에 없을 때 호출할 함수 (지역코드 또는 None 반환, 예: Playwright 검색)
+
+    Returns:
+        str: 지역코드 또는 None
+    """
+    found, region_code = lookup_region_code(region_name)
+    if found:
+        print(f"[지역코드 캐시] 적중: {region_name} → {region_code}")
+        return region_code
+
+    _count('misses')
+
+    region_code = get_region_code_table().get(region_name)
+    if region_code:
+        _count('table_hits')
+        store_region_code(region_name, region_code, 'table')
+        return region_code
+
+    # 다른 사용자가 이미 저장한 지역이면 그 코드 재사용
+    existing = SavedLocation.query.filter_by(region_name=region_name).first()
+    if existing is not None:
+        store_region_code(region_name, existing.region_code, 'saved_location')
+        return existing.region_code
+
+    region_code = resolver()
+
+    if region_code:
+        store_region_code(region_name, region_code, 'playwright')
+    elif NEGATIVE_TTL > 0:
+        store_region_code(region_name, None, 'playwright')
+
+    return region_code
+
+
+def get_region_code_cache_stats():
+    """캐시 적중 통계 (프로세스 누적 + 테이블 요약)"""
+    with _stats_lock:
+        stats = dict(_stats)
+
+    lookups = stats['hits'] + stats['negative_hits'] + stats['misses']
+    stats['hit_ratio'] = (stats['hits'] + stats['negative_hits']) / lookups if lookups else 0.0
+    stats['table_entries'] = len(get_region_code_table())
+    stats['entries'] = RegionCodeCache.query.filter(RegionCodeCache.region_code.isnot(None)).count()
+    stats['total_hits'] = db.session.query(db.func.coalesce(db.func.sum(RegionCodeCache.hit_count), 0)).scalar()
+
+    return stats
@@ -0,0 +1,197 @@
+"""
+행정구역 위경도 데이터셋 로더
+- 엑셀(행정구역별_위경도_좌표.xlsx)을 한 번 파싱해 바이너리 캐시(.regions.npz)로 저장
+- 이후 프로세스는 캐시만 읽음 (pandas/openpyxl 파싱 생략)
+- 엑셀 파일의 수정 시각 또는 해시가 바뀌면 자동 재생성
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+# 지역명 컬럼 (엑셀 컬럼명 그대로)
+NAME_COLUMNS = ['시도', '시군구', '읍면동/구', '읍/면/리/동', '리']
+
+CACHE_FORMAT_VERSION = 2  # 2: 위경도 float64 (float32는 소수 6자리가 엑셀과 달라짐)
+_SEPARATOR = '\x1f'
+
+
+def default_excel_path():
+    """기본 행정구역 엑셀 파일 경로 (이 모듈과 같은 디렉토리)"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), '행정구역별_위경도_좌표.xlsx')
+
+
+def cache_path_for(excel_path):
+    """엑셀 파일 옆에 두는 캐시 파일 경로"""
+    return os.path.splitext(excel_path)[0] + '.regions.npz'
+
+
+def _file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_region_excel(excel_path):
+    """
+    엑셀의 모든 시트를 읽어 컬럼 배열로 변환
+
+    Returns:
+        dict: {'names': {컬럼명: 문자열 리스트}, 'lat': float64 배열, 'lng': float64 배열}
+    """
+    import pandas as pd
+
+    xl_file = pd.ExcelFile(excel_path)
+    df = pd.concat(
+        [pd.read_excel(xl_file, sheet_name=sheet_name) for sheet_name in xl_file.sheet_names],
+        ignore_index=True
+    )
+
+    names = {}
+    for column in NAME_COLUMNS:
+        values = df[column] if column in df.columns else [None] * len(df)
+        names[column] = [str(v) if pd.notna(v) else '' for v in values]
+
+    return {
+        'names': names,
+        'lat': df['위도'].to_numpy(dtype=np.float64),
+        'lng': df['경도'].to_numpy(dtype=np.float64),
+        'sheets': len(xl_file.sheet_names)
+    }
+
+
+def _encode_strings(strings):
+    """문자열 리스트 → (고유값 바이트 배열, 코드 배열)"""
+    table = {}
+    codes = np.empty(len(strings), dtype=np.int32)
+    for i, value in enumerate(strings):
+        codes[i] = table.setdefault(value, len(table))
+
+    blob = _SEPARATOR.join(table).encode('utf-8')
+    if len(table) < 65536:
+        codes = codes.astype(np.uint16)
+    return np.frombuffer(blob, dtype=np.uint8), codes
+
+
+def _decode_strings(blob, codes):
+    values = blob.tobytes().decode('utf-8').split(_SEPARATOR)
+    return [values[code] for code in codes.tolist()]
+
+
+def write_region_cache(cache_path, dataset, source_mtime, source_sha1):
+    """캐시 파일 저장 (임시 파일에 쓴 뒤 교체하므로 여러 프로세스가 동시에 써도 안전)"""
+    arrays = {'lat': dataset['lat'], 'lng': dataset['lng']}
+    for i, column in enumerate(NAME_COLUMNS):
+        arrays[f'names{i}_values'], arrays[f'names{i}_codes'] = _encode_strings(dataset['names'][column])
+
+    meta = {
+        'version': CACHE_FORMAT_VERSION,
+        'source_mtime': source_mtime,
+        'source_sha1': source_sha1,
+        'sheets': dataset.get('sheets', 0)
+    }
+    arrays['meta'] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, cache_path)
+
+
+def read_region_cache(cache_path):
+    """
+    캐시 파일 읽기
+
+    Returns:
+        tuple: (dataset dict, meta dict)
+    """
+    with np.load(cache_path, allow_pickle=False) as data:
+        meta = json.loads(data['meta'].tobytes().decode('utf-8'))
+        if meta.get('version') != CACHE_FORMAT_VERSION:
+            raise ValueError(f"캐시 형식 버전 불일치: {meta.get('version')}")
+
+        names = {
+            column: _decode_strings(data[f'names{i}_values'], data[f'names{i}_codes'])
+            for i, column in enumerate(NAME_COLUMNS)
+        }
+        dataset = {
+            'names': names,
+            'lat': data['lat'],
+            'lng': data['lng'],
+            'sheets': meta.get('sheets', 0)
+        }
+
+    return dataset, meta
+
+
+def load_region_dataset(excel_path=None, use_cache=True):
+    """
+    행정구역 데이터셋 로드 (캐시가 유효하면 캐시, 아니면 엑셀 파싱 후 캐시 갱신)
+
+    Args:
+        excel_path: 엑셀 파일 경로 (None이면 기본 경로)
+        use_cache: False면 항상 엑셀 파싱
+
+    Returns:
+        dict: {'names': {컬럼명: 문자열 리스트}, 'lat': float64 배열, 'lng': float64 배열, 'sheets': int}
+    """
+    if excel_path is None:
+        excel_path = default_excel_path()
+
+    if not use_cache:
+        return parse_region_excel(excel_path)
+
+    cache_path = cache_path_for(excel_path)
+    source_mtime = os.path.getmtime(excel_path)
+    source_sha1 = None
+
+    if os.path.exists(cache_path):
+        try:
+            dataset, meta = read_region_cache(cache_path)
+
+            if meta['source_mtime'] == source_mtime:
+                return dataset
+
+            # 수정 시각만 바뀌었고 내용이 같으면 캐시를 그대로 쓰고 시각만 갱신
+            source_sha1 = _file_sha1(excel_path)
+            if meta['source_sha1'] == source_sha1:
+                write_region_cache(cache_path, dataset, source_mtime, source_sha1)
+                return dataset
+
+            print("엑셀 파일이 변경되어 지역 캐시를 다시 생성합니다.")
+        except Exception as e:
+            print(f"✗ 지역 캐시 읽기 실패, 다시 생성합니다: {e}")
+
+    dataset = parse_region_excel(excel_path)
+
+    try:
+        if source_sha1 is None:
+            source_sha1 = _file_sha1(excel_path)
+        write_region_cache(cache_path, dataset, source_mtime, source_sha1)
+        print(f"✓ 지역 캐시 생성: {cache_path}")
+    except OSError as e:
+        print(f"✗ 지역 캐시 저장 실패: {e}")
+
+    return dataset
+
+
+def iter_regions(dataset):
+    """
+    데이터셋 행 순회
+
+    Yields:
+        tuple: (행 번호, 시도, 시군구, 읍면동/구, 위도, 경도)
+    """
+    names = dataset['names']
+    rows = zip(names['시도'], names['시군구'], names['읍면동/구'],
+               dataset['lat'].tolist(), dataset['lng'].tolist())
+    for idx, (sido, sigungu, eupmyeondong, lat, lng) in enumerate(rows):
+        yield idx, sido, sigungu, eupmyeondong, lat, lng
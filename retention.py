@@ -0,0 +1,224 @@
+"""
+날씨 데이터 보존 정책
+- 보존 기간(WEATHER_RETENTION_DAYS)이 지난 시간별 날씨(weather_data)를
+  지역/날짜별 일별 요약(weather_daily_rollup)으로 압축한 뒤 원본 행을 삭제
+- 삭제는 작은 묶음(RETENTION_BATCH_SIZE) 단위로 커밋해 긴 잠금/트랜잭션을 피함
+- 시간별 테이블은 보존 기간만큼의 크기로 유지되고, 지난 기록은 일별 요약으로 조회
+- WEATHER_ARCHIVE_DIR가 설정되어 있으면 삭제 전에 시간별 원본을 컬럼 아카이브의 날짜 파티션에 보관
+
+사용 예:
+    python retention.py              # 보존 기간이 지난 데이터 압축
+    python retention.py --days 14
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import groupby
+
+from models import db, WeatherData, WeatherDayFingerprint, WeatherDailyRollup, RegionDaySummary
+from weather_service import MORNING_HOURS
+from weather_archive import archive_weather_rows, WEATHER_ARCHIVE_DIR
+
+
+# 시간별 데이터를 남겨둘 기간 (일, 오늘 기준 이보다 오래된 날짜는 일별 요약으로 압축)
+WEATHER_RETENTION_DAYS = int(os.environ.get('WEATHER_RETENTION_DAYS', '7'))
+# 삭제 한 번(커밋 한 번)에 지울 최대 행 수
+RETENTION_BATCH_SIZE = int(os.environ.get('RETENTION_BATCH_SIZE', '500'))
+
+
+def _mean(values):
+    return round(sum(values) / len(values), 1) if values else None
+
+
+def _dominant(values):
+    """가장 많이 나타난 값 (같으면 먼저 나타난 값)"""
+    return Counter(values).most_common(1)[0][0] if values else None
+
+
+def summarize_day(rows):
+    """
+    한 지역/날짜의 시간별 날씨를 일별 요약 값으로 변환
+
+    Args:
+        rows: 같은 지역/날짜의 WeatherData 리스트
+
+    Returns:
+        dict: WeatherDailyRollup 컬럼 값
+    """
+    rows = sorted(rows, key=lambda w: w.hour)
+    dawn = [w for w in rows if w.hour in MORNING_HOURS]
+
+    temps = [w.temperature for w in rows if w.temperature is not None]
+    probs = [w.precipitation_prob for w in rows if w.precipitation_prob is not None]
+    dawn_temps = [w.temperature for w in dawn if w.temperature is not None]
+    dawn_probs = [w.precipitation_prob for w in dawn if w.precipitation_prob is not None]
+    dawn_humidities = [w.humidity for w in dawn if w.humidity is not None]
+    dawn_winds = [w.wind_speed for w in dawn if w.wind_speed is not None]
+
+    return {
+        'hour_count': len(rows),
+        'temp_min': min(temps) if temps else None,
+        'temp_max': max(temps) if temps else None,
+        'temp_mean': _mean(temps),
+        'precip_prob_max': max(probs) if probs else None,
+        'dominant_status': _dominant([w.weather_status for w in rows if w.weather_status]),
+        'dawn_hour_count': len(dawn),
+        'dawn_temp_min': min(dawn_temps) if dawn_temps else None,
+        'dawn_temp_max': max(dawn_temps) if dawn_temps else None,
+        'dawn_temp_mean': _mean(dawn_temps),
+        'dawn_precip_prob_max': max(dawn_probs) if dawn_probs else None,
+        'dawn_humidity_mean': _mean(dawn_humidities),
+        'dawn_wind_speed_max': max(dawn_winds) if dawn_winds else None,
+        'dawn_status': _dominant([w.weather_status for w in dawn if w.weather_status])
+    }
+
+
+def _delete_in_batches(model, criterion, batch_size):
+    """조건에 맞는 행을 batch_size개씩 나눠 삭제 (묶음마다 커밋)"""
+    deleted = 0
+    while True:
+        ids = [row_id for (row_id,) in db.session.query(model.id).filter(criterion).limit(batch_size)]
+        if not ids:
+            return deleted
+        model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+        deleted += len(ids)
+
+
+def compact_day(target_date, batch_size=RETENTION_BATCH_SIZE, archive_dir=WEATHER_ARCHIVE_DIR):
+    """
+    한 날짜의 시간별 날씨를 일별 요약으로 압축하고 원본 삭제
+
+    요약을 먼저 커밋한 뒤 삭제하므로 중간에 멈춰도 다음 실행에서 이어서 삭제함
+    (이미 요약이 있는 지역은 남은 일부 행으로 다시 계산하지 않음)
+    아카이브 저장에 실패하면 예외가 그대로 올라가 원본을 지우지 않음
+
+    Returns:
+        dict: {'rollups': 새로 만든 요약 수, 'deleted': 삭제한 시간별 행 수}
+    """
+    rows = WeatherData.query.filter(
+        WeatherData.date == target_date
+    ).order_by(WeatherData.region_code, WeatherData.hour).all()
+
+    if archive_dir and rows:
+        archive_weather_rows(rows, archive_dir)
+
+    summarized = {
+        code for (code,) in db.session.query(WeatherDailyRollup.region_code).filter(
+            WeatherDailyRollup.date == target_date
+        )
+    }
+
+    rollups = 0
+    for region_code, region_rows in groupby(rows, key=lambda w: w.region_code):
+        if region_code in summarized:
+            continue
+        db.session.add(WeatherDailyRollup(
+            region_code=region_code, date=target_date, **summarize_day(list(region_rows))
+        ))
+        rollups += 1
+    db.session.commit()
+    db.session.expunge_all()
+
+    deleted = _delete_in_batches(WeatherData, WeatherData.date == target_date, batch_size)
+    return {'rollups': rollups, 'deleted': deleted}
+
+
+def compact_weather_history(today=None, retention_days=WEATHER_RETENTION_DAYS, batch_size=RETENTION_BATCH_SIZE):
+    """
+    보존 기간이 지난 날짜를 오래된 순서로 압축 (앱 컨텍스트 필요)
+
+    Args:
+        today: 기준 날짜 (None이면 오늘)
+        retention_days: 시간별 데이터를 남겨둘 기간 (일)
+        batch_size: 삭제 묶음 크기
+
+    Returns:
+        dict: {'cutoff', 'days', 'rollups', 'deleted', 'fingerprints_deleted', 'summaries_deleted'}
+    """
+    today = today or datetime.now().date()
+    cutoff = today - timedelta(days=retention_days)
+
+    old_dates = [
+        day for (day,) in db.session.query(WeatherData.date).filter(
+            WeatherData.date < cutoff
+        ).distinct().order_by(WeatherData.date)
+    ]
+
+    stats = {'cutoff': cutoff, 'days': len(old_dates), 'rollups': 0, 'deleted': 0}
+    for day in old_dates:
+        result = compact_day(day, batch_size)
+        stats['rollups'] += result['rollups']
+        stats['deleted'] += result['deleted']
+        print(f"  {day}: 요약 {result['rollups']}개, 시간별 {result['deleted']}행 삭제")
+
+    # 지난 날짜의 예보 지문/화면용 요약은 더 이상 쓰지 않음 (기록은 일별 요약에 남음)
+    stats['fingerprints_deleted'] = _delete_in_batches(
+        WeatherDayFingerprint, WeatherDayFingerprint.date < cutoff, batch_size
+    )
+    stats['summaries_deleted'] = _delete_in_batches(
+        RegionDaySummary, RegionDaySummary.date < cutoff, batch_size
+    )
+
+    print(f"✓ 날씨 보존 정리 완료: {cutoff} 이전 {stats['days']}일, "
+          f"요약 {stats['rollups']}개 생성, 시간별 {stats['deleted']}행 삭제")
+    return stats
+
+
+def get_weather_history(region_code, start_date, end_date):
+    """
+    지역의 날짜별 날씨 요약 조회
+    압축된 날짜는 일별 요약에서, 아직 시간별 데이터가 남은 날짜는 바로 요약해서 반환
+
+    Args:
+        region_code: 지역 코드
+        start_date: 시작 날짜
+        end_date: 종료 날짜 (포함)
+
+    Returns:
+        list: [{'date', 'source', ...요약 값}] 날짜 순
+    """
+    history = {}
+
+    rollups = WeatherDailyRollup.query.filter(
+        WeatherDailyRollup.region_code == region_code,
+        WeatherDailyRollup.date >= start_date,
+        WeatherDailyRollup.date <= end_date
+    ).all()
+    for rollup in rollups:
+        history[rollup.date] = {
+            column: getattr(rollup, column) for column in summarize_day([]).keys()
+        }
+        history[rollup.date]['source'] = 'rollup'
+
+    rows = WeatherData.query.filter(
+        WeatherData.region_code == region_code,
+        WeatherData.date >= start_date,
+        WeatherData.date <= end_date
+    ).order_by(WeatherData.date, WeatherData.hour).all()
+    for day, day_rows in groupby(rows, key=lambda w: w.date):
+        if day not in history:
+            history[day] = dict(summarize_day(list(day_rows)), source='hourly')
+
+    return [dict(values, date=day) for day, values in sorted(history.items())]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='보존 기간이 지난 시간별 날씨를 일별 요약으로 압축')
+    parser.add_argument('--days', type=int, default=WEATHER_RETENTION_DAYS, help='시간별 데이터를 남겨둘 기간 (일)')
+    parser.add_argument('--batch', type=int, default=RETENTION_BATCH_SIZE, help='삭제 묶음 크기')
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        compact_weather_history(retention_days=args.days, batch_size=args.batch)
+
+
+if __name__ == '__main__':
+    main()
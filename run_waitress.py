@@ -10,6 +10,10 @@ os.chdir(r'C:\Users\user\Documents\cursor\weather2')
 
 # Flask 앱 가져오기
 from app import app
+from event_bus import configure_stream_slots
+
+# 서버 스레드 수 (실시간 갱신(SSE) 연결 상한도 이 값에서 정함)
+WAITRESS_THREADS = 8
 
 # 스케줄러 비활성화 (대시보드 접속 시 자동 업데이트로 변경됨)
 
@@ -24,7 +28,8 @@ print("="*60 + "\n")
 
 try:
     from waitress import serve
-    serve(app, host='127.0.0.1', port=5555, threads=4)
+    configure_stream_slots(WAITRESS_THREADS)
+    serve(app, host='127.0.0.1', port=5555, threads=WAITRESS_THREADS)
 except KeyboardInterrupt:
     print('\n\n앱이 종료되었습니다.')
 except Exception as e:
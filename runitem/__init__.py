@@ -6,5 +6,6 @@
 
 from .weather_interface import WeatherInterface
 from .database import RunningOutfitDB
+from .outfit_index import OutfitRuleIndex, get_outfit_index
 
-__all__ = ['WeatherInterface', 'RunningOutfitDB']
+__all__ = ['WeatherInterface', 'RunningOutfitDB', 'OutfitRuleIndex', 'get_outfit_index']
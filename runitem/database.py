@@ -1,6 +1,46 @@
+import os
 import sqlite3
+import threading
 from typing import List, Tuple, Optional
 
+# 복장 테이블 변경 세대 (DB 파일 경로별) - 인메모리 인덱스 무효화용
+_table_generations = {}
+_generation_lock = threading.Lock()
+
+
+def table_generation(db_name: str) -> int:
+    """복장 테이블의 현재 변경 세대"""
+    return _table_generations.get(os.path.abspath(db_name), 0)
+
+
+def bump_table_generation(db_name: str):
+    """복장 테이블 변경 알림 (add_outfit/delete_outfit 후 호출)"""
+    key = os.path.abspath(db_name)
+    with _generation_lock:
+        _table_generations[key] = _table_generations.get(key, 0) + 1
+
+
+def extreme_temperature_result(temperature: float) -> Optional[List[Tuple]]:
+    """극한 기온이면 실외 런닝 부적절 결과, 아니면 None"""
+    if temperature >= 29:
+        return [("실외 런닝 부적절", "실내 운동 권장",
+                "",
+                f"현재 기온 {temperature}°C - 매우 더운 날씨로 열사병, 탈수 위험이 높습니다. "
+                "실내 트레드밀이나 에어컨이 있는 체육관에서 운동하시거나, "
+                "이른 아침(5-7시) 또는 늦은 저녁(20-22시) 시간대를 이용하세요.",
+                temperature, temperature)]
+
+    if temperature <= -7:
+        return [("실외 런닝 부적절", "실내 운동 권장",
+                "",
+                f"현재 기온 {temperature}°C - 매우 추운 날씨로 동상, 저체온증 위험이 높습니다. "
+                "실내 트레드밀이나 체육관에서 운동하시거나, "
+                "낮 시간대(12-14시) 기온이 상승할 때를 이용하세요.",
+                temperature, temperature)]
+
+    return None
+
+
 class RunningOutfitDB:
     def __init__(self, db_name: str = "running_outfits.db"):
         self.db_name = db_name
@@ -50,27 +90,16 @@ class RunningOutfitDB:
         ''', (temp_min, temp_max, humidity_min, humidity_max, wind_speed_min, wind_speed_max,
               top, bottom, accessories, notes))
         self.conn.commit()
+        bump_table_generation(self.db_name)
 
     def get_recommendation(self, temperature: float,
                           humidity: float = None,
                           wind_speed: float = None) -> List[Tuple]:
         """기상 조건에 맞는 복장 추천"""
         # 극한 기온 체크 - 실외 런닝 부적절
-        if temperature >= 29:
-            return [("실외 런닝 부적절", "실내 운동 권장",
-                    "",
-                    f"현재 기온 {temperature}°C - 매우 더운 날씨로 열사병, 탈수 위험이 높습니다. "
-                    "실내 트레드밀이나 에어컨이 있는 체육관에서 운동하시거나, "
-                    "이른 아침(5-7시) 또는 늦은 저녁(20-22시) 시간대를 이용하세요.",
-                    temperature, temperature)]
-
-        if temperature <= -7:
-            return [("실외 런닝 부적절", "실내 운동 권장",
-                    "",
-                    f"현재 기온 {temperature}°C - 매우 추운 날씨로 동상, 저체온증 위험이 높습니다. "
-                    "실내 트레드밀이나 체육관에서 운동하시거나, "
-                    "낮 시간대(12-14시) 기온이 상승할 때를 이용하세요.",
-                    temperature, temperature)]
+        extreme = extreme_temperature_result(temperature)
+        if extreme is not None:
+            return extreme
 
         query = '''
             SELECT top, bottom, accessories, notes, temp_min, temp_max
@@ -99,6 +128,7 @@ class RunningOutfitDB:
         """복장 데이터 삭제"""
         self.cursor.execute('DELETE FROM outfit_recommendations WHERE id = ?', (outfit_id,))
         self.conn.commit()
+        bump_table_generation(self.db_name)
 
     def initialize_sample_data(self):
         """
@@ -0,0 +1,119 @@
+"""
+복장 추천 규칙 인메모리 인덱스
+
+복장 테이블은 작고 거의 바뀌지 않으므로 프로세스당 한 번만 읽어
+정렬된 구간 배열로 보관하고, 추천 조회는 DB 연결 없이 메모리에서 처리합니다.
+add_outfit/delete_outfit 또는 DB 파일 변경이 감지되면 다시 읽습니다.
+"""
+
+import os
+import sqlite3
+import threading
+from bisect import bisect_right
+from typing import List, Tuple
+
+from .database import extreme_temperature_result, table_generation
+
+
+class OutfitRuleIndex:
+    """복장 추천 규칙 인덱스 (RunningOutfitDB.get_recommendation과 같은 결과)"""
+
+    def __init__(self, db_name: str = "running_outfits.db"):
+        self.db_name = db_name
+        self._lock = threading.Lock()
+        self._version = None
+
+        # (temp_min 배열, 규칙 배열) - temp_min 기준 정렬, 읽는 쪽이 항상 같은 세대를 보도록 한 번에 교체
+        self._table = ([], [])
+
+    def _current_version(self) -> Tuple:
+        try:
+            stat = os.stat(self.db_name)
+            file_version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_version = None
+        return (table_generation(self.db_name), file_version)
+
+    def _load(self, version: Tuple):
+        conn = sqlite3.connect(self.db_name)
+        try:
+            rows = conn.execute('''
+                SELECT id, temp_min, temp_max, humidity_min, humidity_max,
+                       wind_speed_min, wind_speed_max, top, bottom, accessories, notes
+                FROM outfit_recommendations
+            ''').fetchall()
+        finally:
+            conn.close()
+
+        rules = sorted(rows, key=lambda row: (row[1], row[0]))
+        self._table = ([rule[1] for rule in rules], rules)
+        self._version = version
+
+    @property
+    def version(self) -> Tuple:
+        """현재 복장 테이블 버전 (바뀌면 추천 결과가 달라질 수 있음)"""
+        return self._current_version()
+
+    def refresh(self):
+        """테이블이 바뀌었으면 다시 읽기"""
+        version = self._current_version()
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._load(version)
+
+    def get_recommendation(self, temperature: float,
+                           humidity: float = None,
+                           wind_speed: float = None) -> List[Tuple]:
+        """기상 조건에 맞는 복장 추천"""
+        # 극한 기온 체크 - 실외 런닝 부적절
+        extreme = extreme_temperature_result(temperature)
+        if extreme is not None:
+            return extreme
+
+        self.refresh()
+        temp_mins, rules = self._table
+
+        matches = []
+        for rule in rules[:bisect_right(temp_mins, temperature)]:
+            (rule_id, temp_min, temp_max, humidity_min, humidity_max,
+             wind_speed_min, wind_speed_max, top, bottom, accessories, notes) = rule
+
+            if temp_max < temperature:
+                continue
+
+            if humidity is not None:
+                if humidity_min is not None and humidity_min > humidity:
+                    continue
+                if humidity_max is not None and humidity_max < humidity:
+                    continue
+
+            if wind_speed is not None:
+                if wind_speed_min is not None and wind_speed_min > wind_speed:
+                    continue
+                if wind_speed_max is not None and wind_speed_max < wind_speed:
+                    continue
+
+            matches.append(rule)
+
+        # SQL 경로와 같은 순서 (id 순)
+        matches.sort(key=lambda rule: rule[0])
+        return [(rule[7], rule[8], rule[9], rule[10], rule[1], rule[2]) for rule in matches]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_outfit_index(db_name: str = "running_outfits.db") -> OutfitRuleIndex:
+    """DB 파일별 프로세스 공용 인덱스 반환"""
+    key = os.path.abspath(db_name)
+
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = OutfitRuleIndex(key)
+                _indexes[key] = index
+    return index
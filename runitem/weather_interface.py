@@ -6,6 +6,7 @@
 """
 
 from .database import RunningOutfitDB
+from .outfit_index import get_outfit_index
 from typing import Dict, List, Tuple, Optional
 
 
@@ -13,13 +14,22 @@ class WeatherInterface:
     """기상 정보와 복장 추천 시스템을 연동하는 인터페이스"""
 
     def __init__(self):
-        self.db = RunningOutfitDB()
-        self.db.connect()
+        # 추천 조회는 프로세스 공용 인메모리 인덱스 사용 (호출마다 DB 연결 없음)
+        self.index = get_outfit_index()
+        self._db = None
+
+    @property
+    def db(self) -> RunningOutfitDB:
+        """복장 데이터 편집용 DB 연결 (처음 사용할 때 연결)"""
+        if self._db is None:
+            self._db = RunningOutfitDB()
+            self._db.connect()
+        return self._db
 
     def __del__(self):
         """객체 소멸 시 데이터베이스 연결 종료"""
-        if hasattr(self, 'db'):
-            self.db.close()
+        if getattr(self, '_db', None) is not None:
+            self._db.close()
 
     def get_outfit_recommendation(self, weather_data: Dict) -> Dict:
         """
@@ -89,7 +99,7 @@ class WeatherInterface:
         datetime_str = weather_data.get('datetime', '알 수 없음')
 
         # 복장 추천 조회
-        results = self.db.get_recommendation(temperature, humidity, wind_speed)
+        results = self.index.get_recommendation(temperature, humidity, wind_speed)
 
         # 결과 포맷팅
         recommendations = []
@@ -142,7 +152,7 @@ class WeatherInterface:
         list of dict
             추천 복장 리스트
         """
-        results = self.db.get_recommendation(temperature, humidity, wind_speed)
+        results = self.index.get_recommendation(temperature, humidity, wind_speed)
 
         recommendations = []
         for result in results:
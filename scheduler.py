@@ -1,7 +1,10 @@
 """
 자동 업데이트 스케줄러
 - 매일 자정: 모든 저장된 지역의 날씨 업데이트
-- 3시간마다: 날씨 데이터 갱신
+- 1분마다: 수요 기반 갱신 계획(refresh_planner)에 따라 필요한 지역만 갱신
+- 여러 프로세스/서버에서 실행해도 DB 임대를 가진 리더 하나만 크롤링 일정 실행
+- 크롤링은 crawl_jobs 테이블을 통해 모든 프로세스의 워커가 나눠서 처리
+- 매일 새벽 2시 30분: 보존 기간이 지난 시간별 날씨를 일별 요약으로 압축 (리더만 실행)
 """
 
 import sys
@@ -9,50 +12,65 @@ sys.stdout.reconfigure(encoding='utf-8')
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from models import db, SavedLocation
-from weather_service import update_weather_for_region
+from crawl_engine import plan_region_crawls
+from refresh_planner import refresh_planner, collect_region_demand
+from leader_lease import LeaderLease
+from crawl_jobs import enqueue_crawls, crawl_state
+from crawl_worker import run_worker_tick, CRAWL_WORKER_BATCH, CRAWL_WORKER_INTERVAL
+from retention import compact_weather_history, WEATHER_RETENTION_DAYS
 from datetime import datetime
+import atexit
 
 
-def update_all_weather():
-    """모든 저장된 지역의 날씨 업데이트"""
-    print(f"\n{'='*60}")
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 날씨 자동 업데이트 시작")
-    print(f"{'='*60}")
+def refresh_tick(now=None):
+    """
+    갱신 계획에 따라 우선순위가 높은 지역만 크롤링 작업으로 등록 (1분마다, 리더만 실행)
+    실제 크롤링은 각 프로세스의 워커(crawl_worker)가 나눠서 처리
 
-    # 모든 unique 지역 코드 가져오기
-    unique_locations = db.session.query(
-        SavedLocation.region_code,
-        SavedLocation.region_name
-    ).distinct().all()
+    Returns:
+        list: 이번에 등록한 지역 코드
+    """
+    now = now or datetime.now()
+    schedule = refresh_planner.plan(collect_region_demand(), now, state=crawl_state())
+    codes = [entry['region_code'] for entry in schedule if entry['selected']]
+
+    if not codes:
+        return []
 
-    total = len(unique_locations)
-    success = 0
-    failed = 0
+    enqueue_crawls(codes)
+    print(f"[{now.strftime('%H:%M')}] 갱신 계획: {len(schedule)}개 중 {len(codes)}개 크롤링 등록 "
+          f"(예산 분당 {refresh_planner.budget_per_min}회)")
+    return codes
 
-    print(f"총 {total}개 지역 업데이트 예정\n")
 
-    for idx, (region_code, region_name) in enumerate(unique_locations, 1):
-        print(f"[{idx}/{total}] {region_name} (코드: {region_code})")
+def enqueue_all_weather():
+    """
+    모든 저장된 지역을 지역 코드당 1회 크롤링 작업으로 등록 (매일 자정, 리더만 실행)
 
-        try:
-            weather_url = f"https://weather.naver.com/today/{region_code}"
-            result = update_weather_for_region(region_code, weather_url)
+    Returns:
+        dict: {'locations', 'codes', 'queued', 'duplicates_avoided'}
+    """
+    # 모든 unique 지역 (지역 코드, 지역명)
+    unique_locations = db.session.query(
+        SavedLocation.region_code,
+        SavedLocation.region_name
+    ).distinct().all()
 
-            if result:
-                success += 1
-                print(f"✓ 성공\n")
-            else:
-                failed += 1
-                print(f"✗ 실패 (데이터 없음)\n")
+    plan = plan_region_crawls(unique_locations)
+    queued = enqueue_crawls(list(plan['codes']))
 
-        except Exception as e:
-            failed += 1
-            print(f"✗ 실패: {e}\n")
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 전체 {plan['locations']}개 지역 → "
+          f"{len(plan['codes'])}개 지역 코드 크롤링 등록 (신규 {queued}개, "
+          f"중복 크롤링 {plan['duplicates_avoided']}회 생략)")
 
-    print(f"{'='*60}")
-    print(f"업데이트 완료: 성공 {success}개, 실패 {failed}개")
-    print(f"{'='*60}\n")
+    return {
+        'locations': plan['locations'],
+        'codes': len(plan['codes']),
+        'queued': queued,
+        'duplicates_avoided': plan['duplicates_avoided']
+    }
 
 
 def init_scheduler(app):
@@ -63,11 +81,58 @@ def init_scheduler(app):
         app: Flask 애플리케이션 인스턴스
     """
     scheduler = BackgroundScheduler()
+    lease = LeaderLease()
 
-    # Flask 앱 컨텍스트 내에서 작업 실행
+    # Flask 앱 컨텍스트 내에서 작업 실행 (일정 등록은 리더 프로세스만)
     def job_with_context():
+        if not lease.is_leader:
+            return
+        with app.app_context():
+            enqueue_all_weather()
+
+    def tick_with_context():
+        if not lease.is_leader:
+            return
+        with app.app_context():
+            refresh_tick()
+
+    def retention_with_context():
+        if not lease.is_leader:
+            return
+        with app.app_context():
+            try:
+                compact_weather_history()
+            except Exception as e:
+                db.session.rollback()
+                print(f"✗ 날씨 보존 정리 오류: {e}")
+
+    def worker_with_context():
+        with app.app_context():
+            try:
+                run_worker_tick(lease.holder_id, CRAWL_WORKER_BATCH)
+            except Exception as e:
+                db.session.rollback()
+                print(f"✗ 크롤링 워커 오류: {e}")
+
+    def heartbeat_with_context():
+        with app.app_context():
+            lease.heartbeat()
+
+    def release_with_context():
         with app.app_context():
-            update_all_weather()
+            lease.release()
+
+    # 0. 리더 임대 획득/연장 (시작 즉시 1회 + 주기적으로)
+    heartbeat_with_context()
+    scheduler.add_job(
+        func=heartbeat_with_context,
+        trigger=IntervalTrigger(seconds=lease.heartbeat_interval),
+        id='leader_heartbeat',
+        name='스케줄러 리더 임대 갱신',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
 
     # 1. 매일 자정에 실행 (다음날 날씨 크롤링)
     scheduler.add_job(
@@ -78,16 +143,40 @@ def init_scheduler(app):
         replace_existing=True
     )
 
-    # 2. 매 10분마다 실행 (데이터 갱신)
+    # 2. 매분 갱신 계획 확인 (필요한 지역만, 분당 예산 안에서 크롤링)
     scheduler.add_job(
-        func=job_with_context,
-        trigger=CronTrigger(minute='*/10'),
-        id='periodic_update',
-        name='10분마다 날씨 갱신',
+        func=tick_with_context,
+        trigger=CronTrigger(minute='*'),
+        id='refresh_tick',
+        name='수요 기반 날씨 갱신',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+
+    # 3. 크롤링 작업 처리 (모든 프로세스)
+    scheduler.add_job(
+        func=worker_with_context,
+        trigger=IntervalTrigger(seconds=CRAWL_WORKER_INTERVAL),
+        id='crawl_worker',
+        name='크롤링 작업 처리',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+
+    # 4. 매일 새벽 2시 30분 보존 기간이 지난 시간별 날씨 압축 (새벽 갱신이 몰리기 전)
+    scheduler.add_job(
+        func=retention_with_context,
+        trigger=CronTrigger(hour=2, minute=30),
+        id='weather_retention',
+        name='시간별 날씨 일별 요약 압축',
+        max_instances=1,
+        coalesce=True,
         replace_existing=True
     )
 
-    # 3. 앱 시작 시 1회 실행 (선택사항)
+    # 5. 앱 시작 시 1회 실행 (선택사항)
     # scheduler.add_job(
     #     func=job_with_context,
     #     trigger='date',
@@ -97,18 +186,27 @@ def init_scheduler(app):
     # )
 
     scheduler.start()
+    atexit.register(release_with_context)
+    scheduler.lease = lease
 
-    print("✓ 스케줄러 시작됨")
-    print("  - 매일 자정: 날씨 업데이트")
-    print("  - 10분마다: 날씨 갱신\n")
+    print(f"✓ 스케줄러 시작됨 ({'리더' if lease.is_leader else '대기'}: {lease.holder_id})")
+    print("  - 매일 자정: 전체 지역 크롤링 등록")
+    print(f"  - 1분마다: 수요 기반 날씨 갱신 등록 (분당 최대 {refresh_planner.budget_per_min}개 지역)")
+    print(f"  - {CRAWL_WORKER_INTERVAL:.0f}초마다: 크롤링 작업 처리 (최대 {CRAWL_WORKER_BATCH}개)")
+    print(f"  - 매일 02:30: {WEATHER_RETENTION_DAYS}일 지난 시간별 날씨 일별 요약으로 압축")
+    print(f"  - {lease.heartbeat_interval:.0f}초마다: 리더 임대 갱신 (임대 {lease.ttl:.0f}초)\n")
 
     return scheduler
 
 
 if __name__ == '__main__':
-    # 테스트용
+    # 테스트용: 전체 지역 등록 후 이 프로세스에서 대기열을 모두 처리
     from app import app
+    from leader_lease import make_holder_id
 
     with app.app_context():
         print("테스트: 날씨 업데이트 실행\n")
-        update_all_weather()
+        enqueue_all_weather()
+        owner = make_holder_id()
+        while run_worker_tick(owner, CRAWL_WORKER_BATCH):
+            pass
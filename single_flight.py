@@ -0,0 +1,163 @@
+"""
+단일 실행(single-flight) 크롤링 조정
+- 같은 지역 코드를 동시에 여러 곳(웹 요청, 스케줄러)에서 크롤링하면 한 번만 실행
+- 나중에 온 호출은 진행 중인 크롤링에 합류해 같은 결과를 공유
+- 최근(신선도 시간 이내)에 끝난 결과는 메모리에서 바로 반환
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import os
+import threading
+import time
+
+
+# 크롤링 결과를 재사용하는 시간 (초, 0이면 진행 중 합류만)
+CRAWL_FRESHNESS = float(os.environ.get('CRAWL_FRESHNESS_SECONDS', '120'))
+
+
+class _Call:
+    """진행 중인 실행 1건"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+    def wait(self, timeout=None):
+        """
+        실행 완료까지 대기
+
+        Raises:
+            TimeoutError: timeout 안에 끝나지 않음
+            Exception: 실행 중 발생한 예외
+        """
+        if not self.event.wait(timeout):
+            raise TimeoutError('진행 중인 크롤링 대기 시간 초과')
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """키(지역 코드)별 단일 실행 + 최근 결과 재사용"""
+
+    def __init__(self, freshness=CRAWL_FRESHNESS, is_cacheable=None):
+        """
+        Args:
+            freshness: 결과 재사용 시간 (초)
+            is_cacheable: 결과를 재사용할지 판단하는 함수 (None이면 None이 아닌 결과 모두)
+        """
+        self.freshness = freshness
+        self.is_cacheable = is_cacheable or (lambda result: result is not None)
+        self._calls = {}
+        self._recent = {}
+        self._lock = threading.Lock()
+        self._stats = {'executed': 0, 'joined': 0, 'fresh_hits': 0}
+
+    def _fresh_locked(self, key):
+        entry = self._recent.get(key)
+        if entry is None:
+            return None
+        finished_at, result = entry
+        if time.monotonic() - finished_at > self.freshness:
+            del self._recent[key]
+            return None
+        return result
+
+    def fresh(self, key):
+        """신선도 시간 이내의 결과 (없으면 None)"""
+        with self._lock:
+            result = self._fresh_locked(key)
+            if result is not None:
+                self._stats['fresh_hits'] += 1
+            return result
+
+    def acquire(self, key):
+        """
+        실행 권한 획득
+
+        Returns:
+            tuple: (_Call, leader 여부)
+                   leader면 직접 실행 후 반드시 complete() 호출, 아니면 _Call.wait()로 합류
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats['joined'] += 1
+                return call, False
+
+            call = _Call()
+            self._calls[key] = call
+            self._stats['executed'] += 1
+            return call, True
+
+    def complete(self, key, call, result=None, error=None):
+        """leader의 실행 결과를 기록하고 대기 중인 호출을 깨움"""
+        call.result = result
+        call.error = error
+
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+            if error is None and self.freshness > 0 and self.is_cacheable(result):
+                now = time.monotonic()
+                self._recent[key] = (now, result)
+
+                # 만료된 결과 정리
+                expired = [k for k, (finished_at, _) in self._recent.items()
+                           if now - finished_at > self.freshness]
+                for k in expired:
+                    del self._recent[k]
+
+        call.event.set()
+
+    def do(self, key, fn, timeout=None):
+        """
+        fn()을 키별로 한 번만 실행 (최근 결과 → 진행 중 합류 → 직접 실행 순서)
+
+        Args:
+            key: 지역 코드
+            fn: 실행할 함수
+            timeout: 합류 시 최대 대기 시간 (초)
+
+        Returns:
+            fn()의 결과
+        """
+        result = self.fresh(key)
+        if result is not None:
+            return result
+
+        call, leader = self.acquire(key)
+        if not leader:
+            return call.wait(timeout)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.complete(key, call, error=e)
+            raise
+
+        self.complete(key, call, result=result)
+        return result
+
+    def in_flight(self, key):
+        """키가 현재 실행 중인지"""
+        with self._lock:
+            return key in self._calls
+
+    def stats(self):
+        """실행/합류/재사용 횟수"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+            stats['recent'] = len(self._recent)
+        return stats
+
+
+# 프로세스 전체에서 공유하는 크롤링 single-flight (시간별 데이터가 있는 결과만 재사용)
+crawl_flight = SingleFlight(is_cacheable=lambda result: bool(result and result.get('hourly')))
@@ -0,0 +1,285 @@
+"""
+태양 위치 계산 (일출/일몰, 시민/항해 박명)
+- NOAA 태양 계산식(Meeus)을 NumPy로 벡터화해 (위도, 경도, 날짜) 배열을 한 번에 계산
+- 좌표(소수 둘째 자리, 약 1km)별로 윤년 주기 4년 × 366일 × 이벤트 표를 int16(한국 시간 0시부터 분)으로 만들어 디스크에 캐시
+  → 요청마다 하는 일은 배열 인덱스 조회뿐
+- 표의 분은 초를 버린 값 (suntime 시절 화면의 HH:MM 표시와 같은 방식)
+- 연도 행은 (연도 % 4)로 찾음 (캐시 파일은 주기가 바뀌면 새 주기로 다시 계산)
+
+사용 예:
+    python solar.py 37.5665 126.9780      # 오늘의 박명/일출/일몰
+    python solar.py 37.5665 126.9780 --date 2025-06-21
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+
+# 표 캐시 파일 경로
+SOLAR_TABLE_PATH = os.environ.get(
+    'SOLAR_TABLE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'solar_table.npz')
+)
+
+SOLAR_TABLE_VERSION = 2
+KST_OFFSET_MINUTES = 9 * 60
+COORD_PRECISION = 2  # 좌표 반올림 자릿수
+MISSING = -1  # 해당 이벤트가 없는 날 (극지방 등)
+REFERENCE_YEAR = 2024  # 366일을 모두 가진 윤년 (표의 날짜 순서 기준)
+CYCLE_YEARS = 4  # 윤년 주기 (표의 연도 행 수)
+
+# 이벤트 이름: 태양 천정각 (도), 아침(True)/저녁(False)
+EVENTS = (
+    ('nautical_dawn', 102.0, True),
+    ('civil_dawn', 96.0, True),
+    ('sunrise', 90.833, True),
+    ('sunset', 90.833, False),
+)
+EVENT_NAMES = tuple(name for name, _, _ in EVENTS)
+
+
+def _sun_position(jd):
+    """율리우스일 배열 → (적위 라디안, 균시차 분)"""
+    t = (jd - 2451545.0) / 36525.0
+    l0 = np.radians((280.46646 + t * (36000.76983 + t * 0.0003032)) % 360)
+    m = np.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    e = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    c = np.radians(
+        np.sin(m) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + np.sin(2 * m) * (0.019993 - 0.000101 * t)
+        + np.sin(3 * m) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * t)
+    apparent_long = l0 + c - np.radians(0.00569 + 0.00478 * np.sin(omega))
+
+    obliquity = np.radians(
+        23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+        + 0.00256 * np.cos(omega)
+    )
+    declination = np.arcsin(np.sin(obliquity) * np.sin(apparent_long))
+
+    y = np.tan(obliquity / 2) ** 2
+    equation_of_time = 4 * np.degrees(
+        y * np.sin(2 * l0) - 2 * e * np.sin(m) + 4 * e * y * np.sin(m) * np.cos(2 * l0)
+        - 0.5 * y * y * np.sin(4 * l0) - 1.25 * e * e * np.sin(2 * m)
+    )
+    return declination, equation_of_time
+
+
+def _event_utc_minutes(lat, lng, jd_midnight, zenith, morning):
+    """UTC 0시 기준 이벤트 시각(분), 없으면 NaN (두 번 반복해 이벤트 시각의 태양 위치로 보정)"""
+    lat_rad = np.radians(lat)
+    cos_zenith = np.cos(np.radians(zenith))
+    sign = -1.0 if morning else 1.0
+
+    minutes = 720.0 - 4.0 * lng
+    for _ in range(2):
+        declination, equation_of_time = _sun_position(jd_midnight + minutes / 1440.0)
+        cos_ha = cos_zenith / (np.cos(lat_rad) * np.cos(declination)) - np.tan(lat_rad) * np.tan(declination)
+        with np.errstate(invalid='ignore'):
+            hour_angle = np.degrees(np.arccos(cos_ha))
+        minutes = 720.0 - 4.0 * lng - equation_of_time + sign * 4.0 * hour_angle
+
+    return minutes
+
+
+def solar_events(lat, lng, dates):
+    """
+    (위도, 경도, 날짜) 배열의 박명/일출/일몰 시각 계산 (브로드캐스팅 지원)
+
+    Args:
+        lat: 위도 배열 (도)
+        lng: 경도 배열 (도, 동경 +)
+        dates: datetime64[D] 배열 또는 date 리스트 (한국 날짜)
+
+    Returns:
+        dict: {이벤트 이름: 한국 시간 0시부터 분 (float 배열, 없으면 NaN)}
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lng = np.asarray(lng, dtype=np.float64)
+    days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+
+    # 같은 날짜 UTC 0시의 율리우스일 (한국 이벤트는 UTC로 전날 밤일 수 있어 분이 음수가 될 수 있음)
+    jd_midnight = days + 2440587.5
+    lat, lng, jd_midnight = np.broadcast_arrays(lat, lng, jd_midnight)
+
+    return {
+        name: _event_utc_minutes(lat, lng, jd_midnight, zenith, morning) + KST_OFFSET_MINUTES
+        for name, zenith, morning in EVENTS
+    }
+
+
+def coord_key(lat, lng):
+    """표 조회용 좌표 키 (소수 둘째 자리 반올림, 같은 키면 같은 일출/박명 시각)"""
+    return (round(float(lat), COORD_PRECISION), round(float(lng), COORD_PRECISION))
+
+
+def _day_index(target_date):
+    """날짜 → 표의 (연도 행, 열 번호) (열은 윤년 기준 (월, 일) 순서 0~365)"""
+    return (
+        target_date.year % CYCLE_YEARS,
+        date(REFERENCE_YEAR, target_date.month, target_date.day).timetuple().tm_yday - 1
+    )
+
+
+def _cycle_start(year):
+    """year가 속한 윤년 주기의 첫 해"""
+    return year - year % CYCLE_YEARS
+
+
+def _table_dates(cycle_start):
+    """
+    표 계산용 날짜 (연도 % 4 행 × 366칸)
+    평년의 2월 29일 칸은 조회되지 않으므로 2월 28일로 채움
+    """
+    slots = np.arange(np.datetime64(f'{REFERENCE_YEAR}-01-01'), np.datetime64(f'{REFERENCE_YEAR + 1}-01-01'))
+    dates = np.empty((CYCLE_YEARS, len(slots)), dtype='datetime64[D]')
+    for year in range(cycle_start, cycle_start + CYCLE_YEARS):
+        for j, slot in enumerate(slots.astype(date).tolist()):
+            try:
+                dates[year % CYCLE_YEARS, j] = slot.replace(year=year)
+            except ValueError:
+                dates[year % CYCLE_YEARS, j] = date(year, 2, 28)
+    return dates
+
+
+class SolarTable:
+    """좌표별 윤년 주기 4년치 박명/일출/일몰 표 (int16 분, 디스크 캐시)"""
+
+    def __init__(self, path=SOLAR_TABLE_PATH, cycle_start=None):
+        self.path = path
+        self.cycle_start = cycle_start if cycle_start is not None else _cycle_start(date.today().year)
+        self._lock = threading.Lock()
+        self._index = {}
+        self._table = np.empty((0, CYCLE_YEARS, 366, len(EVENTS)), dtype=np.int16)
+        self._loaded = False
+        self._stats = {'hits': 0, 'computed': 0}
+
+    def _load(self):
+        """캐시 파일 읽기 (없거나 형식이 다르면 빈 표)"""
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if int(data['version']) != SOLAR_TABLE_VERSION or tuple(data['events']) != EVENT_NAMES:
+                    print("일출/박명 표 형식이 바뀌어 다시 계산합니다.")
+                    return
+                if int(data['cycle_start']) != self.cycle_start:
+                    print(f"일출/박명 표를 {self.cycle_start}년 주기로 다시 계산합니다.")
+                    return
+                coords = data['coords']
+                self._table = data['table']
+            self._index = {coord_key(lat, lng): i for i, (lat, lng) in enumerate(coords.tolist())}
+        except Exception as e:
+            print(f"✗ 일출/박명 표 읽기 실패, 다시 계산합니다: {e}")
+
+    def _save(self):
+        """캐시 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        coords = np.array(sorted(self._index, key=self._index.get), dtype=np.float64).reshape(-1, 2)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, version=np.int16(SOLAR_TABLE_VERSION), events=np.array(EVENT_NAMES),
+                         cycle_start=np.int16(self.cycle_start), coords=coords, table=self._table)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"✗ 일출/박명 표 저장 실패: {e}")
+
+    def ensure(self, coords):
+        """
+        좌표 목록의 표가 없으면 한 번에 계산해 추가
+
+        Args:
+            coords: (위도, 경도) 목록
+
+        Returns:
+            list: 좌표별 표 행 번호
+        """
+        keys = [coord_key(lat, lng) for lat, lng in coords]
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            missing = list(dict.fromkeys(key for key in keys if key not in self._index))
+            if missing:
+                # (좌표, 연도, 366일)을 한 번에 계산 (초는 버림)
+                lats = np.array([key[0] for key in missing])[:, None, None]
+                lngs = np.array([key[1] for key in missing])[:, None, None]
+                dates = _table_dates(self.cycle_start)
+
+                events = solar_events(lats, lngs, dates[None])
+                rows = np.stack([
+                    np.where(np.isnan(events[name]), MISSING, np.floor(events[name])).astype(np.int16)
+                    for name in EVENT_NAMES
+                ], axis=-1)
+
+                for key in missing:
+                    self._index[key] = len(self._index)
+                self._table = np.concatenate([self._table, rows])
+                self._stats['computed'] += len(missing)
+                self._save()
+
+            return [self._index[key] for key in keys]
+
+    def minutes(self, lat, lng, target_date):
+        """
+        한 좌표/날짜의 이벤트 시각 (한국 시간 0시부터 분)
+
+        Returns:
+            dict: {이벤트 이름: 분 (없으면 None)}
+        """
+        row = self.ensure([(lat, lng)])[0]
+        year_row, day = _day_index(target_date)
+        values = self._table[row, year_row, day].tolist()
+        self._stats['hits'] += 1
+        return {name: (None if value == MISSING else value) for name, value in zip(EVENT_NAMES, values)}
+
+    def events(self, lat, lng, target_date):
+        """
+        한 좌표/날짜의 이벤트 시각
+
+        Returns:
+            dict: {이벤트 이름: datetime (한국 시간, 없으면 None)}
+        """
+        midnight = datetime.combine(target_date, datetime.min.time())
+        return {
+            name: (None if value is None else midnight + timedelta(minutes=value))
+            for name, value in self.minutes(lat, lng, target_date).items()
+        }
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, coords=len(self._index), bytes=int(self._table.nbytes))
+
+
+# 앱 전역 표
+solar_table = SolarTable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='박명/일출/일몰 계산')
+    parser.add_argument('lat', type=float, help='위도')
+    parser.add_argument('lng', type=float, help='경도')
+    parser.add_argument('--date', type=date.fromisoformat, default=None, help='날짜 (YYYY-MM-DD, 기본 오늘)')
+    args = parser.parse_args()
+
+    target_date = args.date or date.today()
+    table = SolarTable(path=None)
+    for name, value in table.events(args.lat, args.lng, target_date).items():
+        print(f"  {name:<14} {value.strftime('%H:%M') if value else '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,11 @@ document.addEventListener('DOMContentLoaded', function() {
     if (updateAllBtn) {
         updateAllBtn.addEventListener('click', updateAllWeather);
     }
+
+    // 대시보드: 서버에서 날씨 갱신 알림을 받으면 해당 카드만 갱신
+    if (document.querySelector('.location-card')) {
+        subscribeWeatherUpdates();
+    }
 });
 
 // 다크모드 관리
@@ -93,6 +98,78 @@ const utils = {
     }
 };
 
+// 백그라운드 작업 완료까지 상태 폴링
+async function waitForJob(jobId, onProgress, intervalMs = 1000, timeoutMs = 120000) {
+    const deadline = Date.now() + timeoutMs;
+
+    while (Date.now() < deadline) {
+        const response = await fetch(`/api/jobs/${jobId}`);
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.error || '작업 상태 조회 실패');
+        }
+
+        if (onProgress) {
+            onProgress(data.job);
+        }
+
+        if (data.job.status === 'done' || data.job.status === 'failed') {
+            return data.job;
+        }
+
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+
+    throw new Error('작업이 제한 시간 안에 끝나지 않았습니다.');
+}
+
+// 대시보드 지역 카드 하나만 다시 그리기
+async function refreshLocationCard(locationId) {
+    const card = document.getElementById(`location-card-${locationId}`);
+    if (!card) {
+        return false;
+    }
+
+    const response = await fetch(`/api/location_card/${locationId}`);
+    const data = await response.json();
+
+    if (!response.ok) {
+        throw new Error(data.error || '카드 조회 실패');
+    }
+
+    card.outerHTML = data.html;
+    return true;
+}
+
+// 날씨 갱신 알림 구독 (Server-Sent Events, 끊기면 브라우저가 자동 재연결)
+function subscribeWeatherUpdates() {
+    if (!window.EventSource) {
+        return null;
+    }
+
+    const source = new EventSource('/api/stream');
+
+    source.addEventListener('weather', (event) => {
+        const data = JSON.parse(event.data);
+
+        document.querySelectorAll(`.location-card[data-region-code="${data.region_code}"]`).forEach(card => {
+            refreshLocationCard(card.dataset.locationId).catch(error => {
+                console.log('카드 갱신 실패:', error);
+            });
+        });
+    });
+
+    // 서버가 연결을 거절하면(503, 연결 수 초과) 브라우저가 재연결하지 않으므로 잠시 후 직접 다시 연결
+    source.addEventListener('error', () => {
+        if (source.readyState === EventSource.CLOSED) {
+            setTimeout(subscribeWeatherUpdates, 60000);
+        }
+    });
+
+    return source;
+}
+
 // 전체 날씨 업데이트
 async function updateAllWeather(e) {
     e.preventDefault();
@@ -125,22 +202,52 @@ async function updateAllWeather(e) {
             throw new Error(data.error || '업데이트 실패');
         }
 
-        alert(data.message);
+        // 지역이 하나 끝날 때마다 해당 카드만 갱신
+        const refreshed = new Set();
+        const hasCards = document.querySelector('.location-card') !== null;
+
+        const job = await waitForJob(data.job_id, (job) => {
+            const progress = job.progress || {};
+            if (progress.total) {
+                btn.innerHTML = `<i class="bi bi-hourglass-split"></i> 업데이트 중... (${progress.done}/${progress.total})`;
+            }
+
+            Object.entries(progress.locations || {}).forEach(([locationId, status]) => {
+                if (status === 'done' && !refreshed.has(locationId)) {
+                    refreshed.add(locationId);
+                    refreshLocationCard(locationId).catch(error => {
+                        console.log('카드 갱신 실패:', error);
+                    });
+                }
+            });
+        });
 
-        // 페이지 새로고침
-        window.location.reload();
+        if (job.status === 'failed') {
+            throw new Error(job.error || '업데이트 실패');
+        }
+
+        alert(job.result.message);
+
+        // 카드가 없는 페이지(주간 예보 등)는 새로고침
+        if (!hasCards) {
+            window.location.reload();
+            return;
+        }
 
     } catch (error) {
         alert('날씨 업데이트 중 오류가 발생했습니다: ' + error.message);
-
-        // 원래 상태로 복구
-        btn.innerHTML = originalText;
-        btn.classList.remove('disabled');
     }
+
+    // 원래 상태로 복구
+    btn.innerHTML = originalText;
+    btn.classList.remove('disabled');
 }
 
 // 전역으로 사용 가능하도록 설정
 window.weatherApp = {
     utils: utils,
+    waitForJob: waitForJob,
+    refreshLocationCard: refreshLocationCard,
+    subscribeWeatherUpdates: subscribeWeatherUpdates,
     updateAllWeather: updateAllWeather
 };
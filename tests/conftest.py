@@ -0,0 +1,57 @@
+"""
+pytest 공용 설정
+- 저장소 루트를 import 경로에 추가
+- DB/캐시 파일은 임시 작업 디렉토리에 만들어 작업 트리를 건드리지 않음
+  (app을 import하기 전에 DATABASE_URL 등을 설정해야 하므로 모듈 로드 시점에 처리)
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, 'tests', 'fixtures')
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+WORKDIR = tempfile.mkdtemp(prefix='dawn_running_tests_')
+os.chdir(WORKDIR)
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(WORKDIR, 'weather.db')}")
+os.environ.setdefault('SOLAR_TABLE_PATH', os.path.join(WORKDIR, 'solar_table.npz'))
+
+import pytest
+
+
+def read_fixture(name):
+    """tests/fixtures의 파일 내용"""
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def outfit_db():
+    """작업 디렉토리에 샘플 복장 DB 생성 (WeatherInterface 기본 경로)"""
+    from runitem.database import RunningOutfitDB
+
+    outfit = RunningOutfitDB(os.path.join(WORKDIR, 'running_outfits.db'))
+    outfit.connect()
+    outfit.create_tables()
+    if not outfit.get_all_outfits():
+        outfit.initialize_sample_data()
+    outfit.close()
+    return outfit.db_name
+
+
+@pytest.fixture
+def app():
+    """빈 테이블로 시작하는 Flask 앱 (테스트마다 초기화)"""
+    from app import app as flask_app
+    from models import db
+
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+    yield flask_app
+    with flask_app.app_context():
+        db.session.remove()
@@ -0,0 +1,108 @@
+"""
+브라우저 풀 슬롯 시작 실패 처리 테스트 (작업이 JOB_TIMEOUT까지 기다리지 않고 바로 실패)
+"""
+
+import threading
+import time
+
+import pytest
+import playwright.sync_api
+
+import browser_pool
+from browser_pool import BrowserPool
+
+
+class FakeContext:
+    def close(self):
+        pass
+
+
+class FakeBrowser:
+    def new_context(self, **options):
+        return FakeContext()
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class FakePlaywright:
+    class chromium:
+        @staticmethod
+        def launch(headless=True):
+            return FakeBrowser()
+
+    def stop(self):
+        pass
+
+
+def fake_sync_playwright(failures, gate=None):
+    """처음 failures번은 start()가 실패하는 sync_playwright 대체 (gate가 있으면 열릴 때까지 시작 지연)"""
+    lock = threading.Lock()
+    remaining = [failures]
+
+    class Starter:
+        def start(self):
+            if gate is not None:
+                gate.wait(5)
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] >= 0:
+                    raise RuntimeError('driver exited')
+            return FakePlaywright()
+
+    return Starter
+
+
+@pytest.fixture
+def quiet(capsys):
+    yield
+    capsys.readouterr()
+
+
+def test_jobs_fail_fast_when_every_slot_fails(monkeypatch, quiet):
+    gate = threading.Event()
+    monkeypatch.setattr(playwright.sync_api, 'sync_playwright', fake_sync_playwright(failures=2, gate=gate))
+
+    pool = BrowserPool(size=2)
+    # 슬롯이 실패하기 전에 들어간 작업도 바로 실패
+    future = pool.submit(lambda context: 'ok')
+    gate.set()
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match='브라우저를 시작할 수 없습니다'):
+        future.result(timeout=5)
+    assert time.monotonic() - started < 5
+
+    assert pool.failed
+    assert [slot['alive'] for slot in pool.stats()] == [False, False]
+    with pytest.raises(RuntimeError, match='driver exited'):
+        pool.run(lambda context: 'ok', timeout=5)
+    pool.shutdown()
+
+
+def test_remaining_slot_serves_jobs(monkeypatch, quiet):
+    monkeypatch.setattr(playwright.sync_api, 'sync_playwright', fake_sync_playwright(failures=1))
+
+    pool = BrowserPool(size=2)
+    assert [pool.run(lambda context, i=i: i, timeout=5) for i in range(5)] == list(range(5))
+    assert not pool.failed
+    assert sorted(slot['alive'] for slot in pool.stats()) == [False, True]
+    pool.shutdown()
+
+
+def test_shared_pool_is_recreated_after_startup_failure(monkeypatch, quiet):
+    monkeypatch.setattr(playwright.sync_api, 'sync_playwright', fake_sync_playwright(failures=1))
+    monkeypatch.setattr(browser_pool, 'POOL_SIZE', 1)
+    monkeypatch.setattr(browser_pool, '_pool', BrowserPool(size=1))
+
+    failed = browser_pool._pool
+    with pytest.raises(RuntimeError):
+        failed.run(lambda context: 'ok', timeout=5)
+
+    pool = browser_pool.get_browser_pool()
+    assert pool is not failed
+    assert pool.run(lambda context: 'ok', timeout=5) == 'ok'
+    pool.shutdown()
@@ -0,0 +1,155 @@
+"""
+지역코드 일괄 생성 도구 테스트 (로컬 http.server 대체 서버로 429/5xx 재시도, 체크포인트 이어서 실행)
+"""
+
+import csv
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import build_region_codes
+from build_region_codes import build_region_codes as build, read_checkpoint
+
+REGIONS = [
+    ('대전광역시 유성구 송강동', 36.43, 127.38),
+    ('서울특별시 강남구 자곡동', 37.47, 127.10),
+    ('서울특별시 강남구 논현동', 37.51, 127.03),
+    ('부산광역시 해운대구 우동', 35.16, 129.16),
+    ('제주특별자치도 제주시 일도1동', 33.51, 126.53),
+]
+CODES = {
+    (36.43, 127.38): '07200147',
+    (37.47, 127.10): '09680101',
+    (37.51, 127.03): '09680102',
+    (35.16, 129.16): '08350101',
+    (33.51, 126.53): '14110101',
+}
+
+
+class StubNaver:
+    """좌표별로 정해둔 상태 코드를 차례로 돌려주는 naverRgnCatForCoords 대체 서버"""
+
+    def __init__(self):
+        self.scripts = {}  # (lat, lng) → [상태 코드, ...] (다 쓰면 200)
+        self.requests = []
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                coords = (float(params['lat'][0]), float(params['lng'][0]))
+                with stub._lock:
+                    stub.requests.append(coords)
+                    script = stub.scripts.get(coords, [])
+                    status = script.pop(0) if script else 200
+
+                body = b''
+                if url.path != '/api/naverRgnCatForCoords':
+                    status = 404
+                elif status == 200:
+                    body = json.dumps({'regionCode': CODES.get(coords)}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def count(self, coords):
+        with self._lock:
+            return self.requests.count(coords)
+
+
+@pytest.fixture
+def stub():
+    server = StubNaver()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.fixture
+def backoff(monkeypatch):
+    """재시도 대기를 실제로 기다리지 않고 기록"""
+    delays = []
+    monkeypatch.setattr(build_region_codes.time, 'sleep', delays.append)
+    return delays
+
+
+def run(stub, tmp_path, regions=REGIONS):
+    return build(regions, output_path=str(tmp_path / 'region_codes.csv'),
+                 base_url=stub.base_url, concurrency=2, rate=0, timeout=5)
+
+
+def read_output(tmp_path):
+    with open(tmp_path / 'region_codes.csv', encoding='utf-8', newline='') as f:
+        return {record['region_name']: record['region_code'] for record in csv.DictReader(f)}
+
+
+def test_retries_429_and_5xx(stub, tmp_path, backoff, capsys):
+    songgang, jagok, nonhyeon, udong, ildo = [(lat, lng) for _, lat, lng in REGIONS]
+    stub.scripts = {
+        songgang: [429],             # 한 번 재시도 후 성공
+        jagok: [503, 500],           # 두 번 재시도 후 성공
+        nonhyeon: [500, 502, 504],   # 재시도 횟수 초과 → 실패
+        udong: [404],                # 4xx(429 제외)는 재시도 없이 실패
+    }
+
+    stats = run(stub, tmp_path)
+
+    assert stats == {'total': 5, 'skipped': 0, 'resolved': 3, 'failed': 2}
+    assert stub.count(songgang) == 2
+    assert stub.count(jagok) == 3
+    assert stub.count(nonhyeon) == build_region_codes.MAX_ATTEMPTS
+    assert stub.count(udong) == 1
+    assert stub.count(ildo) == 1
+    # 지수 백오프 (0.5초, 1초)
+    assert sorted(backoff) == [0.5, 0.5, 0.5, 1.0, 1.0]
+
+    assert read_output(tmp_path) == {
+        '대전광역시 유성구 송강동': '07200147',
+        '서울특별시 강남구 자곡동': '09680101',
+        '제주특별자치도 제주시 일도1동': '14110101',
+    }
+    capsys.readouterr()
+
+
+def test_resumes_from_checkpoint(stub, tmp_path, backoff, capsys):
+    failing = [(lat, lng) for _, lat, lng in REGIONS[3:]]
+    stub.scripts = {coords: [500] * build_region_codes.MAX_ATTEMPTS for coords in failing}
+
+    first = run(stub, tmp_path)
+    assert first['resolved'] == 3 and first['failed'] == 2
+    checkpoint_path = tmp_path / 'region_codes.csv.checkpoint.jsonl'
+    assert set(read_checkpoint(str(checkpoint_path))) == {name for name, _, _ in REGIONS[:3]}
+
+    # 중단 시 잘린 마지막 줄은 무시
+    with open(checkpoint_path, 'a', encoding='utf-8') as f:
+        f.write('{"region_name": "부산광역시 해운')
+
+    stub.requests.clear()
+    second = run(stub, tmp_path)
+
+    assert second == {'total': 5, 'skipped': 3, 'resolved': 2, 'failed': 0}
+    # 체크포인트에 있는 지역은 다시 요청하지 않음
+    assert sorted(stub.requests) == sorted(failing)
+    assert read_output(tmp_path) == {name: CODES[(lat, lng)] for name, lat, lng in REGIONS}
+
+    stub.requests.clear()
+    third = run(stub, tmp_path)
+    assert third == {'total': 5, 'skipped': 5, 'resolved': 0, 'failed': 0}
+    assert stub.requests == []
+    capsys.readouterr()
@@ -0,0 +1,70 @@
+"""
+크롤링 작업 큐 테스트 (워커가 크롤링 중인 지역에 들어온 갱신 요청이 사라지지 않음)
+"""
+
+from datetime import datetime, timedelta
+
+from models import db, RegionCrawlJob
+from crawl_jobs import enqueue_crawls, claim_crawls, record_crawl_outcomes
+
+REGION = '07200147'
+
+
+def job():
+    return RegionCrawlJob.query.filter_by(region_code=REGION).one()
+
+
+def test_request_during_lease_is_kept_after_success(app):
+    with app.app_context():
+        assert enqueue_crawls([REGION]) == 1
+        assert claim_crawls('worker-a', 10) == [REGION]
+
+        # 크롤링 중에 다시 요청 → 대기열에 새로 들어간 것으로 셈
+        requested = datetime.utcnow() + timedelta(minutes=5)
+        assert enqueue_crawls([REGION], due_at=requested) == 1
+        assert enqueue_crawls([REGION], due_at=requested + timedelta(minutes=5)) == 0
+        assert job().requeue_at == requested
+
+        record_crawl_outcomes({REGION: (2, 24)}, {}, owner='worker-a')
+        assert job().due_at == requested
+        assert job().requeue_at is None
+        assert job().lease_owner is None
+
+
+def test_success_without_request_clears_due_at(app):
+    with app.app_context():
+        enqueue_crawls([REGION])
+        claim_crawls('worker-a', 10)
+        record_crawl_outcomes({REGION: (0, 24)}, {}, owner='worker-a')
+        assert job().due_at is None
+
+
+def test_new_claim_covers_earlier_request(app):
+    """임대가 만료되어 다른 워커가 가져가면 그 크롤링이 이전 요청을 처리"""
+    with app.app_context():
+        enqueue_crawls([REGION])
+        claim_crawls('worker-a', 10)
+        enqueue_crawls([REGION])
+        assert job().requeue_at is not None
+
+        # worker-a 임대 만료 후 worker-b가 가져감
+        job().lease_expiry = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        assert claim_crawls('worker-b', 10) == [REGION]
+        assert job().requeue_at is None
+
+        record_crawl_outcomes({REGION: (0, 24)}, {}, owner='worker-b')
+        assert job().due_at is None
+
+
+def test_failure_retries_with_backoff(app):
+    with app.app_context():
+        enqueue_crawls([REGION])
+        claim_crawls('worker-a', 10)
+        enqueue_crawls([REGION])
+
+        when = datetime.utcnow()
+        record_crawl_outcomes({}, {REGION: '타임아웃'}, when=when, owner='worker-a')
+        assert job().due_at == when + timedelta(seconds=60)
+        assert job().requeue_at is None
+        assert job().attempts == 1
@@ -0,0 +1,126 @@
+"""
+대시보드 조회 쿼리 수 테스트 (지역 수와 관계없이 일정해야 함)
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from models import db, User, SavedLocation
+from weather_service import save_weather_to_db, get_dashboard_weather
+from fragment_cache import fragment_cache
+
+NOW = datetime(2024, 11, 28, 9, 30)
+
+
+def weather_rows(region_code, temperature):
+    """오늘/내일 이틀치 시간별 데이터"""
+    rows = []
+    for offset in range(2):
+        for hour in range(24):
+            rows.append({
+                'region_code': region_code,
+                'date': NOW.date() + timedelta(days=offset),
+                'hour': hour,
+                'temperature': temperature,
+                'weather_status': '맑음',
+                'precipitation_prob': 10,
+                'precipitation_amount': '-',
+                'humidity': 60,
+                'wind_direction': '북풍',
+                'wind_speed': 2.0
+            })
+    return rows
+
+
+def add_user(username, location_count):
+    """지역 location_count개를 저장한 사용자 생성 (사용자 id 반환)"""
+    user = User(username=username)
+    user.set_password('pw')
+    db.session.add(user)
+    db.session.flush()
+
+    for i in range(location_count):
+        region_code = f'0911{i:04d}'
+        save_weather_to_db(weather_rows(region_code, 5 + i))
+        db.session.add(SavedLocation(
+            user_id=user.id, region_name=f'테스트동 {i}', region_code=region_code,
+            lat=37.5 + i * 0.1, lng=127.0 + i * 0.1
+        ))
+    db.session.commit()
+    return user.id
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 수"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def dashboard_queries(user_id):
+    # 새 세션에서 지역만 읽은 상태로 시작 (이전 단계의 식별자 맵 재사용 방지)
+    db.session.remove()
+    locations = SavedLocation.query.filter_by(user_id=user_id).all()
+    with count_queries() as statements:
+        weather_info = get_dashboard_weather(locations, now=NOW)
+    assert len(weather_info) == len(locations)
+    assert all(info['current'] is not None for info in weather_info)
+    assert all(info['tomorrow']['outfit_recommendation'] for info in weather_info)
+    return len(statements)
+
+
+def test_dashboard_weather_query_count_is_constant(app):
+    with app.app_context():
+        one = add_user('one', 1)
+        many = add_user('many', 6)
+
+        # 시간별 데이터 1번 + 오늘/내일 요약 2번
+        assert dashboard_queries(one) == dashboard_queries(many) == 3
+
+
+def test_dashboard_weather_without_summaries(app):
+    """요약이 없는(요약 도입 전) 데이터도 추가 쿼리 없이 시간별 데이터로 계산"""
+    from models import RegionDaySummary
+
+    with app.app_context():
+        one = add_user('one', 1)
+        many = add_user('many', 5)
+        with_summaries = dashboard_queries(many)
+
+        RegionDaySummary.query.delete()
+        db.session.commit()
+
+        assert dashboard_queries(one) == dashboard_queries(many) == with_summaries
+
+
+@pytest.mark.parametrize('location_counts', [(1, 8)])
+def test_dashboard_page_query_count_is_constant(app, location_counts):
+    with app.app_context():
+        for i, count in enumerate(location_counts):
+            add_user(f'user{i}', count)
+
+    counts = []
+    for i, count in enumerate(location_counts):
+        client = app.test_client()
+        client.post('/login', data={'username': f'user{i}', 'password': 'pw'})
+
+        fragment_cache.clear()
+        with app.app_context():
+            with count_queries() as statements:
+                response = client.get('/dashboard')
+        assert response.status_code == 200
+        assert response.get_data(as_text=True).count('테스트동') >= count
+        counts.append(len(statements))
+
+    assert len(set(counts)) == 1
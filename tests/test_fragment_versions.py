@@ -0,0 +1,74 @@
+"""
+조각 캐시 버전 테스트 (저장 도중 렌더링해도 새 버전 키에 옛 요약이 캐시되지 않는지)
+"""
+
+import threading
+from datetime import date
+
+import weather_service
+from app import render_weekly_tables
+from fragment_cache import fragment_cache
+from models import db, User, SavedLocation
+from weather_service import save_weather_to_db
+
+REGION = '09110101'
+DAY = date(2024, 11, 29)
+
+
+def dawn_rows(temperature):
+    return [{
+        'region_code': REGION, 'date': DAY, 'hour': hour, 'temperature': temperature,
+        'weather_status': '맑음', 'precipitation_prob': 0, 'precipitation_amount': '-',
+        'humidity': 50, 'wind_direction': '북풍', 'wind_speed': 1.0
+    } for hour in range(4, 8)]
+
+
+def add_location():
+    user = User(username='fragment', password_hash='-')
+    db.session.add(user)
+    db.session.flush()
+    location = SavedLocation(user_id=user.id, region_name='테스트동', region_code=REGION, lat=37.5, lng=127.0)
+    db.session.add(location)
+    db.session.commit()
+    return location.id
+
+
+def render_weekly(app, location_id):
+    """다른 요청(스레드, 별도 DB 연결)처럼 주간 표 렌더링"""
+    with app.test_request_context():
+        location = db.session.get(SavedLocation, location_id)
+        html = str(render_weekly_tables([location], DAY, DAY)[0]['body'])
+        db.session.remove()
+        return html
+
+
+def temperature_cell(temperature):
+    return f'<span class="text-primary">{temperature}</span>~<span class="text-danger">{temperature}</span>'
+
+
+def test_render_during_save_does_not_cache_old_summary_under_new_version(app, monkeypatch, capsys):
+    fragment_cache.clear()
+    with app.app_context():
+        location_id = add_location()
+        save_weather_to_db(dawn_rows(10))
+
+    assert temperature_cell(10) in render_weekly(app, location_id)
+
+    rebuild = weather_service.rebuild_region_day_summaries
+    during = []
+
+    def render_then_rebuild(keys, commit=True):
+        # 시간별 데이터/지문은 썼고 요약은 아직: 다른 요청은 옛 버전과 옛 요약을 함께 봐야 함
+        thread = threading.Thread(target=lambda: during.append(render_weekly(app, location_id)))
+        thread.start()
+        thread.join(10)
+        return rebuild(keys, commit=commit)
+
+    monkeypatch.setattr(weather_service, 'rebuild_region_day_summaries', render_then_rebuild)
+    with app.app_context():
+        save_weather_to_db(dawn_rows(2))
+        db.session.remove()
+
+    assert temperature_cell(10) in during[0]
+    assert temperature_cell(2) in render_weekly(app, location_id)
+    capsys.readouterr()
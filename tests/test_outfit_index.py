@@ -0,0 +1,85 @@
+"""
+복장 추천 인메모리 인덱스 테스트 (RunningOutfitDB.get_recommendation SQL 경로와 같은 결과)
+"""
+
+import random
+
+import pytest
+
+from runitem.database import RunningOutfitDB
+from runitem.outfit_index import OutfitRuleIndex
+
+
+def _random_range(rng, low, high):
+    """(min, max) 구간, 일부는 NULL 경계"""
+    a, b = sorted(rng.choice([rng.randint(low, high), round(rng.uniform(low, high), 1)]) for _ in range(2))
+    return (None if rng.random() < 0.2 else a, None if rng.random() < 0.2 else b)
+
+
+def _add_random_rules(outfit_db, rng, count):
+    for i in range(count):
+        temp_min, temp_max = sorted(rng.randint(-10, 32) for _ in range(2))
+        humidity_min, humidity_max = _random_range(rng, 0, 100)
+        wind_min, wind_max = _random_range(rng, 0, 20)
+        outfit_db.add_outfit(temp_min, temp_max, humidity_min, humidity_max, wind_min, wind_max,
+                             f'상의 {i}', f'하의 {i}', f'소품 {i}', f'메모 {i}')
+
+
+def _random_condition(rng):
+    temperature = rng.choice([rng.randint(-8, 30), round(rng.uniform(-8, 30), 1)])
+    humidity = rng.choice([None, rng.randint(0, 100), round(rng.uniform(0, 100), 1)])
+    wind_speed = rng.choice([None, rng.randint(0, 20), round(rng.uniform(0, 20), 1)])
+    return temperature, humidity, wind_speed
+
+
+@pytest.fixture
+def outfit_db(tmp_path):
+    outfit = RunningOutfitDB(str(tmp_path / 'running_outfits.db'))
+    outfit.connect()
+    outfit.create_tables()
+    outfit.initialize_sample_data()
+    yield outfit
+    outfit.close()
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_index_matches_sql(outfit_db, seed):
+    rng = random.Random(seed)
+    _add_random_rules(outfit_db, rng, 40)
+    index = OutfitRuleIndex(outfit_db.db_name)
+
+    for _ in range(500):
+        condition = _random_condition(rng)
+        assert index.get_recommendation(*condition) == outfit_db.get_recommendation(*condition), condition
+
+
+def test_index_boundaries_match_sql(outfit_db):
+    """구간 경계값 (temp_min/temp_max/습도/풍속 경계 그대로)"""
+    index = OutfitRuleIndex(outfit_db.db_name)
+
+    for rule in outfit_db.get_all_outfits():
+        _, temp_min, temp_max, humidity_min, humidity_max, wind_min, wind_max = rule[:7]
+        for temperature in (temp_min, temp_max):
+            for humidity in (None, humidity_min, humidity_max):
+                for wind_speed in (None, wind_min, wind_max):
+                    condition = (temperature, humidity, wind_speed)
+                    assert index.get_recommendation(*condition) == outfit_db.get_recommendation(*condition), condition
+
+
+def test_index_reloads_after_add_and_delete(outfit_db):
+    rng = random.Random(7)
+    index = OutfitRuleIndex(outfit_db.db_name)
+    conditions = [_random_condition(rng) for _ in range(200)]
+
+    def assert_same():
+        for condition in conditions:
+            assert index.get_recommendation(*condition) == outfit_db.get_recommendation(*condition), condition
+
+    assert_same()
+
+    _add_random_rules(outfit_db, rng, 10)
+    assert_same()
+
+    for rule in outfit_db.get_all_outfits()[::3]:
+        outfit_db.delete_outfit(rule[0])
+    assert_same()
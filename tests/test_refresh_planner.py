@@ -0,0 +1,185 @@
+"""
+수요 기반 갱신 시뮬레이션 (1분 단위)
+- 운영과 같은 경로: scheduler.refresh_tick → crawl_jobs 등록 → crawl_worker.run_worker_tick
+  → save_weather_to_db → record_crawl_outcomes → crawl_state
+- 네이버 크롤링(crawl_regions)만 가상 결과로 바꾸고, 시계는 시뮬레이션 시각으로 고정
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import crawl_jobs
+import crawl_worker
+import scheduler
+from models import db, User, SavedLocation, RegionCrawlJob
+from crawl_jobs import crawl_state
+from refresh_planner import refresh_planner, DAWN_START_HOUR, REFRESH_MAX_INTERVAL
+
+REGIONS = 40
+BUDGET_PER_MIN = 1
+WORKER_BATCH = 4
+START = datetime(2024, 11, 28, 18, 0)
+HOURS = 12  # 18:00 → 다음날 06:00 (저녁 알림 시간대와 새벽 시간대 포함)
+FAILURE_RATE = 0.03
+
+
+class SimClock(datetime):
+    """crawl_jobs/crawl_worker/scheduler의 datetime.now()/utcnow()를 시뮬레이션 시각으로"""
+
+    current = START
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+    @classmethod
+    def utcnow(cls):
+        return cls.current
+
+
+class FakeNaver:
+    """지역마다 정해진 변동성으로 예보가 바뀌는 가상 크롤링 결과"""
+
+    def __init__(self, rng, volatility):
+        self.rng = rng
+        self.volatility = volatility
+        self.temperatures = {}
+        self.calls = []
+
+    def crawl_regions(self, region_codes, run_deadline=None, **kwargs):
+        self.calls.append((SimClock.current, list(region_codes)))
+        results, failures = {}, {}
+        for code in region_codes:
+            if self.rng.random() < FAILURE_RATE:
+                failures[code] = '타임아웃'
+                continue
+            temperatures = self.temperatures.setdefault(code, [self.rng.randint(-5, 10) for _ in range(24)])
+            for hour in range(24):
+                if self.rng.random() < self.volatility[code]:
+                    temperatures[hour] += self.rng.choice([-1, 1])
+            results[code] = {'hourly': [{
+                'region_code': code, 'date': date(2024, 11, 29), 'hour': hour,
+                'temperature': temperature, 'weather_status': '맑음', 'precipitation_prob': 0,
+                'precipitation_amount': '-', 'humidity': 50, 'wind_direction': '북풍', 'wind_speed': 1.0
+            } for hour, temperature in enumerate(temperatures)], 'current': {}}
+        return {'results': results, 'failures': failures, 'elapsed': 0.0}
+
+
+def seed_demand(rng):
+    """사용자 수가 소수 지역에 몰리는 분포로 저장 지역 생성 (일부 사용자는 저녁 알림)"""
+    users_per_region = {f'SIM{i:05d}': min(12, max(1, int(rng.paretovariate(1.2)))) for i in range(REGIONS)}
+
+    users = []
+    for j in range(max(users_per_region.values())):
+        users.append(User(username=f'sim{j}', password_hash='-', email_notification=rng.random() < 0.4,
+                          notification_time=f'{rng.choice([19, 20, 21, 22])}:{rng.choice(["00", "30"])}'))
+    db.session.add_all(users)
+    db.session.flush()
+
+    for code, count in users_per_region.items():
+        for user in users[:count]:
+            db.session.add(SavedLocation(user_id=user.id, region_name=code, region_code=code, lat=37.5, lng=127.0))
+    db.session.commit()
+    return users_per_region
+
+
+@pytest.fixture(scope='module')
+def simulation():
+    """시뮬레이션은 모듈에서 한 번만 실행하고 결과를 여러 테스트에서 확인"""
+    from app import app
+
+    rng = random.Random(7)
+    with pytest.MonkeyPatch.context() as monkeypatch, app.app_context():
+        for module in (crawl_jobs, crawl_worker, scheduler):
+            monkeypatch.setattr(module, 'datetime', SimClock)
+        monkeypatch.setattr(refresh_planner, 'budget_per_min', BUDGET_PER_MIN)
+
+        db.drop_all()
+        db.create_all()
+        users_per_region = seed_demand(rng)
+        volatility = {code: rng.choice([0.02, 0.05, 0.1, 0.3, 0.6]) for code in users_per_region}
+        naver = FakeNaver(rng, volatility)
+        monkeypatch.setattr(crawl_worker, 'crawl_regions', naver.crawl_regions)
+
+        ticks = []
+        dawn_state = None
+        for minute in range(HOURS * 60):
+            SimClock.current = START + timedelta(minutes=minute)
+            if SimClock.current.hour == DAWN_START_HOUR and SimClock.current.minute == 0:
+                dawn_state = crawl_state()
+
+            selected = scheduler.refresh_tick(SimClock.current)
+            claimed = crawl_worker.run_worker_tick('sim-worker', WORKER_BATCH)
+            ticks.append((selected, claimed))
+
+        result = {
+            'users': users_per_region,
+            'volatility': volatility,
+            'ticks': ticks,
+            'calls': naver.calls,
+            'dawn_state': dawn_state,
+            'jobs': {
+                job.region_code: {'lease_owner': job.lease_owner, 'last_crawled_at': job.last_crawled_at,
+                                  'volatility': job.volatility}
+                for job in RegionCrawlJob.query
+            }
+        }
+        db.session.remove()
+    return result
+
+
+def crawl_counts(simulation):
+    counts = {code: 0 for code in simulation['users']}
+    for _, codes in simulation['calls']:
+        for code in codes:
+            counts[code] += 1
+    return counts
+
+
+def mean(values):
+    return sum(values) / len(values)
+
+
+def test_budget_and_worker_batch_are_respected(simulation):
+    assert max(len(selected) for selected, _ in simulation['ticks']) <= BUDGET_PER_MIN
+    assert max(claimed for _, claimed in simulation['ticks']) <= WORKER_BATCH
+    # 등록한 작업은 같은 분에 워커가 처리 (임대가 남은 작업 없음)
+    assert all(job['lease_owner'] is None for job in simulation['jobs'].values())
+
+
+def test_every_region_is_crawled_and_less_than_fixed_cron(simulation):
+    counts = crawl_counts(simulation)
+    assert min(counts.values()) > 0
+    assert set(simulation['jobs']) == set(simulation['users'])
+    assert all(job['last_crawled_at'] is not None for job in simulation['jobs'].values())
+
+    fixed_cron_crawls = REGIONS * HOURS * 6  # 기존: 10분마다 전체
+    assert sum(counts.values()) < fixed_cron_crawls / 4
+
+
+def test_popular_regions_are_crawled_more_often(simulation):
+    counts = crawl_counts(simulation)
+    single = [counts[code] for code, users in simulation['users'].items() if users == 1]
+    popular = [counts[code] for code, users in simulation['users'].items() if users >= 5]
+    assert single and popular
+    assert mean(popular) > mean(single)
+
+
+def test_volatility_is_learned_from_saved_changes(simulation):
+    """save_weather_to_db의 바뀐 시간 수가 crawl_jobs 변동성으로 이어짐"""
+    jobs = simulation['jobs']
+    calm = [jobs[code]['volatility'] for code, value in simulation['volatility'].items() if value <= 0.05]
+    busy = [jobs[code]['volatility'] for code, value in simulation['volatility'].items() if value >= 0.3]
+    assert mean(busy) > mean(calm) + 0.1
+
+
+def test_data_is_fresh_at_dawn(simulation):
+    """새벽 04:00 데이터 경과 시간 (사용자 가중 평균)이 평소 최대 간격보다 훨씬 짧음"""
+    dawn = START.replace(hour=DAWN_START_HOUR) + timedelta(days=1)
+    stale = []
+    for code, users in simulation['users'].items():
+        last = simulation['dawn_state'][code]['last_crawled_at']
+        stale.extend([(dawn - last).total_seconds() / 60] * users)
+    assert mean(stale) < REFRESH_MAX_INTERVAL * 0.25
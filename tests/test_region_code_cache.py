@@ -0,0 +1,32 @@
+"""
+지역코드 캐시 저장 테스트 (저장은 바로 커밋되어 호출자가 이후에 rollback해도 남음)
+"""
+
+from models import db, RegionCodeCache
+from region_code_cache import resolve_region_code, store_region_code, lookup_region_code
+
+
+def test_store_commits(app):
+    with app.app_context():
+        store_region_code('유성구 송강동', '07200147', 'playwright')
+        db.session.rollback()
+
+        assert lookup_region_code('유성구 송강동') == (True, '07200147')
+        assert RegionCodeCache.query.filter_by(region_name='유성구 송강동').one().source == 'playwright'
+
+
+def test_negative_result_is_cached_without_caller_commit(app, capsys):
+    """지역코드를 못 찾은 요청은 커밋하지 않고 끝나도 negative 캐시가 남음"""
+    calls = []
+
+    def resolver():
+        calls.append(1)
+        return None
+
+    with app.app_context():
+        assert resolve_region_code('없는 지역', resolver) is None
+        db.session.remove()
+
+        assert resolve_region_code('없는 지역', resolver) is None
+        assert calls == [1]
+    capsys.readouterr()
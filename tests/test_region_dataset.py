@@ -0,0 +1,42 @@
+"""
+행정구역 데이터셋 캐시 테스트 (위경도를 엑셀 값 그대로 보존, 이전 형식 캐시는 다시 생성)
+"""
+
+import numpy as np
+import pytest
+
+import region_dataset
+from region_dataset import NAME_COLUMNS, read_region_cache, write_region_cache
+
+# float32로 저장하면 소수 6자리가 달라지는 좌표 (예: 37.470102 → 37.4701)
+LAT = [36.433361, 37.470102, 33.499621]
+LNG = [127.382875, 127.103297, 126.531188]
+
+
+def dataset():
+    names = {column: [''] * len(LAT) for column in NAME_COLUMNS}
+    names['시도'] = ['대전광역시', '서울특별시', '제주특별자치도']
+    return {'names': names, 'lat': np.array(LAT, dtype=np.float64), 'lng': np.array(LNG, dtype=np.float64),
+            'sheets': 1}
+
+
+def test_cache_keeps_coordinates_exact(tmp_path):
+    cache_path = str(tmp_path / 'regions.npz')
+    write_region_cache(cache_path, dataset(), source_mtime=1.0, source_sha1='x')
+
+    cached, meta = read_region_cache(cache_path)
+    assert cached['lat'].dtype == np.float64
+    assert cached['lat'].tolist() == LAT
+    assert cached['lng'].tolist() == LNG
+    assert [round(v, 6) for v in cached['lat'].tolist()] == LAT
+    assert cached['names']['시도'][2] == '제주특별자치도'
+
+
+def test_previous_cache_version_is_rejected(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / 'regions.npz')
+    monkeypatch.setattr(region_dataset, 'CACHE_FORMAT_VERSION', 1)
+    write_region_cache(cache_path, dataset(), source_mtime=1.0, source_sha1='x')
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError, match='형식 버전'):
+        read_region_cache(cache_path)
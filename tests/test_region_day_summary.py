@@ -0,0 +1,57 @@
+"""
+시간대 요약 저장 테스트 (시간별 데이터/지문/요약이 한 트랜잭션으로 저장되는지)
+"""
+
+from datetime import date
+
+import pytest
+
+import weather_service
+from models import WeatherData, WeatherDayFingerprint
+from weather_service import save_weather_to_db, load_region_day_summaries
+
+REGION = '09110101'
+DAY = date(2024, 11, 29)
+
+
+def dawn_rows(temperature):
+    return [{
+        'region_code': REGION, 'date': DAY, 'hour': hour, 'temperature': temperature,
+        'weather_status': '맑음', 'precipitation_prob': 0, 'precipitation_amount': '-',
+        'humidity': 50, 'wind_direction': '북풍', 'wind_speed': 1.0
+    } for hour in range(4, 8)]
+
+
+def dawn_summary():
+    return load_region_day_summaries([REGION], [DAY], 'dawn')[(REGION, DAY)]
+
+
+def stored_temperatures():
+    return [row.temperature for row in WeatherData.query.filter_by(region_code=REGION).order_by(WeatherData.hour)]
+
+
+def test_summary_failure_rolls_back_rows_and_fingerprint(app, monkeypatch, capsys):
+    with app.app_context():
+        save_weather_to_db(dawn_rows(10))
+        fingerprint = WeatherDayFingerprint.query.filter_by(region_code=REGION, date=DAY).one().fingerprint
+        assert dawn_summary()['min_temp'] == 10
+
+        def broken(keys, commit=True):
+            raise RuntimeError('요약 저장 실패')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(weather_service, 'rebuild_region_day_summaries', broken)
+            with pytest.raises(RuntimeError):
+                save_weather_to_db(dawn_rows(2))
+
+        # 시간별 데이터와 지문도 그대로 → 요약과 어긋나지 않음
+        assert stored_temperatures() == [10, 10, 10, 10]
+        assert WeatherDayFingerprint.query.filter_by(region_code=REGION, date=DAY).one().fingerprint == fingerprint
+        assert dawn_summary()['min_temp'] == 10
+
+        # 같은 데이터로 다시 크롤링하면 지문이 달라 건너뛰지 않고 요약까지 저장
+        counts = save_weather_to_db(dawn_rows(2))
+        assert counts['days_skipped'] == 0
+        assert stored_temperatures() == [2, 2, 2, 2]
+        assert dawn_summary()['min_temp'] == 2
+    capsys.readouterr()
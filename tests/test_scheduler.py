@@ -0,0 +1,33 @@
+"""
+전체 지역 크롤링 등록 테스트 (지역 코드당 1회, 중복 크롤링 생략 수 보고)
+"""
+
+from models import db, User, SavedLocation, RegionCrawlJob
+from scheduler import enqueue_all_weather
+
+
+def add_locations(username, locations):
+    user = User(username=username)
+    user.set_password('pw')
+    db.session.add(user)
+    db.session.flush()
+    for region_name, region_code in locations:
+        db.session.add(SavedLocation(user_id=user.id, region_name=region_name, region_code=region_code,
+                                     lat=37.5, lng=127.0))
+    db.session.commit()
+
+
+def test_enqueue_all_weather_reports_duplicates(app, capsys):
+    with app.app_context():
+        # 자곡동/논현동처럼 다른 지역명이 같은 코드를 쓰는 경우 + 여러 사용자가 같은 지역을 저장한 경우
+        add_locations('a', [('자곡동', '07200580'), ('논현동', '07200580'), ('송강동', '07200147')])
+        add_locations('b', [('송강동', '07200147'), ('역삼동', '09680101')])
+
+        result = enqueue_all_weather()
+
+        assert result == {'locations': 4, 'codes': 3, 'queued': 3, 'duplicates_avoided': 1}
+        assert sorted(job.region_code for job in RegionCrawlJob.query) == ['07200147', '07200580', '09680101']
+        assert '중복 크롤링 1회 생략' in capsys.readouterr().out
+
+        # 이미 대기 중인 작업은 새로 등록하지 않음
+        assert enqueue_all_weather()['queued'] == 0
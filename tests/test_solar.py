@@ -0,0 +1,168 @@
+"""
+일출/박명 계산 및 표 테스트
+- 독립 기준: PyEphem (VSOP87 기반 천체력, 박명 포함 네 이벤트 모두 비교)
+- suntime: 기존 일출/일몰 계산 라이브러리 (자체 근사식 오차가 있어 그 오차를 뺀 나머지만 1분 이내인지 확인)
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from solar import EVENT_NAMES, SolarTable, solar_events, coord_key
+
+ephem = pytest.importorskip('ephem')
+
+KST = timezone(timedelta(hours=9))
+SAMPLES = 600
+# 계산식(NOAA)과 천체력의 차이 허용 (분)
+FORMULA_TOLERANCE = 0.2
+
+# 이벤트별 PyEphem 설정: (지평선, 태양 중심 기준 여부, 함수)
+EPHEM_EVENTS = {
+    'nautical_dawn': ('-12', True, 'next_rising'),
+    'civil_dawn': ('-6', True, 'next_rising'),
+    'sunrise': ('-0:34', False, 'next_rising'),
+    'sunset': ('-0:34', False, 'next_setting'),
+}
+
+
+def korea_samples(seed, samples=SAMPLES, first_year=2024, years=4):
+    """한국 범위의 임의 좌표/날짜"""
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(33.0, 38.6, samples)
+    lngs = rng.uniform(124.5, 131.0, samples)
+    start = np.datetime64(f'{first_year}-01-01')
+    days = start + rng.integers(0, (np.datetime64(f'{first_year + years}-01-01') - start).astype(int), samples)
+    # 표는 반올림한 좌표로 계산하므로 기준값도 같은 좌표로 비교
+    coords = [coord_key(lat, lng) for lat, lng in zip(lats, lngs)]
+    return coords, days.astype(date).tolist()
+
+
+def ephem_minutes(lat, lng, target_date):
+    """PyEphem 이벤트 시각 (한국 시간 0시부터 분)"""
+    midnight = datetime.combine(target_date, datetime.min.time(), tzinfo=KST)
+    observer = ephem.Observer()
+    observer.lat = str(lat)
+    observer.lon = str(lng)
+    observer.pressure = 0  # 대기 굴절은 지평선 각도(-0:34)로 반영 (NOAA 천정각 90.833°와 같은 기준)
+    observer.date = ephem.Date(midnight.astimezone(timezone.utc).replace(tzinfo=None))
+
+    result = {}
+    for name, (horizon, use_center, method) in EPHEM_EVENTS.items():
+        observer.horizon = horizon
+        event = getattr(observer, method)(ephem.Sun(), use_center=use_center).datetime()
+        result[name] = (event.replace(tzinfo=timezone.utc) - midnight).total_seconds() / 60
+    return result
+
+
+def suntime_minutes(lat, lng, target_date):
+    """suntime 일출/일몰 시각 (한국 시간 0시부터 분)"""
+    from suntime import Sun
+
+    midnight = datetime.combine(target_date, datetime.min.time(), tzinfo=KST)
+    sun = Sun(lat, lng)
+    # suntime 1.3은 일몰 날짜가 하루 어긋날 수 있어 시각만 비교
+    return {
+        'sunrise': (sun.get_sunrise_time(midnight, KST) - midnight).total_seconds() / 60 % 1440,
+        'sunset': (sun.get_sunset_time(midnight, KST) - midnight).total_seconds() / 60 % 1440,
+    }
+
+
+@pytest.fixture(scope='module')
+def samples():
+    coords, dates = korea_samples(seed=0)
+    table = SolarTable(path=None, cycle_start=2024)
+    table.ensure(coords)
+    return [
+        (lat, lng, target_date, table.minutes(lat, lng, target_date), ephem_minutes(lat, lng, target_date))
+        for (lat, lng), target_date in zip(coords, dates)
+    ]
+
+
+def test_computed_events_match_ephem():
+    coords, dates = korea_samples(seed=1)
+    lats, lngs = np.array(coords).T
+    computed = solar_events(lats, lngs, dates)
+
+    for i, ((lat, lng), target_date) in enumerate(zip(coords, dates)):
+        expected = ephem_minutes(lat, lng, target_date)
+        for name in EVENT_NAMES:
+            assert abs(computed[name][i] - expected[name]) <= FORMULA_TOLERANCE, (name, lat, lng, target_date)
+
+
+@pytest.mark.parametrize('name', EVENT_NAMES)
+def test_table_within_a_minute_of_ephem(samples, name):
+    """표의 분(초 버림)이 가리키는 1분 구간에 기준 시각이 들어가야 함 (계산식 차이만 허용)"""
+    for lat, lng, target_date, looked_up, expected in samples:
+        minute = looked_up[name]
+        assert minute - FORMULA_TOLERANCE <= expected[name] < minute + 1 + FORMULA_TOLERANCE, \
+            (name, lat, lng, target_date, minute, expected[name])
+
+
+def test_table_matches_ephem_displayed_minute(samples):
+    """화면의 HH:MM(초 버림)이 기준 시각과 대부분 같은 분"""
+    for name in EVENT_NAMES:
+        same = [looked_up[name] == int(np.floor(expected[name])) for _, _, _, looked_up, expected in samples]
+        assert np.mean(same) >= 0.9, name
+
+
+@pytest.mark.parametrize('name', ['sunrise', 'sunset'])
+def test_table_within_a_minute_of_suntime(samples, name):
+    """
+    suntime과 1분 이내 (suntime 근사식이 천체력에서 벗어난 만큼은 제외)
+    suntime은 연도를 무시한 근사식과 0.01시간(36초) 반올림 때문에 천체력과 최대 1.3분가량 차이 남
+    """
+    within = []
+    for lat, lng, target_date, looked_up, expected in samples:
+        reference = suntime_minutes(lat, lng, target_date)[name]
+        suntime_error = abs(reference - expected[name])
+        diff = abs(looked_up[name] + 0.5 - reference)
+        assert diff <= 1.0 + suntime_error, (lat, lng, target_date, looked_up[name], reference, expected[name])
+        within.append(diff <= 1.0)
+    assert np.mean(within) >= 0.9
+
+
+def test_table_truncates_seconds():
+    """표 값은 계산 시각에서 초를 버린 분 (일출이 반올림으로 1분 늦게 표시되지 않음)"""
+    coords, dates = korea_samples(seed=2, samples=200)
+    table = SolarTable(path=None, cycle_start=2024)
+    lats, lngs = np.array(coords).T
+    computed = solar_events(lats, lngs, dates)
+
+    for i, ((lat, lng), target_date) in enumerate(zip(coords, dates)):
+        looked_up = table.minutes(lat, lng, target_date)
+        for name in EVENT_NAMES:
+            assert looked_up[name] == int(np.floor(computed[name][i])), (name, lat, lng, target_date)
+
+
+def test_table_rows_per_year_and_leap_day():
+    table = SolarTable(path=None, cycle_start=2024)
+    lat, lng = 37.57, 126.98
+
+    for target_date in (date(2024, 2, 29), date(2024, 3, 1), date(2025, 3, 1), date(2027, 12, 31)):
+        computed = solar_events(lat, lng, [target_date])
+        looked_up = table.minutes(lat, lng, target_date)
+        assert looked_up == {name: int(np.floor(computed[name][0])) for name in EVENT_NAMES}
+
+    events = table.events(lat, lng, date(2024, 6, 21))
+    assert events['nautical_dawn'] < events['civil_dawn'] < events['sunrise'] < events['sunset']
+    assert events['sunrise'].second == 0
+
+
+def test_table_cache_file(tmp_path):
+    path = str(tmp_path / 'solar_table.npz')
+    coords = [(37.5665, 126.978), (35.1796, 129.0756)]
+
+    table = SolarTable(path=path, cycle_start=2024)
+    table.ensure(coords)
+    expected = table.minutes(35.1796, 129.0756, date(2025, 8, 1))
+
+    reloaded = SolarTable(path=path, cycle_start=2024)
+    assert reloaded.minutes(35.1796, 129.0756, date(2025, 8, 1)) == expected
+    assert reloaded.stats()['computed'] == 0
+
+    # 주기가 바뀌면 새로 계산
+    next_cycle = SolarTable(path=path, cycle_start=2028)
+    next_cycle.ensure(coords)
+    assert next_cycle.stats()['computed'] == len(coords)
@@ -0,0 +1,73 @@
+"""
+실시간 갱신(SSE) 동시 연결 수 제한 테스트 (gthread 스레드를 SSE가 모두 점유하지 않도록)
+"""
+
+import os
+import runpy
+from types import SimpleNamespace
+
+import pytest
+
+import event_bus
+from conftest import ROOT
+from models import db, User
+from event_bus import stream_slots
+
+
+@pytest.fixture
+def client(app, monkeypatch):
+    monkeypatch.setattr(stream_slots, 'limit', 2)
+    with app.app_context():
+        user = User(username='stream')
+        user.set_password('pw')
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+    return client
+
+
+def test_streams_over_limit_are_rejected(client):
+    first = client.get('/api/stream')
+    second = client.get('/api/stream')
+    assert first.status_code == second.status_code == 200
+    assert stream_slots.stats()['active'] == 2
+
+    rejected = client.get('/api/stream')
+    assert rejected.status_code == 503
+    assert rejected.headers['Retry-After'] == '60'
+
+    # 연결이 닫히면 (스트림이 시작되기 전이라도) 자리 반환
+    first.close()
+    assert stream_slots.stats()['active'] == 1
+
+    third = client.get('/api/stream')
+    assert third.status_code == 200
+    second.close()
+    third.close()
+    assert stream_slots.stats()['active'] == 0
+
+
+@pytest.mark.parametrize('threads, limit', [(100, 80), (8, 6), (4, 2), (2, 0)])
+def test_limit_leaves_threads_for_normal_requests(threads, limit):
+    assert event_bus.stream_limit_for_threads(threads) == limit
+
+
+def test_explicit_limit_only_lowers(monkeypatch):
+    monkeypatch.setattr(event_bus, 'STREAM_MAX_CONNECTIONS', 10)
+    assert event_bus.stream_limit_for_threads(100) == 10
+    assert event_bus.stream_limit_for_threads(4) == 2
+
+
+def test_gunicorn_worker_sets_limit_from_its_threads(monkeypatch, capsys):
+    """gunicorn.conf.py는 워커가 뜰 때 실제 스레드 수로 상한 설정"""
+    config = runpy.run_path(os.path.join(ROOT, 'gunicorn.conf.py'))
+    assert config['worker_class'] == 'gthread'
+
+    monkeypatch.setattr(stream_slots, 'limit', stream_slots.limit)
+    config['post_worker_init'](SimpleNamespace(cfg=SimpleNamespace(threads=12)))
+    assert stream_slots.limit == 10
+    capsys.readouterr()
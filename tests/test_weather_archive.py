@@ -0,0 +1,106 @@
+"""
+시간별 날씨 아카이브 테스트 (날짜 파티션 추가, 지난달 월 파티션으로 합치기, 형식 1 월 파티션 읽기)
+"""
+
+import json
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+import weather_archive
+from weather_archive import archive_weather_rows, compact_month, read_archive, MISSING_INT
+
+REGIONS = ['07200147', '09680101']
+
+
+def rows(day, temperature=5, regions=REGIONS):
+    return [{
+        'region_code': code, 'date': day, 'hour': hour, 'temperature': temperature,
+        'weather_status': '맑음' if hour < 12 else '흐림', 'precipitation_prob': 10,
+        'precipitation_amount': '-', 'humidity': None, 'wind_direction': '북풍', 'wind_speed': 1.5
+    } for code in regions for hour in range(24)]
+
+
+def files_stat(path):
+    return {name: os.stat(os.path.join(path, name)).st_mtime_ns for name in os.listdir(path)}
+
+
+@pytest.fixture
+def archive_dir(tmp_path, capsys):
+    yield str(tmp_path / 'archive')
+    capsys.readouterr()
+
+
+def test_round_trip_and_overwrite(archive_dir):
+    day = date(2026, 9, 3)
+    assert archive_weather_rows(rows(day), archive_dir) == {day: 48}
+    # 같은 키는 새 값으로, 다른 지역은 그대로
+    assert archive_weather_rows(rows(day, temperature=7, regions=REGIONS[:1]), archive_dir) == {day: 48}
+
+    data = read_archive(REGIONS[0], day, day, archive_dir=archive_dir)
+    assert list(data['hour']) == list(range(24))
+    assert set(data['temperature']) == {7}
+    assert set(data['humidity']) == {MISSING_INT}
+    assert list(data['weather_status'][[0, 23]]) == ['맑음', '흐림']
+    assert data['date'][0] == np.datetime64('2026-09-03')
+    assert set(read_archive(REGIONS[1], day, day, archive_dir=archive_dir)['temperature']) == {5}
+
+
+def test_new_day_does_not_rewrite_earlier_days(archive_dir):
+    first = date(2026, 9, 3)
+    archive_weather_rows(rows(first), archive_dir)
+    first_dir = os.path.join(archive_dir, first.isoformat())
+    before = files_stat(first_dir)
+
+    archive_weather_rows(rows(first + timedelta(days=1)), archive_dir)
+
+    assert files_stat(first_dir) == before
+    data = read_archive(REGIONS[0], first, first + timedelta(days=1), archive_dir=archive_dir)
+    assert len(data['hour']) == 48
+
+
+def test_previous_month_is_compacted_once(archive_dir):
+    september = [date(2026, 9, 29), date(2026, 9, 30)]
+    for day in september:
+        archive_weather_rows(rows(day), archive_dir)
+    assert not os.path.exists(os.path.join(archive_dir, '2026-09'))
+
+    archive_weather_rows(rows(date(2026, 10, 1)), archive_dir)
+    assert sorted(os.listdir(archive_dir)) == ['2026-09', '2026-10-01']
+    assert compact_month('2026-09', archive_dir) == 0
+
+    data = read_archive(REGIONS[1], september[0], date(2026, 10, 1), archive_dir=archive_dir)
+    assert [str(d) for d in np.unique(data['date'])] == ['2026-09-29', '2026-09-30', '2026-10-01']
+    assert len(data['hour']) == 72
+
+    # 합친 달에 늦게 들어온 날은 그날의 다른 지역 값을 잃지 않음
+    archive_weather_rows(rows(september[1], temperature=9, regions=REGIONS[:1]), archive_dir)
+    assert set(read_archive(REGIONS[1], september[1], september[1], archive_dir=archive_dir)['temperature']) == {5}
+    assert set(read_archive(REGIONS[0], september[1], september[1], archive_dir=archive_dir)['temperature']) == {9}
+
+
+def test_reads_version_1_month_partition(archive_dir, monkeypatch):
+    """형식 1(월 파티션만)로 저장된 달도 읽고, 그 달에 새로 들어온 날이 있으면 그날은 새 값 사용"""
+    day = date(2026, 8, 10)
+    archive_weather_rows(rows(day), archive_dir)
+    archive_weather_rows(rows(day + timedelta(days=1)), archive_dir)
+    compact_month('2026-08', archive_dir)
+
+    meta_path = os.path.join(archive_dir, '2026-08', 'meta.json')
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    meta['version'] = 1
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    archive_weather_rows(rows(day, temperature=2), archive_dir)
+    data = read_archive(REGIONS[0], day, day + timedelta(days=1), archive_dir=archive_dir)
+    assert len(data['hour']) == 48
+    assert list(data['temperature'][:24]) == [2] * 24
+    assert list(data['temperature'][24:]) == [5] * 24
+
+    monkeypatch.setattr(weather_archive, 'READABLE_FORMAT_VERSIONS', (2,))
+    with pytest.raises(ValueError, match='형식 버전'):
+        read_archive(REGIONS[0], day, day, archive_dir=archive_dir)
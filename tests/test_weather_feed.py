@@ -0,0 +1,131 @@
+"""
+프로세스 간 날씨 변경 알림 테스트 (별도 프로세스가 저장한 변경도 SSE 구독자에게 전달)
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from event_bus import EventBus
+from weather_feed import WeatherChangeFeed
+from weather_service import save_weather_to_db
+from conftest import ROOT
+
+REGION = '09110101'
+OTHER_REGION = '09110102'
+DAY = date(2024, 11, 29)
+
+
+def rows(region_code, temperature):
+    return [{
+        'region_code': region_code, 'date': DAY, 'hour': hour, 'temperature': temperature,
+        'weather_status': '맑음', 'precipitation_prob': 0, 'precipitation_amount': '-',
+        'humidity': 50, 'wind_direction': '북풍', 'wind_speed': 1.0
+    } for hour in range(4, 8)]
+
+
+def save_in_other_process(region_code, temperature):
+    """같은 DB를 쓰는 별도 파이썬 프로세스에서 저장 (python -m crawl_worker와 같은 경로)"""
+    script = textwrap.dedent(f"""
+        import sys
+        sys.path.insert(0, {ROOT!r})
+        from datetime import date
+        from app import app
+        from weather_service import save_weather_to_db
+        rows = [{{
+            'region_code': {region_code!r}, 'date': date({DAY.year}, {DAY.month}, {DAY.day}), 'hour': hour,
+            'temperature': {temperature}, 'weather_status': '맑음', 'precipitation_prob': 0,
+            'precipitation_amount': '-', 'humidity': 50, 'wind_direction': '북풍', 'wind_speed': 1.0
+        }} for hour in range(4, 8)]
+        with app.app_context():
+            save_weather_to_db(rows)
+    """)
+    subprocess.run([sys.executable, '-c', script], check=True, env=dict(os.environ), capture_output=True)
+
+
+@pytest.fixture
+def feed(app):
+    bus = EventBus()
+    return WeatherChangeFeed(app, bus, lookback=120)
+
+
+def drain(subscription):
+    events = []
+    while True:
+        event = subscription.get(timeout=0)
+        if event is None:
+            return events
+        events.append(event)
+
+
+def test_change_saved_by_other_process_is_published(app, feed):
+    subscription = feed.bus.subscribe([REGION])
+    with app.app_context():
+        feed.poll()
+
+        save_in_other_process(REGION, 3)
+        assert feed.poll() == [REGION]
+
+    events = drain(subscription)
+    assert [event['region_code'] for event in events] == [REGION]
+    assert events[0]['dates'] == [DAY.isoformat()]
+
+
+def test_change_is_published_once(app, feed):
+    subscription = feed.bus.subscribe([REGION])
+    with app.app_context():
+        feed.poll()
+        save_weather_to_db(rows(REGION, 3))
+
+        assert feed.poll() == [REGION]
+        # 조회 구간이 겹쳐도 같은 변경은 다시 알리지 않음
+        assert feed.poll() == []
+
+        # 내용이 같은 재저장은 지문이 그대로라 알림 없음
+        save_weather_to_db(rows(REGION, 3))
+        assert feed.poll() == []
+
+        save_weather_to_db(rows(REGION, 4))
+        assert feed.poll() == [REGION]
+
+    assert len(drain(subscription)) == 2
+
+
+def test_only_subscribed_regions_are_published(app, feed):
+    subscription = feed.bus.subscribe([REGION])
+    with app.app_context():
+        feed.poll()
+        save_weather_to_db(rows(OTHER_REGION, 3))
+        assert feed.poll() == []
+    assert drain(subscription) == []
+
+
+def test_new_subscriber_does_not_replay_past_changes(app, feed):
+    with app.app_context():
+        save_weather_to_db(rows(REGION, 3))
+
+        subscription = feed.bus.subscribe([REGION])
+        assert feed.poll() == []
+        assert drain(subscription) == []
+
+
+def test_late_commit_within_lookback_is_published(app, feed):
+    """updated_at이 마지막 조회 시각보다 이전인 커밋(긴 트랜잭션, 시계 차이)도 놓치지 않음"""
+    from models import db, WeatherDayFingerprint
+
+    subscription = feed.bus.subscribe([REGION])
+    with app.app_context():
+        save_weather_to_db(rows(REGION, 3))
+        feed.poll()
+
+        save_weather_to_db(rows(REGION, 5))
+        entry = WeatherDayFingerprint.query.filter_by(region_code=REGION, date=DAY).one()
+        entry.updated_at = datetime.utcnow() - timedelta(seconds=60)
+        db.session.commit()
+
+        assert feed.poll() == [REGION]
+    assert len(drain(subscription)) == 1
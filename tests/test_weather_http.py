@@ -0,0 +1,175 @@
+"""
+weather_http 파서 테스트 (저장된 네이버 날씨 페이지 HTML 사용, 실제 사이트 접속 없음)
+"""
+
+from datetime import date
+
+import pytest
+from lxml import html
+
+import weather_http
+import weather_service
+from weather_http import parse_hourly_table, parse_weather_html, parse_current_weather
+from weather_service import HOURLY_WEATHER_JS, CURRENT_WEATHER_JS
+from conftest import read_fixture
+
+REGION_CODE = '09110101'
+
+EXPECTED_TABLE = [
+    {'ymdt': '2024112822', 'temperature': '7', 'weather_status': '흐림', 'precipitation_prob': '20%',
+     'precipitation_amount': '-', 'humidity': '65%', 'wind_direction': '북서풍', 'wind_speed': '2'},
+    {'ymdt': '2024112823', 'temperature': '6', 'weather_status': '흐림', 'precipitation_prob': '30%',
+     'precipitation_amount': '-', 'humidity': '70%', 'wind_direction': '북서풍', 'wind_speed': '3'},
+    {'ymdt': '2024112900', 'temperature': '5', 'weather_status': '비', 'precipitation_prob': '60%',
+     'precipitation_amount': '~1mm', 'humidity': '90%', 'wind_direction': '서풍', 'wind_speed': '4.5'},
+    {'ymdt': '2024112901', 'temperature': '4', 'weather_status': '비', 'precipitation_prob': '70%',
+     'precipitation_amount': '1~4mm', 'humidity': '95%', 'wind_direction': '서풍', 'wind_speed': '5'},
+    {'ymdt': '2024112902', 'temperature': '', 'weather_status': '구름많음', 'precipitation_prob': '30%',
+     'precipitation_amount': '-', 'humidity': '80%', 'wind_direction': '-', 'wind_speed': '0'},
+    {'ymdt': '2024112903', 'temperature': '-1', 'weather_status': '맑음', 'precipitation_prob': '0%',
+     'precipitation_amount': '-', 'humidity': '0', 'wind_direction': '북풍', 'wind_speed': '1'},
+]
+
+
+def test_parse_hourly_table():
+    tree = html.fromstring(read_fixture('naver_today_hourly.html'))
+    assert parse_hourly_table(tree) == EXPECTED_TABLE
+
+
+def test_parse_current_weather():
+    tree = html.fromstring(read_fixture('naver_today_hourly.html'))
+    assert parse_current_weather(tree) == {
+        'temperature': '7', 'weather_status': '흐림', 'precipitation_prob': '20%', 'humidity': '65%'
+    }
+
+
+def test_parse_weather_html_rows():
+    result = parse_weather_html(read_fixture('naver_today_hourly.html'), REGION_CODE)
+
+    hourly = result['hourly']
+    assert [(w['date'], w['hour']) for w in hourly] == [
+        (date(2024, 11, 28), 22), (date(2024, 11, 28), 23),
+        (date(2024, 11, 29), 0), (date(2024, 11, 29), 1), (date(2024, 11, 29), 2), (date(2024, 11, 29), 3),
+    ]
+    assert hourly[2] == {
+        'region_code': REGION_CODE,
+        'date': date(2024, 11, 29),
+        'hour': 0,
+        'temperature': 5,
+        'weather_status': '비',
+        'precipitation_prob': 60,
+        'precipitation_amount': '~1mm',
+        'humidity': 90,
+        'wind_direction': '서풍',
+        'wind_speed': 4.5
+    }
+    assert [w['temperature'] for w in hourly] == [7, 6, 5, 4, 0, -1]
+    assert hourly[4]['wind_speed'] == 0.0
+    assert hourly[5]['humidity'] == 0
+    assert result['current']['temperature'] == '7'
+
+
+def test_parse_weather_html_without_table():
+    assert parse_weather_html(read_fixture('naver_today_no_hourly.html'), REGION_CODE) is None
+
+
+def _launch_chromium():
+    sync_api = pytest.importorskip('playwright.sync_api')
+    playwright = sync_api.sync_playwright().start()
+    try:
+        return playwright, playwright.chromium.launch(headless=True)
+    except Exception as e:
+        playwright.stop()
+        pytest.skip(f'Chromium 실행 불가: {e}')
+
+
+def test_lxml_matches_playwright_scripts():
+    """같은 HTML에서 lxml 파서와 브라우저 추출 스크립트(HOURLY/CURRENT_WEATHER_JS) 결과가 같아야 함"""
+    page_html = read_fixture('naver_today_hourly.html')
+    playwright, browser = _launch_chromium()
+    try:
+        page = browser.new_page()
+        page.set_content(page_html)
+        js_hourly = page.evaluate(HOURLY_WEATHER_JS)
+        js_current = page.evaluate(CURRENT_WEATHER_JS)
+    finally:
+        browser.close()
+        playwright.stop()
+
+    tree = html.fromstring(page_html)
+    assert parse_hourly_table(tree) == js_hourly
+    assert parse_current_weather(tree) == js_current
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, text):
+        self.text = text
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return _FakeResponse(self.text)
+
+
+class _FakePool:
+    """브라우저 풀 대체 (run 호출 횟수 기록, 미리 정한 추출 결과 반환)"""
+
+    def __init__(self, current, hourly):
+        self.calls = 0
+        self.result = (current, hourly)
+
+    def run(self, fn):
+        self.calls += 1
+        return self.result
+
+
+def test_crawl_weather_uses_http_when_parsed(monkeypatch):
+    session = _FakeSession(read_fixture('naver_today_hourly.html'))
+    pool = _FakePool(None, [])
+    monkeypatch.setattr(weather_http, 'get_http_session', lambda: session)
+    monkeypatch.setattr(weather_service, 'get_browser_pool', lambda: pool)
+
+    result = weather_service.crawl_weather(f'https://weather.naver.com/today/{REGION_CODE}', REGION_CODE)
+
+    assert session.urls == [f'https://weather.naver.com/today/{REGION_CODE}']
+    assert pool.calls == 0
+    assert len(result['hourly']) == len(EXPECTED_TABLE)
+
+
+def test_crawl_weather_falls_back_to_playwright(monkeypatch):
+    session = _FakeSession(read_fixture('naver_today_no_hourly.html'))
+    browser_current = {'temperature': '3', 'weather_status': '맑음', 'precipitation_prob': '0%', 'humidity': '40%'}
+    pool = _FakePool(browser_current, EXPECTED_TABLE[:2])
+    monkeypatch.setattr(weather_http, 'get_http_session', lambda: session)
+    monkeypatch.setattr(weather_service, 'get_browser_pool', lambda: pool)
+
+    result = weather_service.crawl_weather(f'https://weather.naver.com/today/{REGION_CODE}', REGION_CODE)
+
+    assert pool.calls == 1
+    assert result['current'] == browser_current
+    assert [(w['date'], w['hour'], w['temperature']) for w in result['hourly']] == [
+        (date(2024, 11, 28), 22, 7), (date(2024, 11, 28), 23, 6)
+    ]
+
+
+def test_crawl_weather_falls_back_on_http_error(monkeypatch):
+    class _FailingSession:
+        def get(self, url, timeout=None):
+            raise weather_http.requests.ConnectionError('연결 실패')
+
+    pool = _FakePool(None, EXPECTED_TABLE[:1])
+    monkeypatch.setattr(weather_http, 'get_http_session', lambda: _FailingSession())
+    monkeypatch.setattr(weather_service, 'get_browser_pool', lambda: pool)
+
+    result = weather_service.crawl_weather(f'https://weather.naver.com/today/{REGION_CODE}', REGION_CODE)
+
+    assert pool.calls == 1
+    assert len(result['hourly']) == 1
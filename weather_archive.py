@@ -0,0 +1,389 @@
+"""
+시간별 날씨 장기 보관용 컬럼 아카이브
+- 보존 기간이 지나 weather_data에서 삭제되는 행을 .npy 컬럼 파일로 저장
+  weather_archive/2026-10-05/{region,day,hour,temperature,...}.npy + meta.json  (날짜 파티션)
+  weather_archive/2026-09/{...}.npy + meta.json                                (월 파티션)
+  → 매일 보존 정리는 그날 날짜 파티션만 새로 쓰고 이전 날짜 파일은 건드리지 않음
+  → 다음 달 날짜가 들어오면 지난달 날짜 파티션을 월 파티션 하나로 한 번만 합침
+    (조회 시 열어야 하는 파일 수를 줄이고, 한 달 전체를 다시 쓰는 일은 달마다 한 번)
+- 지역 코드/날씨 상태/풍향/강수량은 사전(meta.json의 표) 인덱스로 저장
+  기온/습도/강수확률은 int8(없으면 -128), 풍속은 float16(없으면 NaN)
+- 행은 (지역, 일, 시) 순으로 정렬하고 지역별 시작/끝 위치를 meta.json에 기록
+  → 읽을 때 파일 전체를 올리지 않고 memory-map으로 필요한 구간만 읽음
+- 형식 1(월 파티션만 사용)로 저장된 아카이브도 그대로 읽고 합침
+
+사용 예:
+    python weather_archive.py 07200147 2026-09-01 2026-09-30
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import json
+import os
+import shutil
+from datetime import date, datetime
+
+import numpy as np
+
+
+# 아카이브 디렉토리 (비어 있으면 보존 정리 시 아카이브하지 않음)
+WEATHER_ARCHIVE_DIR = os.environ.get('WEATHER_ARCHIVE_DIR', '')
+
+ARCHIVE_FORMAT_VERSION = 2
+READABLE_FORMAT_VERSIONS = (1, 2)  # 1: 월 파티션만, 2: 날짜 파티션 + 월 파티션
+MISSING_INT = -128
+
+# 컬럼명: (dtype, 인코딩)  int: 정수 + MISSING_INT, float: NaN, table: 사전 인덱스
+COLUMNS = {
+    'temperature': (np.int8, 'int'),
+    'humidity': (np.int8, 'int'),
+    'precipitation_prob': (np.int8, 'int'),
+    'wind_speed': (np.float16, 'float'),
+    'weather_status': (np.uint8, 'table'),
+    'wind_direction': (np.uint8, 'table'),
+    'precipitation_amount': (np.uint8, 'table'),
+}
+KEY_COLUMNS = ('region', 'day', 'hour')
+
+
+def _value(row, name):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def month_key(target_date):
+    return target_date.strftime('%Y-%m')
+
+
+def _month_dir(archive_dir, key):
+    return os.path.join(archive_dir, key)
+
+
+def _day_dir(archive_dir, target_date):
+    return os.path.join(archive_dir, target_date.isoformat())
+
+
+def _day_partitions(archive_dir):
+    """아카이브에 있는 날짜 파티션 {날짜: 디렉토리}"""
+    partitions = {}
+    if not os.path.exists(archive_dir):
+        return partitions
+    for name in os.listdir(archive_dir):
+        try:
+            day = date.fromisoformat(name)
+        except ValueError:
+            continue
+        if len(name) == 10:
+            partitions[day] = os.path.join(archive_dir, name)
+    return partitions
+
+
+def _read_meta(partition_dir):
+    with open(os.path.join(partition_dir, 'meta.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') not in READABLE_FORMAT_VERSIONS:
+        raise ValueError(f"아카이브 형식 버전 불일치: {meta.get('version')}")
+    return meta
+
+
+def _decode_rows(rows):
+    """
+    행 목록 → 컬럼 배열 (지역/사전 컬럼은 object, 숫자 컬럼은 저장 dtype으로 변환하기 전 값)
+    새로 아카이브하는 행에만 쓰이므로 행 수만큼의 반복은 그날 데이터 크기에 비례
+    """
+    frame = {
+        'region': np.array([_value(row, 'region_code') for row in rows], dtype=object),
+        'day': np.array([_value(row, 'date').day for row in rows], dtype=np.uint8),
+        'hour': np.array([_value(row, 'hour') for row in rows], dtype=np.uint8),
+    }
+    for name, (dtype, encoding) in COLUMNS.items():
+        values = [_value(row, name) for row in rows]
+        if encoding == 'int':
+            raw = np.array([MISSING_INT if v is None else int(v) for v in values], dtype=np.int64)
+            frame[name] = np.where(raw == MISSING_INT, MISSING_INT, np.clip(raw, -127, 127)).astype(dtype)
+        elif encoding == 'float':
+            frame[name] = np.array([np.nan if v is None else v for v in values], dtype=dtype)
+        else:
+            frame[name] = np.array(values, dtype=object)
+    return frame
+
+
+def _load_partition(partition_dir):
+    """기존 파티션을 컬럼 배열로 읽기 (사전 인덱스는 표로 한 번에 풀어냄)"""
+    meta = _read_meta(partition_dir)
+    frame = {name: np.load(os.path.join(partition_dir, f'{name}.npy')) for name in KEY_COLUMNS + tuple(COLUMNS)}
+    frame['region'] = np.asarray(meta['regions'], dtype=object)[frame['region']]
+    for name, (_, encoding) in COLUMNS.items():
+        if encoding == 'table':
+            frame[name] = np.asarray(meta['tables'][name], dtype=object)[frame[name]]
+    return frame
+
+
+def _merge(*frames):
+    """컬럼 묶음 병합 후 (지역, 일, 시) 순 정렬, 같은 키는 뒤쪽 묶음 값 사용"""
+    frame = {name: np.concatenate([f[name] for f in frames]) for name in frames[-1]}
+    count = len(frame['hour'])
+    regions = frame['region'].astype(str)
+    order = np.lexsort((np.arange(count), frame['hour'], frame['day'], regions))
+
+    # 정렬 후 다음 행과 키가 다르면 그 키의 마지막(가장 새로운) 행
+    keys = (regions[order], frame['day'][order], frame['hour'][order])
+    last = np.ones(count, dtype=bool)
+    last[:-1] = np.any([key[1:] != key[:-1] for key in keys], axis=0)
+    return {name: values[order][last] for name, values in frame.items()}
+
+
+def _encode_table(values):
+    """object 배열 → (uint8 인덱스, 표) (표는 처음 나온 순서)"""
+    table = {}
+    codes = np.fromiter((table.setdefault(v, len(table)) for v in values), dtype=np.int64, count=len(values))
+    return codes, list(table)
+
+
+def _write_partition(partition_dir, frame, label):
+    """정렬된 컬럼 묶음을 새 디렉토리에 쓴 뒤 교체"""
+    regions, region_codes = np.unique(frame['region'].astype(str), return_inverse=True)
+    if len(regions) > 65535:
+        raise ValueError(f"한 파티션의 지역 수가 너무 많습니다: {len(regions)}")
+
+    arrays = {
+        'region': region_codes.astype(np.uint16),
+        'day': frame['day'].astype(np.uint8),
+        'hour': frame['hour'].astype(np.uint8),
+    }
+
+    tables = {}
+    for name, (dtype, encoding) in COLUMNS.items():
+        if encoding == 'table':
+            codes, table = _encode_table(frame[name])
+            if len(table) > 256:
+                raise ValueError(f"{name} 값 종류가 너무 많습니다: {len(table)}")
+            arrays[name] = codes.astype(dtype)
+            tables[name] = table
+        else:
+            arrays[name] = frame[name].astype(dtype)
+
+    # 지역별 [시작, 끝) 위치 (행이 지역 순으로 정렬되어 있으므로 연속 구간)
+    starts = np.searchsorted(arrays['region'], np.arange(len(regions)), side='left')
+    ends = np.searchsorted(arrays['region'], np.arange(len(regions)), side='right')
+
+    meta = {
+        'version': ARCHIVE_FORMAT_VERSION,
+        'partition': label,
+        'rows': int(len(arrays['hour'])),
+        'regions': regions.tolist(),
+        'region_offsets': {region: [int(starts[i]), int(ends[i])] for i, region in enumerate(regions.tolist())},
+        'tables': tables,
+        'written_at': datetime.now().isoformat(timespec='seconds')
+    }
+
+    tmp_dir = f'{partition_dir}.{os.getpid()}.tmp'
+    old_dir = f'{partition_dir}.{os.getpid()}.old'
+    os.makedirs(tmp_dir)
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp_dir, f'{name}.npy'), array)
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    if os.path.exists(partition_dir):
+        os.replace(partition_dir, old_dir)
+    os.replace(tmp_dir, partition_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    return meta
+
+
+def archive_weather_rows(rows, archive_dir=WEATHER_ARCHIVE_DIR):
+    """
+    시간별 날씨 행을 날짜별 아카이브에 추가 (같은 지역/날짜/시간은 새 값으로 덮어씀)
+
+    Args:
+        rows: WeatherData 객체 또는 같은 키를 가진 dict 리스트
+        archive_dir: 아카이브 디렉토리
+
+    Returns:
+        dict: {날짜: 저장 후 그 날짜 파티션의 행 수}
+    """
+    by_date = {}
+    for row in rows:
+        by_date.setdefault(_value(row, 'date'), []).append(row)
+
+    os.makedirs(archive_dir, exist_ok=True)
+
+    written = {}
+    for target_date, day_rows in sorted(by_date.items()):
+        partition_dir = _day_dir(archive_dir, target_date)
+        frames = [_decode_rows(day_rows)]
+        if os.path.exists(partition_dir):
+            frames.insert(0, _load_partition(partition_dir))
+        else:
+            # 이미 합친 달에 늦게 들어온 날은 월 파티션의 그날 행을 가져와 날짜 파티션이 그날 전체를 갖도록
+            month_dir = _month_dir(archive_dir, month_key(target_date))
+            if os.path.exists(os.path.join(month_dir, 'meta.json')):
+                month = _load_partition(month_dir)
+                same_day = month['day'] == target_date.day
+                frames.insert(0, {name: values[same_day] for name, values in month.items()})
+        written[target_date] = _write_partition(partition_dir, _merge(*frames), target_date.isoformat())['rows']
+
+    # 이번에 들어온 가장 늦은 날짜보다 이전 달의 날짜 파티션은 월 파티션으로 합침
+    latest_month = month_key(max(by_date)) if by_date else None
+    pending = sorted({month_key(day) for day in _day_partitions(archive_dir)})
+    for key in pending:
+        if latest_month and key < latest_month:
+            compact_month(key, archive_dir)
+
+    return written
+
+
+def compact_month(key, archive_dir=WEATHER_ARCHIVE_DIR):
+    """
+    한 달의 날짜 파티션을 월 파티션에 합치고 날짜 파티션 삭제
+    중간에 멈추면 남은 날짜 파티션이 조회 시 우선하므로 다시 실행해도 같은 결과
+
+    Args:
+        key: 월 (YYYY-MM)
+        archive_dir: 아카이브 디렉토리
+
+    Returns:
+        int: 합친 뒤 월 파티션 행 수 (합칠 날짜 파티션이 없으면 0)
+    """
+    days = sorted((day, path) for day, path in _day_partitions(archive_dir).items() if month_key(day) == key)
+    if not days:
+        return 0
+
+    month_dir = _month_dir(archive_dir, key)
+    frames = [_load_partition(path) for _, path in days]
+    if os.path.exists(month_dir):
+        frames.insert(0, _load_partition(month_dir))
+    meta = _write_partition(month_dir, _merge(*frames), key)
+
+    for _, path in days:
+        shutil.rmtree(path, ignore_errors=True)
+    print(f"✓ 아카이브 {key} 월 파티션으로 합침: 날짜 {len(days)}개, {meta['rows']:,}행")
+    return meta['rows']
+
+
+def _partitions(archive_dir, start_date, end_date):
+    """
+    기간에 걸친 파티션 목록 [(디렉토리, 첫 날, 마지막 날, 월 시작일, 제외할 일)]
+    월 파티션과 날짜 파티션에 같은 날이 있으면 (합치다 멈춘 경우) 날짜 파티션 값을 사용
+    """
+    partitions = []
+    day_dirs = _day_partitions(archive_dir)
+    for month_start in _months_between(start_date, end_date):
+        month_dir = _month_dir(archive_dir, month_key(month_start))
+
+        first_day = start_date.day if (start_date.year, start_date.month) == (month_start.year, month_start.month) else 1
+        last_day = end_date.day if (end_date.year, end_date.month) == (month_start.year, month_start.month) else 31
+
+        day_partitions = [
+            (path, day.day, day.day, month_start, ())
+            for day, path in sorted(day_dirs.items())
+            if (day.year, day.month) == (month_start.year, month_start.month) and first_day <= day.day <= last_day
+        ]
+
+        if os.path.exists(os.path.join(month_dir, 'meta.json')):
+            skip_days = tuple(day for _, day, _, _, _ in day_partitions)
+            partitions.append((month_dir, first_day, last_day, month_start, skip_days))
+        partitions.extend(day_partitions)
+    return partitions
+
+
+def _months_between(start_date, end_date):
+    year, month = start_date.year, start_date.month
+    while (year, month) <= (end_date.year, end_date.month):
+        yield date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def read_archive(region_code, start_date, end_date, columns=None, archive_dir=WEATHER_ARCHIVE_DIR):
+    """
+    지역/기간의 시간별 날씨를 NumPy 배열로 읽기
+    파일은 memory-map으로 열고 해당 지역/날짜 구간만 복사 (날짜, 시 순)
+
+    Args:
+        region_code: 지역 코드
+        start_date: 시작 날짜
+        end_date: 종료 날짜 (포함)
+        columns: 읽을 컬럼 (None이면 전체)
+        archive_dir: 아카이브 디렉토리
+
+    Returns:
+        dict: {'date': datetime64[D], 'hour': uint8, 컬럼명: 배열}
+              int 컬럼은 없으면 MISSING_INT, 풍속은 NaN, 사전 컬럼은 문자열 배열
+    """
+    columns = list(columns or COLUMNS)
+    parts = {name: [] for name in ['date', 'hour'] + columns}
+
+    for partition_dir, first_day, last_day, month_start, skip_days in _partitions(archive_dir, start_date, end_date):
+        meta = _read_meta(partition_dir)
+        offsets = meta['region_offsets'].get(region_code)
+        if offsets is None:
+            continue
+
+        def column(name):
+            return np.load(os.path.join(partition_dir, f'{name}.npy'), mmap_mode='r')[offsets[0]:offsets[1]]
+
+        # 지역 구간 안에서는 일 순으로 정렬되어 있으므로 이진 탐색으로 기간을 자름
+        days = column('day')
+        lo = int(np.searchsorted(days, first_day, side='left'))
+        hi = int(np.searchsorted(days, last_day, side='right'))
+        if lo == hi:
+            continue
+        keep = ~np.isin(days[lo:hi], skip_days)
+
+        parts['date'].append(
+            np.datetime64(month_start, 'D') + (np.asarray(days[lo:hi][keep], dtype=np.int64) - 1)
+        )
+        parts['hour'].append(np.array(column('hour')[lo:hi][keep]))
+        for name in columns:
+            values = np.array(column(name)[lo:hi][keep])
+            if COLUMNS[name][1] == 'table':
+                values = np.asarray(meta['tables'][name], dtype=object)[values]
+            parts[name].append(values)
+
+    empty = {'date': np.array([], dtype='datetime64[D]'), 'hour': np.array([], dtype=np.uint8)}
+    for name in columns:
+        dtype, encoding = COLUMNS[name]
+        empty[name] = np.array([], dtype=object if encoding == 'table' else dtype)
+
+    data = {
+        name: np.concatenate(chunks) if chunks else empty[name]
+        for name, chunks in parts.items()
+    }
+    # 월 파티션과 날짜 파티션이 섞이면 날짜 순이 아닐 수 있음
+    if len(parts['date']) > 1:
+        order = np.lexsort((data['hour'], data['date']))
+        data = {name: values[order] for name, values in data.items()}
+    return data
+
+
+def archive_size(archive_dir=WEATHER_ARCHIVE_DIR):
+    """아카이브 전체 크기 (바이트)"""
+    total = 0
+    for root, _, files in os.walk(archive_dir):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시간별 날씨 아카이브 조회')
+    parser.add_argument('region_code', help='지역 코드')
+    parser.add_argument('start', type=date.fromisoformat, help='시작 날짜 (YYYY-MM-DD)')
+    parser.add_argument('end', type=date.fromisoformat, help='종료 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--dir', default=WEATHER_ARCHIVE_DIR or 'weather_archive', help='아카이브 디렉토리')
+    args = parser.parse_args()
+
+    data = read_archive(args.region_code, args.start, args.end, archive_dir=args.dir)
+    print(f"{args.region_code} {args.start} ~ {args.end}: {len(data['hour'])}시간")
+
+    temps = data['temperature'][data['temperature'] != MISSING_INT]
+    if len(temps):
+        print(f"  기온 최저 {temps.min()}°C / 최고 {temps.max()}°C / 평균 {temps.mean():.1f}°C")
+    for day, hour, temp, status in list(zip(data['date'], data['hour'], data['temperature'], data['weather_status']))[:24]:
+        print(f"  {day} {hour:02d}시 {temp}°C {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+날씨 변경 알림 피드 (프로세스 간)
+- 저장하는 쪽(웹 프로세스, python -m crawl_worker 등 어느 프로세스든)은 바뀐 날짜의 지문
+  (weather_day_fingerprint.fingerprint/updated_at)을 갱신
+- 웹 프로세스마다 스레드 하나가 구독 중인 지역의 지문만 주기적으로 조회해
+  바뀐 지역을 이 프로세스의 weather_events 구독자(SSE 연결)에게 발행
+  → 연결 수와 관계없이 프로세스당 주기마다 쿼리 1번
+- 커밋이 늦게 보이거나 서버 간 시계가 어긋나도 놓치지 않도록 조회 구간을 겹치게 잡고,
+  지문으로 이미 알린 변경은 다시 알리지 않음
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import os
+import threading
+from datetime import datetime, timedelta
+
+from models import db, WeatherDayFingerprint
+from fragment_cache import fragment_cache
+
+
+# 변경 확인 주기 (초)
+WEATHER_FEED_INTERVAL = float(os.environ.get('WEATHER_FEED_INTERVAL', '3'))
+# 조회 구간을 과거로 겹치게 잡는 시간 (초, 긴 트랜잭션/서버 간 시계 차이 허용)
+WEATHER_FEED_LOOKBACK = float(os.environ.get('WEATHER_FEED_LOOKBACK', '120'))
+
+
+class WeatherChangeFeed:
+    """DB에 저장된 날씨 변경을 이 프로세스의 이벤트 버스로 전달"""
+
+    def __init__(self, app, bus, interval=WEATHER_FEED_INTERVAL, lookback=WEATHER_FEED_LOOKBACK):
+        self.app = app
+        self.bus = bus
+        self.interval = interval
+        self.lookback = timedelta(seconds=lookback)
+        self._seen = {}  # (region_code, date) → (지문, updated_at)
+        self._watched = set()  # 한 번이라도 조회한 지역 (새로 구독한 지역의 과거 변경은 알리지 않음)
+        self._watermark = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        """조회 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='weather-feed', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not self.bus.keys():
+                continue
+            with self.app.app_context():
+                try:
+                    self.poll()
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"✗ 날씨 변경 확인 실패: {e}")
+                finally:
+                    db.session.remove()
+
+    def poll(self, now=None):
+        """
+        구독 중인 지역의 변경 확인 후 발행 (앱 컨텍스트 필요)
+
+        Returns:
+            list: 이벤트를 발행한 지역 코드
+        """
+        now = now or datetime.utcnow()
+        keys = set(self.bus.keys())
+        if not keys:
+            return []
+
+        since = (self._watermark or now) - self.lookback
+        rows = WeatherDayFingerprint.query.filter(
+            WeatherDayFingerprint.region_code.in_(keys),
+            WeatherDayFingerprint.updated_at > since
+        ).with_entities(
+            WeatherDayFingerprint.region_code, WeatherDayFingerprint.date,
+            WeatherDayFingerprint.fingerprint, WeatherDayFingerprint.updated_at
+        ).all()
+
+        changed = {}
+        for region_code, date, fingerprint, updated_at in rows:
+            key = (region_code, date)
+            seen = self._seen.get(key)
+            self._seen[key] = (fingerprint, updated_at)
+            if region_code not in self._watched or (seen is not None and seen[0] == fingerprint):
+                continue
+            changed.setdefault(region_code, {})[date] = updated_at
+
+        self._watched |= keys
+        self._watermark = now
+
+        # 조회 구간을 벗어난 기록은 다시 나오지 않으므로 정리
+        for key in [key for key, (_, updated_at) in self._seen.items() if updated_at <= since]:
+            del self._seen[key]
+
+        for region_code, dates in changed.items():
+            # 다른 프로세스가 저장한 지역의 옛 조각도 메모리에서 정리 (키에 버전이 있어 정확성과는 무관)
+            fragment_cache.invalidate_region(region_code)
+            self.bus.publish(region_code, {
+                'region_code': region_code,
+                'dates': sorted(date.isoformat() for date in dates),
+                'updated_at': max(dates.values()).isoformat(timespec='seconds')
+            })
+
+        return sorted(changed)
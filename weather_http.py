@@ -0,0 +1,173 @@
+"""
+브라우저 없이 HTTP만으로 네이버 날씨 시간별 예보 추출
+- 서버 렌더링된 div#hourly 테이블을 lxml로 파싱
+- 커넥션 풀을 공유하는 requests.Session 사용
+- 파싱 실패 시 None 반환 → 호출자가 Playwright로 대체
+"""
+
+import sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+import re
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import html
+
+from browser_pool import DEFAULT_USER_AGENT
+
+
+HTTP_TIMEOUT = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+# 시간별 테이블 행 라벨 (JS 추출 스크립트와 같은 순서로 검사)
+_ROW_LABELS = [
+    ('강수확률', 'prob'),
+    ('강수량', 'amount'),
+    ('습도', 'humidity'),
+    ('바람', 'wind'),
+]
+
+
+def get_http_session():
+    """프로세스 공용 requests.Session (커넥션 풀 재사용)"""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'User-Agent': DEFAULT_USER_AGENT,
+                    'Referer': 'https://weather.naver.com/'
+                })
+                _session = session
+    return _session
+
+
+def _has_class(class_name):
+    """CSS 클래스 선택자에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _first_text(tree, xpath):
+    nodes = tree.xpath(xpath)
+    return nodes[0].text_content().strip() if nodes else None
+
+
+def parse_current_weather(tree):
+    """페이지 상단 현재 날씨 추출 (CURRENT_WEATHER_JS와 같은 결과)"""
+    temp = _first_text(tree, f"//*[{_has_class('temperature_text')}]//strong")
+    if temp is not None:
+        temp = temp.replace('°', '').strip()
+
+    status = _first_text(tree, f"//*[{_has_class('weather_info')}]//*[{_has_class('summary')}]")
+    precipitation = _first_text(tree, f"//*[{_has_class('summary_inner')}]//*[{_has_class('rainfall')}]")
+    humidity = _first_text(tree, f"//*[{_has_class('summary_inner')}]//*[{_has_class('humidity')}]")
+
+    return {
+        'temperature': temp,
+        'weather_status': status or '',
+        'precipitation_prob': precipitation if precipitation is not None else '0',
+        'humidity': humidity if humidity is not None else '0'
+    }
+
+
+def parse_hourly_table(tree):
+    """
+    div#hourly 시간별 테이블 추출 (HOURLY_WEATHER_JS와 같은 결과)
+
+    Returns:
+        list: 문자열 값 dict 리스트 (테이블이 없으면 빈 리스트)
+    """
+    tables = tree.xpath(f"//div[@id='hourly']//*[{_has_class('weather_table_wrap')}]//table")
+    if not tables:
+        return []
+    table = tables[0]
+
+    headers = table.xpath(f".//thead//tr[{_has_class('_cnTime')}]//th[{_has_class('_cnItemTime')}]")
+
+    cells = {key: [] for _, key in _ROW_LABELS}
+    for row in table.xpath('.//tbody//tr'):
+        text = row.text_content()
+        for label, key in _ROW_LABELS:
+            if label in text:
+                cells[key] = [(label, td) for td in row.xpath('.//td')]
+                break
+
+    def cell_text(key, i, default):
+        if i >= len(cells[key]):
+            return default
+        label, td = cells[key][i]
+        return td.text_content().replace(label, '').strip() or default
+
+    results = []
+    for i in range(min(len(headers), len(cells['prob']))):
+        th = headers[i]
+
+        wind_direction = '-'
+        wind_speed = '0'
+        if i < len(cells['wind']):
+            parts = re.split(r'\s+', cell_text('wind', i, ''))
+            if len(parts) >= 2:
+                wind_direction = parts[0]
+                wind_speed = parts[1]
+
+        results.append({
+            'ymdt': th.get('data-ymdt') or '',
+            'temperature': th.get('data-tmpr') or '',
+            'weather_status': th.get('data-wetr-txt') or '',
+            'precipitation_prob': cell_text('prob', i, '0'),
+            'precipitation_amount': cell_text('amount', i, '-'),
+            'humidity': cell_text('humidity', i, '0'),
+            'wind_direction': wind_direction,
+            'wind_speed': wind_speed
+        })
+
+    return results
+
+
+def parse_weather_html(page_html, region_code):
+    """
+    네이버 날씨 페이지 HTML을 crawl_weather와 같은 형태로 변환
+
+    Args:
+        page_html: 페이지 HTML 문자열
+        region_code: 지역 코드
+
+    Returns:
+        dict: {'hourly': [...], 'current': {...}} 또는 None (시간별 데이터 없음)
+    """
+    from weather_service import parse_hourly_entries
+
+    tree = html.fromstring(page_html)
+
+    hourly = parse_hourly_entries(parse_hourly_table(tree), region_code)
+    if not hourly:
+        return None
+
+    return {'hourly': hourly, 'current': parse_current_weather(tree)}
+
+
+def fetch_weather_http(region_code, timeout=HTTP_TIMEOUT):
+    """
+    HTTP 요청만으로 지역 날씨 조회
+
+    Returns:
+        dict: {'hourly': [...], 'current': {...}} 또는 None (요청/파싱 실패)
+    """
+    url = f"https://weather.naver.com/today/{region_code}"
+
+    try:
+        response = get_http_session().get(url, timeout=timeout)
+        response.raise_for_status()
+        return parse_weather_html(response.text, region_code)
+    except Exception as e:
+        print(f"✗ HTTP 크롤링 실패 ({region_code}): {e}")
+        return None
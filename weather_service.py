@@ -7,9 +7,16 @@
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from playwright.sync_api import sync_playwright
+from browser_pool import get_browser_pool
+from weather_http import fetch_weather_http
+from single_flight import crawl_flight
+from solar import solar_table
+from fragment_cache import fragment_cache
 from datetime import datetime, timedelta
-from models import db, WeatherData
+from collections import Counter
+import hashlib
+import json
+from models import db, WeatherData, WeatherDayFingerprint, RegionDaySummary
 import re
 
 
@@ -33,9 +40,181 @@ def get_running_outfit(temperature):
     return "실내 운동 권장"
 
 
+# 현재 날씨 추출 스크립트 (페이지 상단의 큰 온도 표시)
+CURRENT_WEATHER_JS = """
+    () => {
+        try {
+            // 현재 온도 (큰 글씨)
+            const tempElem = document.querySelector('.temperature_text strong');
+            const temp = tempElem ? tempElem.textContent.replace('°', '').trim() : null;
+
+            // 현재 날씨 상태
+            const statusElem = document.querySelector('.weather_info .summary');
+            const status = statusElem ? statusElem.textContent.trim() : '';
+
+            // 강수/습도 등 (summary_inner에서)
+            const precipitation = document.querySelector('.summary_inner .rainfall');
+            const humidity = document.querySelector('.summary_inner .humidity');
+
+            return {
+                temperature: temp,
+                weather_status: status,
+                precipitation_prob: precipitation ? precipitation.textContent.trim() : '0',
+                humidity: humidity ? humidity.textContent.trim() : '0'
+            };
+        } catch (e) {
+            return null;
+        }
+    }
+"""
+
+# 시간별 날씨 테이블 추출 스크립트
+HOURLY_WEATHER_JS = """
+    () => {
+        const table = document.querySelector('div#hourly .weather_table_wrap table');
+        if (!table) return [];
+
+        const results = [];
+        const headers = table.querySelectorAll('thead tr._cnTime th._cnItemTime');
+        const tbody = table.querySelector('tbody');
+        const allRows = tbody.querySelectorAll('tr');
+
+        let probCells = [];
+        let amtCells = [];
+        let humidityCells = [];
+        let windCells = [];
+
+        allRows.forEach(row => {
+            const text = row.textContent;
+            const cells = row.querySelectorAll('td');
+
+            if (text.includes('강수확률')) {
+                probCells = Array.from(cells);
+            } else if (text.includes('강수량')) {
+                amtCells = Array.from(cells);
+            } else if (text.includes('습도')) {
+                humidityCells = Array.from(cells);
+            } else if (text.includes('바람')) {
+                windCells = Array.from(cells);
+            }
+        });
+
+        const minLen = Math.min(headers.length, probCells.length);
+
+        for (let i = 0; i < minLen; i++) {
+            const th = headers[i];
+            const ymdt = th.getAttribute('data-ymdt') || '';
+            const temp = th.getAttribute('data-tmpr') || '';
+            const status = th.getAttribute('data-wetr-txt') || '';
+
+            const probText = probCells[i]?.textContent.replace('강수확률', '').trim() || '0';
+            const amtText = amtCells[i]?.textContent.replace('강수량', '').trim() || '-';
+            const humidityText = humidityCells[i]?.textContent.replace('습도', '').trim() || '0';
+
+            let windDirection = '-';
+            let windSpeed = '0';
+            if (i < windCells.length) {
+                const windText = windCells[i].textContent.replace('바람', '').trim();
+                const parts = windText.split(/\\s+/);
+                if (parts.length >= 2) {
+                    windDirection = parts[0];
+                    windSpeed = parts[1];
+                }
+            }
+
+            results.push({
+                ymdt: ymdt,
+                temperature: temp,
+                weather_status: status,
+                precipitation_prob: probText,
+                precipitation_amount: amtText,
+                humidity: humidityText,
+                wind_direction: windDirection,
+                wind_speed: windSpeed
+            });
+        }
+
+        return results;
+    }
+"""
+
+
+def parse_hourly_entries(hourly_data, region_code):
+    """
+    시간별 원시 데이터를 DB 저장용 dict 리스트로 변환
+
+    Args:
+        hourly_data: HOURLY_WEATHER_JS 결과 (문자열 값 dict 리스트)
+        region_code: 지역 코드
+
+    Returns:
+        list: save_weather_to_db에 전달할 데이터 리스트
+    """
+    weather_data = []
+
+    for entry in hourly_data:
+        ymdt = entry.get('ymdt', '')
+        if len(ymdt) >= 10:
+            # ymdt 형식: YYYYMMDDHH
+            year = int(ymdt[0:4])
+            month = int(ymdt[4:6])
+            day = int(ymdt[6:8])
+            hour = int(ymdt[8:10])
+            date = datetime(year, month, day).date()
+
+            # 정수 변환
+            temp = int(entry['temperature']) if entry['temperature'] else 0
+
+            precip_str = entry['precipitation_prob'].replace('%', '') if entry['precipitation_prob'] else '0'
+            precip_prob = int(precip_str) if precip_str.isdigit() else 0
+
+            humid_str = entry['humidity'].replace('%', '') if entry['humidity'] else '0'
+            humidity = int(humid_str) if humid_str.isdigit() else 0
+
+            wind_speed_val = float(entry['wind_speed']) if entry['wind_speed'] and entry['wind_speed'] != '-' else 0.0
+
+            weather_data.append({
+                'region_code': region_code,
+                'date': date,
+                'hour': hour,
+                'temperature': temp,
+                'weather_status': entry['weather_status'],
+                'precipitation_prob': precip_prob,
+                'precipitation_amount': entry['precipitation_amount'],
+                'humidity': humidity,
+                'wind_direction': entry['wind_direction'],
+                'wind_speed': wind_speed_val
+            })
+
+    return weather_data
+
+
+def _scrape_weather_page(context, url):
+    """
+    브라우저 컨텍스트에서 날씨 페이지를 열어 원시 데이터 추출
+
+    Returns:
+        tuple: (현재 날씨 dict, 시간별 원시 데이터 리스트)
+    """
+    page = context.new_page()
+
+    print(f"크롤링 중: {url}")
+    page.goto(url, wait_until='networkidle', timeout=30000)
+    page.wait_for_selector('div#hourly .weather_table_wrap table', timeout=20000)
+
+    # 1. 현재 날씨 크롤링
+    current_weather = page.evaluate(CURRENT_WEATHER_JS)
+
+    # 2. 시간별 날씨 테이블 크롤링
+    hourly_data = page.evaluate(HOURLY_WEATHER_JS)
+
+    return current_weather, hourly_data
+
+
 def crawl_weather(url, region_code):
     """
     네이버 날씨 크롤링 (현재 날씨 + 시간별 날씨)
+    HTTP 파싱을 먼저 시도하고, 실패하면 공유 브라우저 풀에서 컨텍스트를 빌려 사용
 
     Args:
         url: 네이버 날씨 URL
@@ -44,308 +223,317 @@ def crawl_weather(url, region_code):
     Returns:
         dict: {'hourly': 시간별 데이터 리스트, 'current': 현재 날씨 dict}
     """
+    # 1. 브라우저 없이 HTTP로 시도
+    result = fetch_weather_http(region_code)
+    if result:
+        print(f"✓ HTTP 시간별: {len(result['hourly'])}개, 현재: {'있음' if result['current'] else '없음'}")
+        return result
+
+    # 2. 파싱 실패 시 Playwright로 대체
     weather_data = []
 
-    with sync_playwright() as p:
-        try:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
+    try:
+        current_weather, hourly_data = get_browser_pool().run(
+            lambda context: _scrape_weather_page(context, url)
+        )
 
-            print(f"크롤링 중: {url}")
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            page.wait_for_selector('div#hourly .weather_table_wrap table', timeout=20000)
-
-            # 1. 현재 날씨 크롤링 (페이지 상단의 큰 온도 표시)
-            current_weather = page.evaluate("""
-                () => {
-                    try {
-                        // 현재 온도 (큰 글씨)
-                        const tempElem = document.querySelector('.temperature_text strong');
-                        const temp = tempElem ? tempElem.textContent.replace('°', '').trim() : null;
-
-                        // 현재 날씨 상태
-                        const statusElem = document.querySelector('.weather_info .summary');
-                        const status = statusElem ? statusElem.textContent.trim() : '';
-
-                        // 강수/습도 등 (summary_inner에서)
-                        const precipitation = document.querySelector('.summary_inner .rainfall');
-                        const humidity = document.querySelector('.summary_inner .humidity');
-
-                        return {
-                            temperature: temp,
-                            weather_status: status,
-                            precipitation_prob: precipitation ? precipitation.textContent.trim() : '0',
-                            humidity: humidity ? humidity.textContent.trim() : '0'
-                        };
-                    } catch (e) {
-                        return null;
-                    }
-                }
-            """)
-
-            # 2. 시간별 날씨 테이블 크롤링
-            hourly_data = page.evaluate("""
-                () => {
-                    const table = document.querySelector('div#hourly .weather_table_wrap table');
-                    if (!table) return [];
-
-                    const results = [];
-                    const headers = table.querySelectorAll('thead tr._cnTime th._cnItemTime');
-                    const tbody = table.querySelector('tbody');
-                    const allRows = tbody.querySelectorAll('tr');
-
-                    let probCells = [];
-                    let amtCells = [];
-                    let humidityCells = [];
-                    let windCells = [];
-
-                    allRows.forEach(row => {
-                        const text = row.textContent;
-                        const cells = row.querySelectorAll('td');
-
-                        if (text.includes('강수확률')) {
-                            probCells = Array.from(cells);
-                        } else if (text.includes('강수량')) {
-                            amtCells = Array.from(cells);
-                        } else if (text.includes('습도')) {
-                            humidityCells = Array.from(cells);
-                        } else if (text.includes('바람')) {
-                            windCells = Array.from(cells);
-                        }
-                    });
-
-                    const minLen = Math.min(headers.length, probCells.length);
-
-                    for (let i = 0; i < minLen; i++) {
-                        const th = headers[i];
-                        const ymdt = th.getAttribute('data-ymdt') || '';
-                        const temp = th.getAttribute('data-tmpr') || '';
-                        const status = th.getAttribute('data-wetr-txt') || '';
-
-                        const probText = probCells[i]?.textContent.replace('강수확률', '').trim() || '0';
-                        const amtText = amtCells[i]?.textContent.replace('강수량', '').trim() || '-';
-                        const humidityText = humidityCells[i]?.textContent.replace('습도', '').trim() || '0';
-
-                        let windDirection = '-';
-                        let windSpeed = '0';
-                        if (i < windCells.length) {
-                            const windText = windCells[i].textContent.replace('바람', '').trim();
-                            const parts = windText.split(/\\s+/);
-                            if (parts.length >= 2) {
-                                windDirection = parts[0];
-                                windSpeed = parts[1];
-                            }
-                        }
-
-                        results.push({
-                            ymdt: ymdt,
-                            temperature: temp,
-                            weather_status: status,
-                            precipitation_prob: probText,
-                            precipitation_amount: amtText,
-                            humidity: humidityText,
-                            wind_direction: windDirection,
-                            wind_speed: windSpeed
-                        });
-                    }
-
-                    return results;
-                }
-            """)
-
-            # 시간별 데이터 처리
-            for entry in hourly_data:
-                ymdt = entry.get('ymdt', '')
-                if len(ymdt) >= 10:
-                    # ymdt 형식: YYYYMMDDHH
-                    year = int(ymdt[0:4])
-                    month = int(ymdt[4:6])
-                    day = int(ymdt[6:8])
-                    hour = int(ymdt[8:10])
-                    date = datetime(year, month, day).date()
-
-                    # 정수 변환
-                    temp = int(entry['temperature']) if entry['temperature'] else 0
-                    
-                    precip_str = entry['precipitation_prob'].replace('%', '') if entry['precipitation_prob'] else '0'
-                    precip_prob = int(precip_str) if precip_str.isdigit() else 0
-                    
-                    humid_str = entry['humidity'].replace('%', '') if entry['humidity'] else '0'
-                    humidity = int(humid_str) if humid_str.isdigit() else 0
-                    
-                    wind_speed_val = float(entry['wind_speed']) if entry['wind_speed'] and entry['wind_speed'] != '-' else 0.0
-
-                    weather_data.append({
-                        'region_code': region_code,
-                        'date': date,
-                        'hour': hour,
-                        'temperature': temp,
-                        'weather_status': entry['weather_status'],
-                        'precipitation_prob': precip_prob,
-                        'precipitation_amount': entry['precipitation_amount'],
-                        'humidity': humidity,
-                        'wind_direction': entry['wind_direction'],
-                        'wind_speed': wind_speed_val
-                    })
-
-            browser.close()
-            print(f"✓ 시간별: {len(weather_data)}개, 현재: {'있음' if current_weather else '없음'}")
-
-        except Exception as e:
-            print(f"✗ 크롤링 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            current_weather = None
+        # 시간별 데이터 처리
+        weather_data = parse_hourly_entries(hourly_data, region_code)
+
+        print(f"✓ 시간별: {len(weather_data)}개, 현재: {'있음' if current_weather else '없음'}")
+
+    except Exception as e:
+        print(f"✗ 크롤링 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        current_weather = None
 
     return {'hourly': weather_data, 'current': current_weather}
 
 
-def save_weather_to_db(weather_data_list):
-    """
-    날씨 데이터를 데이터베이스에 저장
+# 시간별 날씨 값 컬럼 (키: region_code, date, hour)
+WEATHER_VALUE_COLUMNS = (
+    'temperature', 'weather_status', 'precipitation_prob', 'precipitation_amount',
+    'humidity', 'wind_direction', 'wind_speed'
+)
 
-    Args:
-        weather_data_list: 크롤링된 날씨 데이터 리스트
-    """
-    saved_count = 0
-    updated_count = 0
+UPSERT_CHUNK_SIZE = 500
 
-    for data in weather_data_list:
-        # 기존 데이터 확인
+
+def _dialect_insert(dialect_name):
+    """ON CONFLICT를 지원하는 방언별 insert 구문 (미지원 DB면 None)"""
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+def _mark_changed(counts, region_code, date, hour):
+    counts['changed'].setdefault(region_code, {}).setdefault(date, set()).add(hour)
+
+
+def weather_day_fingerprint(rows):
+    """한 지역/날짜의 시간별 값 지문 (행 순서와 무관)"""
+    digest = hashlib.sha1()
+    for row in sorted(rows, key=lambda r: r['hour']):
+        values = (row['hour'],) + tuple(row[col] for col in WEATHER_VALUE_COLUMNS)
+        digest.update(repr(values).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _load_fingerprints(day_keys):
+    """{(region_code, date): 저장된 지문}"""
+    stored = {}
+    for i in range(0, len(day_keys), UPSERT_CHUNK_SIZE):
+        chunk = day_keys[i:i + UPSERT_CHUNK_SIZE]
+        query = db.session.query(
+            WeatherDayFingerprint.region_code, WeatherDayFingerprint.date, WeatherDayFingerprint.fingerprint
+        ).filter(
+            WeatherDayFingerprint.region_code.in_({key[0] for key in chunk}),
+            WeatherDayFingerprint.date.in_({key[1] for key in chunk})
+        )
+        for region_code, date, fingerprint in query:
+            stored[(region_code, date)] = fingerprint
+    return stored
+
+
+def _store_fingerprints(fingerprints, insert):
+    """지문 저장 (fingerprints: {(region_code, date): (지문, 시간 수)})"""
+    if not fingerprints:
+        return
+
+    now = datetime.utcnow()
+    rows = [
+        {'region_code': key[0], 'date': key[1], 'fingerprint': fp, 'hour_count': hour_count, 'updated_at': now}
+        for key, (fp, hour_count) in sorted(fingerprints.items())
+    ]
+
+    if insert is None:
+        for row in rows:
+            entry = WeatherDayFingerprint.query.filter_by(region_code=row['region_code'], date=row['date']).first()
+            if entry is None:
+                db.session.add(WeatherDayFingerprint(**row))
+            else:
+                entry.fingerprint = row['fingerprint']
+                entry.hour_count = row['hour_count']
+        return
+
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = insert(WeatherDayFingerprint).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['region_code', 'date'],
+            set_={col: stmt.excluded[col] for col in ('fingerprint', 'hour_count', 'updated_at')}
+        )
+        db.session.execute(stmt)
+
+
+def _save_weather_rows_orm(rows, counts):
+    """ON CONFLICT 미지원 DB용 행 단위 저장"""
+    for data in rows:
         existing = WeatherData.query.filter_by(
             region_code=data['region_code'],
             date=data['date'],
             hour=data['hour']
         ).first()
 
-        if existing:
-            # 업데이트
-            existing.temperature = data['temperature']
-            existing.weather_status = data['weather_status']
-            existing.precipitation_prob = data['precipitation_prob']
-            existing.precipitation_amount = data['precipitation_amount']
-            existing.humidity = data['humidity']
-            existing.wind_direction = data['wind_direction']
-            existing.wind_speed = data['wind_speed']
+        if existing is None:
+            db.session.add(WeatherData(**data))
+            counts['inserted'] += 1
+        elif any(getattr(existing, col) != data[col] for col in WEATHER_VALUE_COLUMNS):
+            for col in WEATHER_VALUE_COLUMNS:
+                setattr(existing, col, data[col])
             existing.updated_at = datetime.utcnow()
-            updated_count += 1
+            counts['updated'] += 1
         else:
-            # 새로 저장
-            weather = WeatherData(**data)
-            db.session.add(weather)
-            saved_count += 1
+            counts['unchanged'] += 1
+            continue
 
-    db.session.commit()
-    print(f"✓ DB 저장 완료: {saved_count}개 신규, {updated_count}개 업데이트")
+        _mark_changed(counts, data['region_code'], data['date'], data['hour'])
 
 
-def update_weather_for_region(region_code, weather_url):
+def upsert_weather_rows(weather_data_list, chunk_size=UPSERT_CHUNK_SIZE):
     """
-    특정 지역의 날씨 데이터 업데이트
+    시간별 날씨 데이터를 청크당 한 번의 INSERT ... ON CONFLICT로 저장
+    (여러 지역의 크롤링 결과를 한꺼번에 넘겨도 됨)
+
+    지역/날짜별 지문이 저장된 값과 같으면 그 날짜는 DB에 쓰지 않고,
+    나머지도 값이 바뀐 행만 갱신한다. 같은 지역을 동시에 저장해도
+    _region_date_hour_uc 충돌은 DB가 처리한다.
+    커밋은 호출자가 함 (save_weather_to_db가 요약과 같은 트랜잭션으로 커밋)
 
     Args:
-        region_code: 지역 코드
-        weather_url: 네이버 날씨 URL
+        weather_data_list: 크롤링된 날씨 데이터 리스트
+        chunk_size: 한 구문에 담을 최대 행 수
+
+    Returns:
+        dict: {'inserted': 신규, 'updated': 변경, 'unchanged': 동일,
+               'days_skipped': 지문이 같아 건너뛴 지역/날짜 수,
+               'changed': {region_code: {date: 신규/변경된 시간 set}}}
     """
-    print(f"\n{'='*60}")
-    print(f"날씨 업데이트: {region_code}")
-    print(f"{'='*60}")
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'days_skipped': 0, 'changed': {}}
 
-    result = crawl_weather(weather_url, region_code)
-    
-    if result and isinstance(result, dict):
-        hourly_data = result.get('hourly', [])
-        current_data = result.get('current')
-        
-        if hourly_data:
-            save_weather_to_db(hourly_data)
-            return True
-    
-    return False
+    # 같은 키는 마지막 값만 사용, 키 순으로 정렬해 동시 실행 시 락 순서를 고정
+    rows_by_key = {}
+    for data in weather_data_list:
+        key = (data['region_code'], data['date'], data['hour'])
+        row = {'region_code': key[0], 'date': key[1], 'hour': key[2]}
+        row.update({col: data.get(col) for col in WEATHER_VALUE_COLUMNS})
+        rows_by_key[key] = row
+
+    if not rows_by_key:
+        return counts
+
+    # 지역/날짜별 지문 비교 → 내용이 같은 날짜는 통째로 제외
+    rows_by_day = {}
+    for key in sorted(rows_by_key):
+        rows_by_day.setdefault(key[:2], []).append(rows_by_key[key])
+
+    stored = _load_fingerprints(list(rows_by_day))
+    fingerprints = {}
+    rows = []
+    for day_key, day_rows in rows_by_day.items():
+        fingerprint = weather_day_fingerprint(day_rows)
+        if stored.get(day_key) == fingerprint:
+            counts['unchanged'] += len(day_rows)
+            counts['days_skipped'] += 1
+            continue
+        fingerprints[day_key] = (fingerprint, len(day_rows))
+        rows.extend(day_rows)
+
+    if not rows:
+        return counts
+
+    insert = _dialect_insert(db.session.get_bind().dialect.name)
+    if insert is None:
+        _save_weather_rows_orm(rows, counts)
+        _store_fingerprints(fingerprints, None)
+        db.session.flush()
+        return counts
+
+    now = datetime.utcnow()
+
+    for i in range(0, len(rows), chunk_size):
+        chunk = rows[i:i + chunk_size]
+        keys = {(row['region_code'], row['date'], row['hour']) for row in chunk}
+
+        # 신규/변경 구분용 기존 키 조회 (청크당 1회)
+        existing_keys = {
+            tuple(key) for key in db.session.query(
+                WeatherData.region_code, WeatherData.date, WeatherData.hour
+            ).filter(
+                WeatherData.region_code.in_({key[0] for key in keys}),
+                WeatherData.date.in_({key[1] for key in keys})
+            )
+        } & keys
+
+        stmt = insert(WeatherData).values([dict(row, updated_at=now) for row in chunk])
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['region_code', 'date', 'hour'],
+            set_={col: excluded[col] for col in WEATHER_VALUE_COLUMNS + ('updated_at',)},
+            where=db.or_(*[
+                getattr(WeatherData, col).is_distinct_from(excluded[col])
+                for col in WEATHER_VALUE_COLUMNS
+            ])
+        ).returning(WeatherData.region_code, WeatherData.date, WeatherData.hour)
+
+        written = {tuple(key) for key in db.session.execute(stmt)}
+
+        counts['inserted'] += len(written - existing_keys)
+        counts['updated'] += len(written & existing_keys)
+        counts['unchanged'] += len(keys - written)
 
+        for region_code, date, hour in written:
+            _mark_changed(counts, region_code, date, hour)
 
-def get_morning_weather(region_code, target_date=None):
+    _store_fingerprints(fingerprints, insert)
+    return counts
+
+
+def save_weather_to_db(weather_data_list):
     """
-    새벽 시간(04:00-07:00) 날씨 조회
+    날씨 데이터를 데이터베이스에 저장
+    시간별 데이터, 지문, 시간대 요약을 한 트랜잭션으로 커밋
+    (요약 갱신이 실패하면 전부 롤백 → 지문이 그대로라 다음 크롤링에서 다시 저장,
+     다른 프로세스가 새 지문과 옛 요약을 함께 보는 일도 없음)
 
     Args:
-        region_code: 지역 코드
-        target_date: 조회할 날짜 (None이면 오늘)
+        weather_data_list: 크롤링된 날씨 데이터 리스트
 
     Returns:
-        list: 새벽 날씨 데이터
+        dict: upsert_weather_rows 결과 (신규/변경/동일 수, 바뀐 시간)
     """
-    if target_date is None:
-        target_date = datetime.now().date()
+    try:
+        counts = upsert_weather_rows(weather_data_list)
+        # 바뀐 지역/날짜의 시간대 요약 갱신
+        update_region_day_summaries(counts['changed'])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
 
-    morning_hours = [4, 5, 6, 7]
+    print(f"✓ DB 저장 완료: {counts['inserted']}개 신규, {counts['updated']}개 업데이트, {counts['unchanged']}개 변경 없음"
+          f" (지문 동일로 건너뛴 날짜 {counts['days_skipped']}개)")
 
-    weather_list = WeatherData.query.filter(
-        WeatherData.region_code == region_code,
-        WeatherData.date == target_date,
-        WeatherData.hour.in_(morning_hours)
-    ).order_by(WeatherData.hour).all()
+    # 바뀐 지역의 카드 조각 캐시 삭제
+    # (열려 있는 대시보드 알림은 weather_feed가 저장된 지문을 보고 발행 - 다른 프로세스의 저장도 포함)
+    for region_code in counts['changed']:
+        fragment_cache.invalidate_region(region_code)
 
-    return weather_list
+    return counts
 
 
-def get_current_weather(region_code):
+def update_weather_for_region(region_code, weather_url):
     """
-    현재 시각의 날씨 조회 (없으면 가장 가까운 미래 시각 데이터)
+    특정 지역의 날씨 데이터 업데이트
 
     Args:
         region_code: 지역 코드
+        weather_url: 네이버 날씨 URL
+    """
+    print(f"\n{'='*60}")
+    print(f"날씨 업데이트: {region_code}")
+    print(f"{'='*60}")
 
-    Returns:
-        WeatherData: 현재 시각 날씨 데이터
-    """
-    now = datetime.now()
-    current_hour = now.hour
-    current_date = now.date()
-
-    # 먼저 현재 시각 데이터 조회
-    weather = WeatherData.query.filter(
-        WeatherData.region_code == region_code,
-        WeatherData.date == current_date,
-        WeatherData.hour == current_hour
-    ).first()
-
-    # 현재 시각 데이터가 없으면 가장 가까운 미래 시각 조회
-    if not weather:
-        weather = WeatherData.query.filter(
-            WeatherData.region_code == region_code,
-            WeatherData.date >= current_date
-        ).filter(
-            (WeatherData.date > current_date) | (WeatherData.hour > current_hour)
-        ).order_by(WeatherData.date, WeatherData.hour).first()
+    # 같은 지역을 다른 곳에서 크롤링 중이면 합류, 최근 결과가 있으면 재사용
+    result = crawl_flight.do(region_code, lambda: crawl_weather(weather_url, region_code))
 
-    return weather
+    return store_crawl_result(result)
 
 
-def get_today_weather(region_code, target_date=None):
+def store_crawl_result(result):
     """
-    오늘 하루 날씨 조회 (06:00~23:00)
+    크롤링 결과를 DB에 저장
 
     Args:
-        region_code: 지역 코드
-        target_date: 조회할 날짜 (None이면 오늘)
+        result: crawl_weather / crawl_engine 결과 dict
 
     Returns:
-        list: 오늘 날씨 데이터
+        bool: 저장 여부 (시간별 데이터가 없으면 False)
     """
-    if target_date is None:
-        target_date = datetime.now().date()
+    if result and isinstance(result, dict):
+        hourly_data = result.get('hourly', [])
+
+        if hourly_data:
+            save_weather_to_db(hourly_data)
+            return True
+
+    return False
 
-    weather_list = WeatherData.query.filter(
-        WeatherData.region_code == region_code,
-        WeatherData.date == target_date,
-        WeatherData.hour >= 6,
-        WeatherData.hour <= 23
-    ).order_by(WeatherData.hour).all()
 
-    return weather_list
+# 새벽 런닝 시간대 / 오늘 날씨 표시 시간대
+MORNING_HOURS = (4, 5, 6, 7)
+TODAY_START_HOUR = 6
+TODAY_END_HOUR = 23
+
+# region_day_summary 시간대: (이름, 포함 시간)
+SUMMARY_WINDOWS = {
+    'dawn': MORNING_HOURS,
+    'day': tuple(range(TODAY_START_HOUR, TODAY_END_HOUR + 1)),
+}
 
 
 def get_weather_summary(weather_list):
@@ -369,8 +557,8 @@ def get_weather_summary(weather_list):
     max_precip = max(precip_probs) if precip_probs else 0
 
     # 가장 많이 나타나는 날씨 상태
-    status_list = [w.weather_status for w in weather_list if w.weather_status]
-    avg_weather = max(set(status_list), key=status_list.count) if status_list else "알 수 없음"
+    status_counts = Counter(w.weather_status for w in weather_list if w.weather_status)
+    avg_weather = status_counts.most_common(1)[0][0] if status_counts else "알 수 없음"
 
     # 러닝 추천
     outfit = get_running_outfit(min_temp)
@@ -392,34 +580,316 @@ def get_weather_summary(weather_list):
     }
 
 
-def get_weekly_weather(region_code):
+def rebuild_region_day_summaries(keys, commit=True):
     """
-    주간 날씨 조회 (7일간)
+    지역/날짜/시간대 요약을 시간별 데이터로 다시 계산해 저장
+    (해당 시간대 데이터가 없으면 요약 삭제)
 
     Args:
-        region_code: 지역 코드
+        keys: (region_code, date, window) 목록
+        commit: False면 커밋하지 않고 호출자의 트랜잭션에 포함
 
     Returns:
-        dict: 날짜별 새벽 날씨 데이터
+        int: 저장한 요약 수
     """
-    from datetime import date, timedelta
+    keys = sorted(set(keys))
+    if not keys:
+        return 0
+
+    now = datetime.utcnow()
+    stored = 0
+    insert = _dialect_insert(db.session.get_bind().dialect.name)
+
+    for i in range(0, len(keys), UPSERT_CHUNK_SIZE):
+        chunk = keys[i:i + UPSERT_CHUNK_SIZE]
+        codes = {key[0] for key in chunk}
+        dates = {key[1] for key in chunk}
+
+        rows_by_day = {}
+        for row in WeatherData.query.filter(
+            WeatherData.region_code.in_(codes),
+            WeatherData.date.in_(dates)
+        ).order_by(WeatherData.hour):
+            rows_by_day.setdefault((row.region_code, row.date), []).append(row)
+
+        values = []
+        empty = []
+        for region_code, date, window in chunk:
+            hours = SUMMARY_WINDOWS[window]
+            weather_list = [w for w in rows_by_day.get((region_code, date), []) if w.hour in hours]
+            summary = get_weather_summary(weather_list)
+            if summary is None:
+                empty.append((region_code, date, window))
+                continue
+            values.append({
+                'region_code': region_code, 'date': date, 'window': window,
+                'hour_count': len(weather_list),
+                'min_temp': summary['min_temp'],
+                'max_temp': summary['max_temp'],
+                'max_precip': summary['max_precip'],
+                'modal_status': summary['avg_weather'],
+                'outfit': summary['outfit'],
+                'warnings': json.dumps(summary['warnings'], ensure_ascii=False),
+                'updated_at': now
+            })
+
+        for region_code, date, window in empty:
+            RegionDaySummary.query.filter_by(
+                region_code=region_code, date=date, window=window
+            ).delete(synchronize_session=False)
+
+        if insert is None:
+            for value in values:
+                entry = RegionDaySummary.query.filter_by(
+                    region_code=value['region_code'], date=value['date'], window=value['window']
+                ).first()
+                if entry is None:
+                    db.session.add(RegionDaySummary(**value))
+                else:
+                    for col, v in value.items():
+                        setattr(entry, col, v)
+        elif values:
+            stmt = insert(RegionDaySummary).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['region_code', 'date', 'window'],
+                set_={col: stmt.excluded[col] for col in values[0] if col not in ('region_code', 'date', 'window')}
+            )
+            db.session.execute(stmt)
 
-    weekly_data = {}
-    today = datetime.now().date()
+        stored += len(values)
 
-    # 오늘부터 7일간
-    for i in range(7):
-        target_date = today + timedelta(days=i)
-        morning_weather = get_morning_weather(region_code, target_date)
-        summary = get_weather_summary(morning_weather)
+    if commit:
+        db.session.commit()
+    return stored
 
-        weekly_data[target_date] = {
-            'weather_list': morning_weather,
-            'summary': summary,
-            'day_name': get_day_name(target_date)
-        }
 
-    return weekly_data
+def update_region_day_summaries(changed):
+    """
+    저장 시 바뀐 시간이 걸친 시간대의 요약만 다시 계산 (커밋은 호출자, 실패하면 예외)
+
+    Args:
+        changed: {region_code: {date: 바뀐 시간 set}} (upsert_weather_rows 결과)
+    """
+    keys = [
+        (region_code, date, window)
+        for region_code, dates in changed.items()
+        for date, hours in dates.items()
+        for window, window_hours in SUMMARY_WINDOWS.items()
+        if not hours.isdisjoint(window_hours)
+    ]
+    if not keys:
+        return 0
+
+    return rebuild_region_day_summaries(keys, commit=False)
+
+
+def load_region_day_summaries(region_codes, dates, window):
+    """
+    저장된 시간대 요약 조회
+
+    Returns:
+        dict: {(region_code, date): get_weather_summary 형태 dict}
+    """
+    if not region_codes or not dates:
+        return {}
+
+    entries = RegionDaySummary.query.filter(
+        RegionDaySummary.region_code.in_(set(region_codes)),
+        RegionDaySummary.date.in_(set(dates)),
+        RegionDaySummary.window == window
+    )
+    return {(entry.region_code, entry.date): entry.to_summary() for entry in entries}
+
+
+def _stored_summary(summaries, key, weather_list):
+    """저장된 요약 사용, 없으면(요약 생성 전 데이터) 시간별 데이터로 계산"""
+    if not weather_list:
+        return None
+    summary = summaries.get(key)
+    return summary if summary is not None else get_weather_summary(weather_list)
+
+
+def get_dawn_outfit_recommendation(weather_list, location_name, target_date, outfit_interface):
+    """
+    새벽 날씨 평균값으로 런닝 복장 추천 (runitem 모듈 사용)
+
+    Args:
+        weather_list: 새벽 시간대 WeatherData 리스트
+        location_name: 지역명 (정보용)
+        target_date: 대상 날짜
+        outfit_interface: runitem WeatherInterface 인스턴스
+
+    Returns:
+        dict: 복장 추천 결과 (기온 데이터가 없으면 None)
+    """
+    temps = [w.temperature for w in weather_list if w.temperature is not None]
+    humidities = [w.humidity for w in weather_list if w.humidity is not None]
+    wind_speeds = [w.wind_speed for w in weather_list if w.wind_speed is not None]
+
+    if not temps:
+        return None
+
+    return outfit_interface.get_outfit_recommendation({
+        'temperature': sum(temps) / len(temps),
+        'humidity': sum(humidities) / len(humidities) if humidities else None,
+        'wind_speed': sum(wind_speeds) / len(wind_speeds) if wind_speeds else None,
+        'location': location_name,
+        'datetime': target_date.strftime('%Y-%m-%d')
+    })
+
+
+def get_dashboard_weather(saved_locations, now=None):
+    """
+    대시보드용 날씨 정보 일괄 조회
+    사용자의 모든 지역 데이터를 한 번의 범위 쿼리로 가져와 메모리에서 나눔
+
+    Args:
+        saved_locations: SavedLocation 리스트
+        now: 기준 시각 (None이면 현재)
+
+    Returns:
+        list: 지역별 weather_info dict (dashboard.html 구조)
+    """
+    from runitem.weather_interface import WeatherInterface
+
+    if now is None:
+        now = datetime.now()
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+
+    # 오늘 이후 데이터 전체를 한 번에 조회
+    rows_by_region = {}
+    region_codes = {location.region_code for location in saved_locations}
+    if region_codes:
+        rows = WeatherData.query.filter(
+            WeatherData.region_code.in_(region_codes),
+            WeatherData.date >= today
+        ).order_by(WeatherData.region_code, WeatherData.date, WeatherData.hour).all()
+
+        for row in rows:
+            rows_by_region.setdefault(row.region_code, []).append(row)
+
+    # 처음 보는 좌표의 일출/박명 표는 한 번에 계산
+    solar_table.ensure([(location.lat, location.lng) for location in saved_locations])
+
+    today_summaries = load_region_day_summaries(region_codes, [today], 'day')
+    dawn_summaries = load_region_day_summaries(region_codes, [tomorrow], 'dawn')
+
+    outfit_interface = None
+    weather_info = []
+
+    for location in saved_locations:
+        rows = rows_by_region.get(location.region_code, [])
+
+        # 현재 날씨 (없으면 가장 가까운 미래 시각)
+        current_weather = next(
+            (w for w in rows if w.date == today and w.hour == now.hour), None
+        ) or next(
+            (w for w in rows if w.date > today or w.hour > now.hour), None
+        )
+
+        # 오늘 날씨 (하루 전체)
+        today_weather = [
+            w for w in rows
+            if w.date == today and TODAY_START_HOUR <= w.hour <= TODAY_END_HOUR
+        ]
+
+        # 내일 새벽 날씨
+        tomorrow_weather = [
+            w for w in rows if w.date == tomorrow and w.hour in MORNING_HOURS
+        ]
+
+        # 내일 새벽 런닝 복장 추천 (요청당 인스턴스 하나 공유)
+        outfit_recommendation = None
+        if tomorrow_weather:
+            if outfit_interface is None:
+                outfit_interface = WeatherInterface()
+            outfit_recommendation = get_dawn_outfit_recommendation(
+                tomorrow_weather, location.region_name, tomorrow, outfit_interface
+            )
+
+        # 일출/일몰 시간
+        today_sun = get_sunrise_sunset(location.lat, location.lng, today)
+        tomorrow_sun = get_sunrise_sunset(location.lat, location.lng, tomorrow)
+
+        weather_info.append({
+            'location': location,
+            'current': current_weather,
+            'today': {
+                'date': today,
+                'weather_list': today_weather,
+                'summary': _stored_summary(today_summaries, (location.region_code, today), today_weather),
+                'sunrise': today_sun['sunrise'],
+                'sunset': today_sun['sunset']
+            },
+            'tomorrow': {
+                'date': tomorrow,
+                'weather_list': tomorrow_weather,
+                'summary': _stored_summary(dawn_summaries, (location.region_code, tomorrow), tomorrow_weather),
+                'sunrise': tomorrow_sun['sunrise'],
+                'sunset': tomorrow_sun['sunset'],
+                'civil_dawn': tomorrow_sun['civil_dawn'],
+                'outfit_recommendation': outfit_recommendation
+            }
+        })
+
+    return weather_info
+
+
+def get_weekly_weather(region_codes, start_date=None, end_date=None, hours=MORNING_HOURS):
+    """
+    기간별 새벽 날씨 조회 (한 번의 범위 쿼리)
+
+    Args:
+        region_codes: 지역 코드 또는 지역 코드 리스트
+        start_date: 시작 날짜 (None이면 오늘)
+        end_date: 종료 날짜, 포함 (None이면 시작일부터 7일간)
+        hours: 조회할 시간대 (기본: 새벽 04~07시)
+
+    Returns:
+        dict: 날짜별 새벽 날씨 데이터
+              (지역 코드 리스트를 넘기면 {region_code: 날짜별 데이터})
+    """
+    single = isinstance(region_codes, str)
+    codes = [region_codes] if single else list(dict.fromkeys(region_codes))
+
+    if start_date is None:
+        start_date = datetime.now().date()
+    if end_date is None:
+        end_date = start_date + timedelta(days=6)
+
+    rows_by_key = {}
+    if codes:
+        rows = WeatherData.query.filter(
+            WeatherData.region_code.in_(codes),
+            WeatherData.date >= start_date,
+            WeatherData.date <= end_date,
+            WeatherData.hour.in_(hours)
+        ).order_by(WeatherData.region_code, WeatherData.date, WeatherData.hour).all()
+
+        for row in rows:
+            rows_by_key.setdefault((row.region_code, row.date), []).append(row)
+
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+    # 기본 새벽 시간대면 저장된 요약 사용
+    summaries = {}
+    if tuple(hours) == SUMMARY_WINDOWS['dawn']:
+        summaries = load_region_day_summaries(codes, dates, 'dawn')
+
+    weekly_by_region = {}
+    for code in codes:
+        weekly_data = {}
+        for target_date in dates:
+            weather_list = rows_by_key.get((code, target_date), [])
+            weekly_data[target_date] = {
+                'weather_list': weather_list,
+                'summary': _stored_summary(summaries, (code, target_date), weather_list),
+                'day_name': get_day_name(target_date)
+            }
+        weekly_by_region[code] = weekly_data
+
+    return weekly_by_region[region_codes] if single else weekly_by_region
 
 
 def get_day_name(target_date):
@@ -438,7 +908,7 @@ def get_day_name(target_date):
 
 def get_sunrise_sunset(lat, lng, target_date=None):
     """
-    일출/일몰 시간 계산
+    박명/일출/일몰 시간 조회 (solar 표에서 배열 인덱스로 찾음)
 
     Args:
         lat: 위도
@@ -446,35 +916,15 @@ def get_sunrise_sunset(lat, lng, target_date=None):
         target_date: 대상 날짜 (None이면 오늘)
 
     Returns:
-        dict: {sunrise: datetime, sunset: datetime}
+        dict: {sunrise, sunset, civil_dawn, nautical_dawn: datetime (한국 시간, 없는 날은 None)}
     """
-    from suntime import Sun
-    from datetime import date, datetime as dt, timedelta
+    from datetime import date, datetime as dt
 
     if target_date is None:
         target_date = date.today()
 
-    try:
-        # float 변환 보장
-        lat = float(lat)
-        lng = float(lng)
-
-        # date 객체를 datetime 객체로 변환
-        if isinstance(target_date, date) and not isinstance(target_date, dt):
-            target_datetime = dt.combine(target_date, dt.min.time())
-        else:
-            target_datetime = target_date
-
-        sun = Sun(lat, lng)
-        sunrise_utc = sun.get_sunrise_time(target_datetime)
-        sunset_utc = sun.get_sunset_time(target_datetime)
-
-        # 한국 시간으로 변환 (UTC+9)
-        kst_offset = timedelta(hours=9)
-        sunrise_kst = sunrise_utc + kst_offset
-        sunset_kst = sunset_utc + kst_offset
+    # datetime 객체는 날짜만 사용
+    if isinstance(target_date, dt):
+        target_date = target_date.date()
 
-        return {"sunrise": sunrise_kst, "sunset": sunset_kst}
-    except Exception as e:
-        print(f"일출/일몰 계산 오류 (lat={lat}, lng={lng}): {e}")
-        return None
+    return solar_table.events(float(lat), float(lng), target_date)